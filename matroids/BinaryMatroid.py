@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, Iterable, Sequence, TypeVar, Union
+
+from .OracleBackedMatroid import OracleBackedMatroid
+
+from .core.binary import gf2_echelon, gf2_independence_oracle, gf2_rank, gf2_ranks, gf2_reduce
+
+
+T = TypeVar("T")
+
+class BinaryMatroid(OracleBackedMatroid):
+    """The vector matroid M[A] of a 0-1 matrix A over GF(2), whose ground set labels the columns of A.
+    Each column is packed into an integer whose i-th bit is the entry in the i-th row,
+    so that the rank of columns is computed by the elimination with XOR in O(r・|X|) operations on integers
+    instead of a scan of a family. Only the matrix is stored, and the families are enumerated when they are requested.
+    """
+    def __init__(self, matrix: Sequence[Sequence[int]], labels: Union[Sequence[T], None]=None):
+        """
+        Args:
+            matrix (Sequence[Sequence[int]]): A 0-1 matrix given as a list of rows.
+            labels (Union[Sequence[T], None], optional): The labels of the columns. Defaults to 1, 2, ..., n.
+
+        Raises:
+            ValueError: if the rows have different lengths, an entry is neither 0 nor 1,
+                        or the labels are not distinct or do not match the columns.
+        """
+        # A matrix without rows has the columns of the labels, all of which are loops.
+        n = len(matrix[0]) if matrix else len(labels or [])
+        if any(len(row) != n for row in matrix):
+            raise ValueError("All the rows of the matrix must have the same length!")
+        if any(x not in {0, 1} for row in matrix for x in row):
+            raise ValueError("The entries of a binary matrix must be 0 or 1!")
+        labels = [*range(1, n + 1)] if labels is None else [*labels]
+        if len(labels) != n or len(set(labels)) != n:
+            raise ValueError("The labels must be distinct and as many as the columns!")
+        self.__matrix = [ [*row] for row in matrix ]
+        self.__labels = labels
+        # columns[e] = Σ_i A[i][e] 2^i
+        self.__columns = { e: sum(row[j] << i for i, row in enumerate(matrix)) for j, e in enumerate(labels) }
+
+    def __repr__(self) -> str:
+        return f"Binary matroid of rank {self.rank()} on {self.size} elements"
+
+    @property
+    def matrix(self) -> list[list[int]]:
+        return [ [*row] for row in self.__matrix ]
+
+    @property
+    def labels(self) -> list[T]:
+        return [*self.__labels]
+
+    @cached_property
+    def ground_set(self) -> set[T]:
+        return set(self.__labels)
+
+    @cached_property
+    def __columns_by_bit(self) -> list[int]:
+        return [ self.__columns[e] for e in self.encoder.elements ]
+
+    @cached_property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        return gf2_independence_oracle(self.__columns_by_bit)
+
+    @cached_property
+    def rank_function(self) -> Callable[[set[T]], int]:
+        columns = self.__columns
+        return lambda X: gf2_rank(columns[e] for e in X)
+
+    @cached_property
+    def closure_function(self) -> Callable[[set[T]], set[T]]:
+        columns = self.__columns
+        # cl(X) = { e ∈ E : the column of e is spanned by the columns of X }
+        def closure(X: set[T]) -> set[T]:
+            pivots = gf2_echelon(columns[e] for e in X)
+            return { e for e, v in columns.items() if not gf2_reduce(v, pivots) }
+        return closure
+
+    def ranks(self, subsets: Iterable[set[T]]) -> list[int]:
+        """Calculate the ranks of many subsets at once, where the eliminations of their common lowest elements are shared.
+
+        Args:
+            subsets (Iterable[set[T]]): Subsets of the ground set.
+
+        Returns:
+            list[int]: The rank of each subset in the given order.
+        """
+        return gf2_ranks(self.__columns_by_bit, map(self.encoder.encode, subsets))
+
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        # The matrix itself, whose columns are reordered as self.encoder.elements.
+        if certificate:
+            position = { e: j for j, e in enumerate(self.__labels) }
+            return (True, [ [ row[position[e]] for e in self.encoder.elements ] for row in self.__matrix ])
+        return True
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, TypeVar, Union
+
+from .Matroid import Matroid
+from .OracleBackedMatroid import OracleBackedMatroid
+
+from matroids.construct import closure_function
+
+from .core.bitset import BitEncoder, popcount
+from .core.enumeration import greedy_mask
+
+
+T = TypeVar("T")
+
+class DualView(OracleBackedMatroid):
+    """The dual M* of a matroid M, which holds no family of its own but answers through M.
+    The rank is r*(X) = |X| - r(M) + r(E - X), and the families are the complements of those of M,
+    e.g. Bs* = { E - B : B ∈ Bs } and Cs* = { E - H : H ∈ Hs }, mapped only when they are requested.
+    It shares the encoder and the memo of ranks with M, and M.dual.dual is M.
+    """
+    def __init__(self, matroid: Matroid):
+        """
+        Args:
+            matroid (Matroid): The primal matroid M.
+        """
+        self.__primal = matroid
+
+    def __repr__(self) -> str:
+        return f"Dual of {self.__primal!r}"
+
+    @property
+    def primal(self) -> Matroid:
+        return self.__primal
+
+    @property
+    def dual(self) -> Matroid:
+        return self.__primal
+
+    @property
+    def ground_set(self) -> set[T]:
+        return self.__primal.ground_set
+
+    @property
+    def encoder(self) -> BitEncoder:
+        return self.__primal.encoder
+
+    def __complements(self, family: list[set[T]]) -> list[set[T]]:
+        E = self.ground_set
+        return [ E - X for X in family ]
+
+    @cached_property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        # X is independent in M* ⇔ E - X is spanning in M.
+        is_independent = self.__primal.independence_oracle
+        E = self.encoder.full
+        r = popcount(greedy_mask(0, E, is_independent))
+        return lambda X: popcount(greedy_mask(0, E & ~X, is_independent)) == r
+
+    def is_independent(self, X: set[T]) -> bool:
+        return self.__primal.rank(self.ground_set - X) == self.__primal.rank()
+
+    # ----------------------------------------------------------------------------------------- #
+    #                        Axiomatic Properties mapped from the primal                        #
+    # ----------------------------------------------------------------------------------------- #
+    @cached_property
+    def bases(self) -> list[set[T]]:
+        # Bs* = { E - B : B ∈ Bs }
+        return self.__complements(self.__primal.bases)
+
+    @cached_property
+    def circuits(self) -> list[set[T]]:
+        # Cs* = { E - H : H ∈ Hs }
+        return self.__complements(self.__primal.hyperplanes)
+
+    @cached_property
+    def rank_function(self) -> Callable[[set[T]], int]:
+        M, E = self.__primal, self.ground_set
+        # r*(X) = |X| - r(M) + r(E - X)
+        return lambda X: len(X) - M.rank() + M.rank(E - X)
+
+    @cached_property
+    def nulity_function(self) -> Callable[[set[T]], int]:
+        M, E = self.__primal, self.ground_set
+        # n*(X) = |X| - r*(X) = r(M) - r(E - X)
+        return lambda X: M.rank() - M.rank(E - X)
+
+    @cached_property
+    def closure_function(self) -> Callable[[set[T]], set[T]]:
+        return closure_function.from_rank_matroid((self.ground_set, self.rank_function))
+
+    @cached_property
+    def hyperplanes(self) -> list[set[T]]:
+        # Hs* = { E - C : C ∈ Cs }
+        return self.__complements(self.__primal.circuits)
+
+    @cached_property
+    def spanning_sets(self) -> list[set[T]]:
+        # Ss* = { E - I : I ∈ Is }
+        return self.__complements(self.__primal.independent_sets)
+
+    # ----------------------------------------------------------------------------------------- #
+    #                          Dual Properties answered by the primal                           #
+    # ----------------------------------------------------------------------------------------- #
+    @property
+    def coindependent_sets(self) -> list[set[T]]:
+        return self.__primal.independent_sets
+
+    @property
+    def codependent_sets(self) -> list[set[T]]:
+        return self.__primal.dependent_sets
+
+    @property
+    def cobases(self) -> list[set[T]]:
+        return self.__primal.bases
+
+    @property
+    def cocircuits(self) -> list[set[T]]:
+        return self.__primal.circuits
+
+    @property
+    def corank_function(self) -> Callable[[set[T]], int]:
+        return self.__primal.rank_function
+
+    @property
+    def coclosure_function(self) -> Callable[[set[T]], set[T]]:
+        return self.__primal.closure_function
+
+    @property
+    def coflats(self) -> list[set[T]]:
+        return self.__primal.flats
+
+    @property
+    def coopen_sets(self) -> list[set[T]]:
+        return self.__primal.open_sets
+
+    @property
+    def cohyperplanes(self) -> list[set[T]]:
+        return self.__primal.hyperplanes
+
+    @property
+    def cospanning_sets(self) -> list[set[T]]:
+        return self.__primal.spanning_sets
+
+    def corank(self, subset: Union[set[T], None]=None) -> int:
+        return self.__primal.rank(subset)
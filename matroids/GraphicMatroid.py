@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Any, Callable, Hashable, Sequence, TypeVar, Union
+
+from .OracleBackedMatroid import OracleBackedMatroid
+
+from .core.bitset import iter_bits
+from .core.finite_field import FiniteField
+from .core.graph import UnionFind, count_spanning_forests, forest_rank, incidence_matrix, iter_cycle_masks
+
+
+T = TypeVar("T")
+Edge = tuple[Hashable, Hashable]
+
+class GraphicMatroid(OracleBackedMatroid):
+    """The cycle matroid M(G) of a graph G, whose ground set labels the edges of G.
+    A set of edges is independent if it has no cycle, which is tested by a union-find of the vertices,
+    and the rank is r(X) = |V(X)| - #components of the subgraph X. Only the graph is stored,
+    and the deletion and the contraction are done on the graph. Loops and parallel edges are allowed.
+    """
+    def __init__(self, edges: Union[dict[T, Edge], Sequence[Edge]]):
+        """
+        Args:
+            edges (Union[dict[T, Edge], Sequence[Edge]]): The pairs of end vertices of the edges, given with their labels,
+                                                         or as a sequence whose edges are labelled 1, 2, ..., m.
+
+        Raises:
+            ValueError: if an edge is not a pair of vertices.
+        """
+        if not isinstance(edges, dict):
+            edges = { i + 1: ends for i, ends in enumerate(edges) }
+        if any(len(tuple(ends)) != 2 for ends in edges.values()):
+            raise ValueError("Each edge must be a pair of vertices!")
+        self.__edges = { e: tuple(ends) for e, ends in edges.items() }
+
+    def __repr__(self) -> str:
+        return f"Graphic matroid of rank {self.rank()} on {self.size} elements"
+
+    @property
+    def edges(self) -> dict[T, Edge]:
+        return dict(self.__edges)
+
+    @property
+    def vertices(self) -> set[Hashable]:
+        return { x for ends in self.__edges.values() for x in ends }
+
+    @cached_property
+    def ground_set(self) -> set[T]:
+        return set(self.__edges)
+
+    @cached_property
+    def __ends_by_bit(self) -> list[Edge]:
+        return [ self.__edges[e] for e in self.encoder.elements ]
+
+    @cached_property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        ends = self.__ends_by_bit
+        # X is a forest ⇔ every edge of X joins two components of the edges before it.
+        def is_forest(X: int) -> bool:
+            components = UnionFind()
+            return all(components.union(*ends[b.bit_length() - 1]) for b in iter_bits(X))
+        return is_forest
+
+    @cached_property
+    def rank_function(self) -> Callable[[set[T]], int]:
+        edges = self.__edges
+        return lambda X: forest_rank(edges[e] for e in X)
+
+    @cached_property
+    def closure_function(self) -> Callable[[set[T]], set[T]]:
+        edges = self.__edges
+        # cl(X) = { e ∈ E : both ends of e are in the same component of X }
+        def closure(X: set[T]) -> set[T]:
+            components = UnionFind()
+            for e in X:
+                components.union(*edges[e])
+            return { e for e, (u, v) in edges.items() if components.find(u) == components.find(v) }
+        return closure
+
+    @cached_property
+    def circuits(self) -> list[set[T]]:
+        # The cycles, which are enumerated on the graph instead of by the circuit elimination.
+        return [*map(self.encoder.decode, iter_cycle_masks(self.__ends_by_bit))]
+
+    def count_bases(self) -> int:
+        # The number of spanning forests by the matrix-tree theorem.
+        return count_spanning_forests(self.__ends_by_bit)
+
+    def count_circuits(self) -> int:
+        return sum(1 for _ in iter_cycle_masks(self.__ends_by_bit))
+
+    # ----------------------------------------------------------------------------------------- #
+    #                                Operations on the graph                                    #
+    # ----------------------------------------------------------------------------------------- #
+    def __subset(self, X: Union[set[T], T]) -> set[T]:
+        X = X if isinstance(X, set) else {X}
+        if not X <= self.ground_set:
+            raise ValueError("The given set must be a subset of the ground set!")
+        return X
+
+    def restrict_to(self, X: Union[set[T], T]) -> GraphicMatroid:
+        # M(G)|X = M(G[X]), the subgraph with the edges of X.
+        X = self.__subset(X)
+        return GraphicMatroid({ e: ends for e, ends in self.__edges.items() if e in X })
+
+    def delete(self, X: Union[set[T], T]) -> GraphicMatroid:
+        # M(G) \ X = M(G \ X)
+        X = self.__subset(X)
+        return GraphicMatroid({ e: ends for e, ends in self.__edges.items() if e not in X })
+
+    def contract(self, X: Union[set[T], T]) -> GraphicMatroid:
+        # M(G) / X = M(G / X), where the ends of each edge of X are identified.
+        X = self.__subset(X)
+        components = UnionFind()
+        for e in X:
+            components.union(*self.__edges[e])
+        return GraphicMatroid({ e: (components.find(u), components.find(v)) for e, (u, v) in self.__edges.items() if e not in X })
+
+    # ----------------------------------------------------------------------------------------- #
+    #                                     Representations                                       #
+    # ----------------------------------------------------------------------------------------- #
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        if certificate:
+            return (True, self.representation_over(2))
+        return True
+
+    def is_representable_over(self, q: int, certificate: bool=False, time_budget: Union[float, None]=None) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        # A graphic matroid is regular, and so it is representable over every field.
+        matrix = self.representation_over(q, time_budget)
+        if certificate:
+            return (True, matrix)
+        return True
+
+    def representation_over(self, q: int, time_budget: Union[float, None]=None) -> list[list[Any]]:
+        # The oriented incidence matrix, whose columns correspond to self.encoder.elements.
+        field = FiniteField(q)
+        return incidence_matrix(self.__ends_by_bit, 1, field.neg(1))
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, Sequence, TypeVar, Union
+
+from .Matroid import Matroid
+from .OracleBackedMatroid import OracleBackedMatroid
+
+from .core.bitset import iter_bits, popcount
+from .core.laminar import LaminarTree
+
+
+T = TypeVar("T")
+
+class LaminarMatroid(OracleBackedMatroid):
+    """The laminar matroid of a laminar family A_1, A_2, ..., A_m with capacities c_1, c_2, ..., c_m,
+    whose independent sets are the subsets X with |X ∩ A_i| ≦ c_i for all i. Elements in no A_i are free.
+    The rank is counted bottom-up over the tree of the family in O(|X| + m) time,
+    and the number of bases is found from the generating polynomials of the independent sets of the subtrees.
+    """
+    def __init__(self, laminar_family: Sequence[set[T]], capacities: Sequence[int], ground_set: Union[set[T], None]=None):
+        """
+        Args:
+            laminar_family (Sequence[set[T]]): The sets A_1, A_2, ..., A_m, any two of which are disjoint or nested.
+            capacities (Sequence[int]): The capacities c_1, c_2, ..., c_m.
+            ground_set (Union[set[T], None], optional): The ground set. Defaults to the union of the sets.
+
+        Raises:
+            ValueError: if the family is not laminar, the capacities are not as many as the sets or negative,
+                        or a set of the family is not included in the given ground set.
+        """
+        family = [ set(A) for A in laminar_family ]
+        union = set().union(*family)
+        if ground_set is not None and not union <= ground_set:
+            raise ValueError("Every set of the family must be a subset of the ground set!")
+        self.__tree = LaminarTree(family, capacities)
+        self.__family = family
+        self.__capacities = [*capacities]
+        self.__ground_set = union if ground_set is None else set(ground_set)
+
+    def __repr__(self) -> str:
+        return f"Laminar matroid of rank {self.rank()} on {self.size} elements"
+
+    @property
+    def laminar_family(self) -> list[set[T]]:
+        return [ set(A) for A in self.__family ]
+
+    @property
+    def capacities(self) -> list[int]:
+        return [*self.__capacities]
+
+    @property
+    def ground_set(self) -> set[T]:
+        return self.__ground_set
+
+    @cached_property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        tree = self.__tree
+        nodes = [ tree.node_of(e) for e in self.encoder.elements ]
+        return lambda X: tree.rank(nodes[b.bit_length() - 1] for b in iter_bits(X)) == popcount(X)
+
+    @cached_property
+    def rank_function(self) -> Callable[[set[T]], int]:
+        tree = self.__tree
+        return lambda X: tree.rank(map(tree.node_of, X))
+
+    @cached_property
+    def closure_function(self) -> Callable[[set[T]], set[T]]:
+        tree = self.__tree
+        # e ∈ cl(X) - X ⇔ a set containing e is full under X.
+        def closure(X: set[T]) -> set[T]:
+            saturated = tree.saturated(map(tree.node_of, X))
+            return X | { e for e in self.__ground_set if tree.node_of(e) is not None and saturated[tree.node_of(e)] }
+        return closure
+
+    def count_bases(self) -> int:
+        free = sum(1 for e in self.__ground_set if self.__tree.node_of(e) is None)
+        return self.__tree.independent_counts(free)[-1]
+
+    def direct_sum(self, matroid: Matroid) -> Matroid:
+        # The direct sum of laminar matroids is the laminar matroid of the union of the families.
+        if not isinstance(matroid, LaminarMatroid):
+            return super().direct_sum(matroid)
+        if not self.ground_set.isdisjoint(matroid.ground_set):
+            raise ValueError("The ground sets of two matroids must be disjoint!!")
+        return LaminarMatroid(self.laminar_family + matroid.laminar_family, self.capacities + matroid.capacities, self.ground_set | matroid.ground_set)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Any, Callable, Sequence, TypeVar, Union
+
+from .OracleBackedMatroid import OracleBackedMatroid
+
+from .core.bitset import popcount
+from .core.finite_field import FiniteField
+from .core.linear import Field, PrefixEchelon
+from .core.rational import RationalField
+
+
+T = TypeVar("T")
+
+class LinearMatroid(OracleBackedMatroid):
+    """The vector matroid M[A] of a matrix A over a field, whose ground set labels the columns of A.
+    The field is GF(q) for a prime power q, where the arithmetic is looked up in tables,
+    or the rationals, where the elimination is fraction-free on integer vectors.
+    The rank is answered by an echelon form of the columns which is reused while a subset grows one element at a time,
+    so that the rank, the closure and the test of bases need no family.
+    """
+    def __init__(self, matrix: Sequence[Sequence[Any]], field: Union[int, Field, None]=None, labels: Union[Sequence[T], None]=None):
+        """
+        Args:
+            matrix (Sequence[Sequence[Any]]): A matrix given as a list of rows.
+            field (Union[int, Field, None], optional): The order q of GF(q), a field, or None for the rationals. Defaults to None.
+            labels (Union[Sequence[T], None], optional): The labels of the columns. Defaults to 1, 2, ..., n.
+
+        Raises:
+            ValueError: if q is not a prime power, the rows have different lengths, an entry is not an element of the field,
+                        or the labels are not distinct or do not match the columns.
+        """
+        if field is None:
+            field = RationalField()
+        elif isinstance(field, int):
+            field = FiniteField(field)
+        # A matrix without rows has the columns of the labels, all of which are loops.
+        n = len(matrix[0]) if matrix else len(labels or [])
+        if any(len(row) != n for row in matrix):
+            raise ValueError("All the rows of the matrix must have the same length!")
+        labels = [*range(1, n + 1)] if labels is None else [*labels]
+        if len(labels) != n or len(set(labels)) != n:
+            raise ValueError("The labels must be distinct and as many as the columns!")
+        self.__field = field
+        self.__matrix = [ [ field.element(x) for x in row ] for row in matrix ]
+        self.__labels = labels
+        self.__columns = { e: tuple(row[j] for row in self.__matrix) for j, e in enumerate(labels) }
+
+    def __repr__(self) -> str:
+        return f"Linear matroid of rank {self.rank()} on {self.size} elements over {self.__field!r}"
+
+    @property
+    def field(self) -> Field:
+        return self.__field
+
+    @property
+    def matrix(self) -> list[list[Any]]:
+        return [ [*row] for row in self.__matrix ]
+
+    @property
+    def labels(self) -> list[T]:
+        return [*self.__labels]
+
+    @cached_property
+    def ground_set(self) -> set[T]:
+        return set(self.__labels)
+
+    @cached_property
+    def __echelon(self) -> PrefixEchelon:
+        return PrefixEchelon(self.__field, [ self.__columns[e] for e in self.encoder.elements ])
+
+    @cached_property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        echelon = self.__echelon
+        return lambda X: echelon.rank(X) == popcount(X)
+
+    @cached_property
+    def rank_function(self) -> Callable[[set[T]], int]:
+        echelon, encode = self.__echelon, self.encoder.encode
+        return lambda X: echelon.rank(encode(X))
+
+    @cached_property
+    def closure_function(self) -> Callable[[set[T]], set[T]]:
+        echelon, encode, columns = self.__echelon, self.encoder.encode, self.__columns
+        # cl(X) = { e ∈ E : the column of e is spanned by the columns of X }
+        def closure(X: set[T]) -> set[T]:
+            mask = encode(X)
+            return { e for e, v in columns.items() if echelon.spans(mask, v) }
+        return closure
+
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        # Over GF(2), the matrix itself, whose columns are reordered as self.encoder.elements.
+        if isinstance(self.__field, FiniteField) and self.__field.order == 2:
+            if certificate:
+                return (True, [ [ self.__columns[e][i] for e in self.encoder.elements ] for i in range(len(self.__matrix)) ])
+            return True
+        return super().is_binary(certificate)
@@ -1,13 +1,29 @@
 from __future__ import annotations
 
-from itertools import combinations, permutations
+from itertools import combinations, islice, permutations
 from functools import cached_property
 from math import inf
-from typing import Any, Callable, TypeVar, Union
+from typing import Any, Callable, Iterator, TypeVar, Union
 
 from matroids.MatroidMetaClass import MatroidMetaClass
+from matroids.core.binary import binary_representation_columns
+from matroids.core.bitset import BitEncoder, BitFamily, iter_bits, popcount
+from matroids.core.cache import OracleCache
+from matroids.core.enumeration import (
+    greedy_mask,
+    iter_independent_masks,
+    iter_basis_masks,
+    iter_circuit_masks,
+    iter_flat_masks,
+    circuit_masks_by_elimination,
+)
 from matroids.core.exception import MatroidAxiomError
-from matroids.core.set_operator import powset, revlex_sort_key
+from matroids.core.finite_field import FiniteField
+from matroids.core.lattice import FlatLattice
+from matroids.core.minor import find_minor_masks
+from matroids.core.oracle import oracle_fundamental_circuit
+from matroids.core.representation import representation_matrix
+from matroids.core.set_operator import find_maximal_sets, powset, revlex_sort_key
 from matroids.core.types import MatroidAxiom
 
 from matroids.core.checker import (
@@ -27,26 +43,35 @@ from matroids.construct import (
     independent_sets,
     dependent_sets,
     bases,
-    circuits,
     rank_function,
     nulity_function,
     closure_function,
-    flats,
-    open_sets,
-    hyperplanes,
     spanning_sets,
 )
 
 T = TypeVar('T')
 
+_FAMILY_NAMES = {
+    MatroidAxiom.INDEPENDENT_SETS: "independent_sets",
+    MatroidAxiom.DEPENDENT_SETS  : "dependent_sets",
+    MatroidAxiom.BASES           : "bases",
+    MatroidAxiom.CIRCUITS        : "circuits",
+    MatroidAxiom.FLATS           : "flats",
+    MatroidAxiom.OPEN_SETS       : "open_sets",
+    MatroidAxiom.HYPERPLANES     : "hyperplanes",
+    MatroidAxiom.SPANNING_SETS   : "spanning_sets",
+}
+
 class Matroid(object, metaclass=MatroidMetaClass):
     __axiom = MatroidAxiom.BASES
+    __oracle_cache = None
     def __init__(self, matroid: tuple[set[T],list[set[T]]], axiom: MatroidAxiom=MatroidAxiom.BASES, axiom_check: bool=True):
         """!!!!! - Caution - !!!!!
         It is not recommended to use this Matroid class directly.
 
         Args:
-            matroid (tuple[set[T], list[set[T]]]): The pair of a ground set and bases
+            matroid (tuple[set[T], list[set[T]]]): The pair of a ground set and bases.
+                                                   The family may also be given as a BitFamily encoded on the ground set.
             axiom (MatroidAxiom): A matroid axiom for constructing a matroid.
             axiom_check (bool, optional): If this is False, the check of axom will be skipped, and so recommended to be True.
                                           Defaults to True.
@@ -55,6 +80,8 @@ class Matroid(object, metaclass=MatroidMetaClass):
             MatroidAxiomError: If the given pair is not a matroid.
         """
         if axiom_check:
+            if isinstance(matroid[1], BitFamily):
+                matroid = (matroid[0], matroid[1].to_list())
             if not any([
                 axiom is MatroidAxiom.INDEPENDENT_SETS and satisfies_independent_axiom(matroid),
                 axiom is MatroidAxiom.DEPENDENT_SETS and satisfies_dependent_axiom(matroid),
@@ -72,6 +99,9 @@ class Matroid(object, metaclass=MatroidMetaClass):
         self.__first = matroid[0]
         self.__second = matroid[1]
         self.__axiom = axiom
+        if isinstance(self.__second, BitFamily):
+            self.encoder = self.__second.encoder
+            self.__encoded_families[_FAMILY_NAMES[axiom]] = self.__second
     
     def __repr__(self) -> str:
         """Return a string representation of the matroid.
@@ -109,7 +139,6 @@ class Matroid(object, metaclass=MatroidMetaClass):
     
     def __sub__(self, X: Union[set[T], T]) -> Matroid:
         """Delete a given set X from the matroid.
-        For faster calculation and saving memory, the circuits are used in this operation.
 
         Args:
             X (Union[set[T], T]): A subset or an element of the ground set of the matroid.
@@ -138,7 +167,6 @@ class Matroid(object, metaclass=MatroidMetaClass):
 
     def __truediv__(self, X: Union[set[T], T]) -> Matroid:
         """Contract a given set X from the matroid.
-        For faster calculation and saving memory, the circuits are used in this operation.
 
         Args:
             X (Union[set[T], T]): A subset or an element of the ground set of the matroid.
@@ -192,75 +220,355 @@ class Matroid(object, metaclass=MatroidMetaClass):
     def axiom(self) -> MatroidAxiom:
         return self.__axiom
 
+    # ----------------------------------------------------------------------------------------- #
+    #                                  Bitmask Representation                                   #
+    # ----------------------------------------------------------------------------------------- #
+    @cached_property
+    def encoder(self) -> BitEncoder:
+        """Return the encoder mapping each element of the ground set to a bit position.
+
+        Returns:
+            BitEncoder: The encoder of the ground set.
+        """
+        return BitEncoder(self.ground_set)
+
+    @cached_property
+    def __encoded_families(self) -> dict[str, BitFamily]:
+        return {}
+
+    @cached_property
+    def __family(self) -> Union[list[set[T]], Callable]:
+        # The given family is decoded into sets only when it is requested for the first time.
+        if isinstance(self.__second, BitFamily):
+            return self.__second.to_list()
+        return self.__second
+
+    def bitmask_family(self, name: str) -> BitFamily:
+        """Return a family of the matroid such as "bases" or "circuits" encoded as bitmasks on self.encoder.
+        The encoded family is built once and cached, and then membership, subset tests and intersections
+        can be done by integer operations.
+
+        Args:
+            name (str): The name of a family, e.g. "bases", "circuits", "independent_sets" or "cocircuits".
+
+        Returns:
+            BitFamily: The bitmask-encoded family.
+        """
+        encoded_families = self.__encoded_families
+        if name not in encoded_families:
+            family = getattr(self, name)
+            if isinstance(family, BitFamily) and family.encoder is self.encoder:
+                encoded_families[name] = family
+            else:
+                encoded_families[name] = self.encoder.encode_family(family)
+        return encoded_families[name]
+
+    # ----------------------------------------------------------------------------------------- #
+    #                                      Oracle Cache                                         #
+    # ----------------------------------------------------------------------------------------- #
+    @property
+    def oracle_cache(self) -> Union[OracleCache, None]:
+        """Return the memo of ranks and closures if it is enabled by cache_oracles, None otherwise.
+
+        Returns:
+            Union[OracleCache, None]: The memo of ranks and closures.
+        """
+        return self.__oracle_cache
+
+    def cache_oracles(self, maxsize: Union[int, None]=1024) -> Matroid:
+        """Memoize the rank, the nulity and the closure of subsets queried through rank, nulity and closure.
+        Each memo is keyed by the bitmask of a subset and keeps at most maxsize entries with LRU eviction.
+
+        Args:
+            maxsize (Union[int, None], optional): The maximum number of entries in each memo. None means unbounded. Defaults to 1024.
+
+        Returns:
+            Matroid: The matroid itself.
+        """
+        self.__oracle_cache = OracleCache(self.encoder, self.rank_function, self.closure_function, maxsize)
+        return self
+
+    def uncache_oracles(self) -> None:
+        """Disable the memo enabled by cache_oracles."""
+        self.__oracle_cache = None
+
+    # ----------------------------------------------------------------------------------------- #
+    #                                  Streaming Enumeration                                    #
+    # ----------------------------------------------------------------------------------------- #
+    @cached_property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        """Return an independence test on bitmasks of self.encoder, which drives the streaming enumerations.
+        It uses the family at hand; the independent sets or the bases if they are given or already built,
+        the rank if the matroid is given by a function, and the circuits otherwise.
+
+        Returns:
+            Callable[[int], bool]: A function returning True if a given bitmask encodes an independent set.
+        """
+        is_independent = self.__independence_test()
+        if is_independent is not None:
+            return is_independent
+        Cs = self.bitmask_family("circuits").masks
+        # X ∈ Is ⇔ C ⊈ X for all C ∈ Cs
+        return lambda X: all(C & ~X for C in Cs)
+
+    def __independence_test(self, by_bases: bool=False) -> Union[Callable[[int], bool], None]:
+        # An independence test from the family at hand, or from the bases if by_bases is True. None if neither is available.
+        cached = self.__dict__
+        if self.axiom is MatroidAxiom.INDEPENDENT_SETS or "independent_sets" in cached:
+            Is = self.bitmask_family("independent_sets").index
+            return lambda X: X in Is
+        by_functions = self.axiom in {MatroidAxiom.RANK_FUNCTION, MatroidAxiom.NULITY_FUNCTION, MatroidAxiom.CLOSURE_FUNCTION}
+        if "bases" in cached or (self.axiom is MatroidAxiom.BASES and "_Matroid__second" in cached) or (by_bases and not by_functions):
+            Bs = self.bitmask_family("bases").masks
+            # X ∈ Is ⇔ X ⊆ B for some B ∈ Bs
+            return lambda X: any(not X & ~B for B in Bs)
+        if by_functions:
+            decode = self.encoder.decode
+            return lambda X: self.is_independent(decode(X))
+        return None
+
+    def __stream(self, masks: Iterator[int]) -> Iterator[set[T]]:
+        decode = self.encoder.decode
+        return map(decode, masks)
+
+    def iter_independent_sets(self) -> Iterator[set[T]]:
+        """Enumerate the independent sets one by one in a deterministic order without building the whole family.
+
+        Yields:
+            set[T]: Each independent set of the matroid.
+        """
+        E = self.encoder.encode(self.ground_set)
+        return self.__stream(iter_independent_masks(E, self.independence_oracle))
+
+    def iter_bases(self) -> Iterator[set[T]]:
+        """Enumerate the bases one by one in a deterministic order without building the whole family.
+        Every branch of the search reaches a basis, so the first basis is found with O(r|E|^2) independence tests.
+
+        Yields:
+            set[T]: Each basis of the matroid.
+        """
+        E = self.encoder.encode(self.ground_set)
+        return self.__stream(iter_basis_masks(E, self.independence_oracle))
+
+    def iter_circuits(self) -> Iterator[set[T]]:
+        """Enumerate the circuits one by one in a deterministic order without building the whole family.
+
+        Yields:
+            set[T]: Each circuit of the matroid.
+        """
+        E = self.encoder.encode(self.ground_set)
+        return self.__stream(iter_circuit_masks(E, self.independence_oracle))
+
+    def iter_flats(self, rank: Union[int, None]=None) -> Iterator[set[T]]:
+        """Enumerate the flats one by one in a deterministic order without building the whole family.
+
+        Args:
+            rank (Union[int, None], optional): If it is given, only the flats of this rank are enumerated. Defaults to None.
+
+        Yields:
+            set[T]: Each flat of the matroid.
+        """
+        E = self.encoder.encode(self.ground_set)
+        return self.__stream(iter_flat_masks(E, self.independence_oracle, rank))
+
+    def iter_hyperplanes(self) -> Iterator[set[T]]:
+        """Enumerate the hyperplanes, the flats of rank r(M) - 1, one by one in a deterministic order.
+
+        Yields:
+            set[T]: Each hyperplane of the matroid.
+        """
+        E = self.encoder.encode(self.ground_set)
+        r = popcount(greedy_mask(0, E, self.independence_oracle))
+        if r == 0:
+            return iter(())
+        return self.iter_flats(r - 1)
+
+    # ----------------------------------------------------------------------------------------- #
+    #                                        Counting                                           #
+    # ----------------------------------------------------------------------------------------- #
+    def __count(self, name: str, masks: Callable[[], Iterator[int]]) -> int:
+        # A family which is given or already built is just measured, and otherwise it is counted while it is streamed.
+        if name in self.__dict__ or (name == _FAMILY_NAMES.get(self.axiom) and "_Matroid__second" in self.__dict__):
+            return len(getattr(self, name))
+        return sum(1 for _ in masks())
+
+    def count_bases(self) -> int:
+        """Count the bases without holding the whole family.
+
+        Returns:
+            int: The number of bases.
+        """
+        E = self.encoder.encode(self.ground_set)
+        return self.__count("bases", lambda: iter_basis_masks(E, self.independence_oracle))
+
+    def count_circuits(self) -> int:
+        """Count the circuits without holding the whole family.
+
+        Returns:
+            int: The number of circuits.
+        """
+        E = self.encoder.encode(self.ground_set)
+        return self.__count("circuits", lambda: iter_circuit_masks(E, self.independence_oracle))
+
+    def count_flats(self, rank: Union[int, None]=None) -> int:
+        """Count the flats of a given rank, or all the flats if no rank is given, without holding the whole family.
+
+        Args:
+            rank (Union[int, None], optional): The rank of the flats to be counted. Defaults to None.
+
+        Returns:
+            int: The number of flats of the given rank.
+        """
+        E = self.encoder.encode(self.ground_set)
+        masks = lambda: iter_flat_masks(E, self.independence_oracle, rank)
+        if rank is None:
+            return self.__count("flats", masks)
+        return sum(1 for _ in masks())
+
+    def f_vector(self) -> list[int]:
+        """Count the independent sets of each size while they are streamed.
+        The i-th entry is the number of independent sets of size i, for i = 0, 1, ..., r(M).
+
+        Returns:
+            list[int]: The f-vector of the independence complex of the matroid.
+        """
+        E = self.encoder.encode(self.ground_set)
+        f = [0] * (popcount(E) + 1)
+        for I in iter_independent_masks(E, self.independence_oracle):
+            f[popcount(I)] += 1
+        while len(f) > 1 and not f[-1]:
+            f.pop()
+        return f
+
+    # ----------------------------------------------------------------------------------------- #
+    #                                    Lattice of Flats                                       #
+    # ----------------------------------------------------------------------------------------- #
+    @cached_property
+    def flat_lattice(self) -> FlatLattice:
+        """Build the lattice of flats once, with the flats as bitmasks grouped by rank and their cover relations.
+        The flats, the hyperplanes and the open sets are derived from it, and the closure is answered by it once it is built.
+
+        Returns:
+            FlatLattice: The lattice of flats of the matroid.
+        """
+        E = self.encoder.full
+        if self.axiom is MatroidAxiom.FLATS and "_Matroid__second" in self.__dict__:
+            Fs = self.bitmask_family("flats").masks
+            # cl(X) = ∩{ F ∈ Fs : X ⊆ F }
+            def cl(X: int) -> int:
+                closure = E
+                for F in Fs:
+                    if not X & ~F:
+                        closure &= F
+                return closure
+        else:
+            is_independent = self.independence_oracle
+            # cl(X) = X ∪ { x ∈ E - X : B ∪ {x} is dependent } for a basis B of X.
+            def cl(X: int) -> int:
+                B = greedy_mask(0, X, is_independent)
+                return X | sum(x for x in iter_bits(E & ~X) if not is_independent(B | x))
+        return FlatLattice(self.encoder, cl)
+
+    def whitney_numbers_of_the_first_kind(self) -> list[int]:
+        """Calculate the Whitney numbers of the first kind w_k = Σ_{r(F) = k} μ(cl(∅), F) for k = 0, 1, ..., r(M).
+
+        Returns:
+            list[int]: The Whitney numbers of the first kind.
+        """
+        return self.flat_lattice.whitney_numbers_of_the_first_kind()
+
+    def whitney_numbers_of_the_second_kind(self) -> list[int]:
+        """Calculate the Whitney numbers of the second kind W_k, the number of flats of rank k, for k = 0, 1, ..., r(M).
+
+        Returns:
+            list[int]: The Whitney numbers of the second kind.
+        """
+        return self.flat_lattice.whitney_numbers_of_the_second_kind()
+
+    def characteristic_polynomial(self) -> list[int]:
+        """Calculate the coefficients of the characteristic polynomial χ(λ) = Σ_{F ∈ Fs} μ(∅, F) λ^{r(M) - r(F)}.
+        The i-th entry is the coefficient of λ^{r(M) - i}. If the matroid has a loop, χ(λ) = 0.
+
+        Returns:
+            list[int]: The coefficients of the characteristic polynomial from the leading one.
+        """
+        lattice = self.flat_lattice
+        if lattice.bottom:
+            return [0] * (lattice.rank + 1)
+        return lattice.whitney_numbers_of_the_first_kind()
+
+
     # ----------------------------------------------------------------------------------------- #
     #                                Axiomatic Properties                                       #
     # ----------------------------------------------------------------------------------------- #
     @cached_property
     def independent_sets(self) -> list[set[T]]:
         if self.axiom is MatroidAxiom.INDEPENDENT_SETS:
-            return self.__second
+            return self.__family
         return independent_sets.from_bases_matroid((self.ground_set, self.bases))
 
     @cached_property
     def dependent_sets(self) -> list[set[T]]:
         if self.axiom is MatroidAxiom.DEPENDENT_SETS:
-            return self.__second
+            return self.__family
         return dependent_sets.from_bases_matroid((self.ground_set, self.independent_sets))
 
     @cached_property
     def bases(self) -> list[set[T]]:
         if self.axiom is MatroidAxiom.BASES:
-            return self.__second
+            return self.__family
         if self.axiom is MatroidAxiom.INDEPENDENT_SETS:
-            return bases.from_independent_matroid((self.__first, self.__second))
+            return bases.from_independent_matroid((self.__first, self.__family))
         if self.axiom is MatroidAxiom.DEPENDENT_SETS:
-            return bases.from_dependent_matroid((self.__first, self.__second))
+            return bases.from_dependent_matroid((self.__first, self.__family))
         if self.axiom is MatroidAxiom.CIRCUITS:
-            return bases.from_circuits_matroid((self.__first, self.__second))
+            return bases.from_circuits_matroid((self.__first, self.__family))
         if self.axiom is MatroidAxiom.RANK_FUNCTION:
-            return bases.from_rank_matroid((self.__first, self.__second))
+            return bases.from_rank_matroid((self.__first, self.__family))
         if self.axiom is MatroidAxiom.NULITY_FUNCTION:
-            return bases.from_nulity_matroid((self.__first, self.__second))
+            return bases.from_nulity_matroid((self.__first, self.__family))
         if self.axiom is MatroidAxiom.CLOSURE_FUNCTION:
-            return bases.from_closure_matroid((self.__first, self.__second))
+            return bases.from_closure_matroid((self.__first, self.__family))
         if self.axiom is MatroidAxiom.FLATS:
-            return bases.from_flats_matroid((self.__first, self.__second))
+            return bases.from_flats_matroid((self.__first, self.__family))
         if self.axiom is MatroidAxiom.OPEN_SETS:
-            return bases.from_open_matroid((self.__first, self.__second))
+            return bases.from_open_matroid((self.__first, self.__family))
         if self.axiom is MatroidAxiom.HYPERPLANES:
-            return bases.from_hyperplanes_matroid((self.__first, self.__second))
+            return bases.from_hyperplanes_matroid((self.__first, self.__family))
         if self.axiom is MatroidAxiom.SPANNING_SETS:
-            return bases.from_spanning_matroid((self.__first, self.__second))
+            return bases.from_spanning_matroid((self.__first, self.__family))
         
     @cached_property
     def circuits(self) -> list[set[T]]:
         if self.axiom is MatroidAxiom.CIRCUITS:
-            return self.__second
-        return circuits.from_bases_matroid((self.ground_set, self.independent_sets))
+            return self.__family
+        # The fundamental circuits of a basis are closed under the circuit elimination.
+        is_independent = self.__independence_test(by_bases=True)
+        return [*self.__stream(circuit_masks_by_elimination(self.encoder.full, is_independent))]
 
     @cached_property
     def rank_function(self) -> Callable[[set[T]], int]:
         if self.axiom is MatroidAxiom.RANK_FUNCTION:
-            return self.__second
-        return rank_function.from_bases_matroid((self.ground_set, self.independent_sets))
+            return self.__family
+        return rank_function.from_independent_matroid((self.ground_set, self.independent_sets))
     
     @cached_property
     def nulity_function(self) -> Callable[[set[T]], int]:
         if self.axiom is MatroidAxiom.NULITY_FUNCTION:
-            return self.__second
-        return nulity_function.from_bases_matroid((self.ground_set, self.independent_sets))
+            return self.__family
+        return nulity_function.from_independent_matroid((self.ground_set, self.independent_sets))
     
     @cached_property
     def closure_function(self) -> Callable[[set[T]], set[T]]:
         if self.axiom is MatroidAxiom.CLOSURE_FUNCTION:
-            return self.__second
-        return closure_function.from_bases_matroid((self.ground_set, self.independent_sets))
+            return self.__family
+        return closure_function.from_independent_matroid((self.ground_set, self.independent_sets))
 
     @cached_property
     def flats(self) -> list[set[T]]:
         if self.axiom is MatroidAxiom.FLATS:
-            return self.__second
-        return flats.from_bases_matroid((self.ground_set, self.independent_sets))
+            return self.__family
+        return [*self.flat_lattice]
     
     @property
     def closed_sets(self) -> list[set[T]]:
@@ -269,19 +577,20 @@ class Matroid(object, metaclass=MatroidMetaClass):
     @cached_property
     def open_sets(self) -> list[set[T]]:
         if self.axiom is MatroidAxiom.OPEN_SETS:
-            return self.__second
-        return open_sets.from_bases_matroid((self.ground_set, self.independent_sets))
+            return self.__family
+        # Os = { E - F : F ∈ Fs }
+        return [ self.ground_set - F for F in self.flat_lattice ]
     
     @cached_property
     def hyperplanes(self) -> list[set[T]]:
         if self.axiom is MatroidAxiom.HYPERPLANES:
-            return self.__second
-        return hyperplanes.from_bases_matroid((self.ground_set, self.independent_sets))
+            return self.__family
+        return [*map(self.encoder.decode, self.flat_lattice.hyperplanes())]
     
     @cached_property
     def spanning_sets(self) -> list[set[T]]:
         if self.axiom is MatroidAxiom.SPANNING_SETS:
-            return self.__second
+            return self.__family
         return spanning_sets.from_bases_matroid((self.ground_set, self.independent_sets))
 
     # ----------------------------------------------------------------------------------------- #
@@ -298,9 +607,31 @@ class Matroid(object, metaclass=MatroidMetaClass):
             int: The rank of a given subset in the matroid.
         """
         X = subset if subset is not None else self.ground_set
-        r = self.rank_function
+        r = self.rank_function if self.__oracle_cache is None else self.__oracle_cache.rank_function
         return r(X)
+
+    def nulity(self, subset: Union[set[T], None]=None) -> int:
+        """Calculate the nulity of a given subset. If no subset is given, returns the nulity of the matroid.
+
+        Args:
+            subset (Union[set[T], None], optional): A subset of the ground set of the matroid. Defaults to self.ground_set.
+
+        Returns:
+            int: The nulity of a given subset in the matroid.
+        """
+        X = subset if subset is not None else self.ground_set
+        n = self.nulity_function if self.__oracle_cache is None else self.__oracle_cache.nulity_function
+        return n(X)
     
+    def basis(self) -> set[T]:
+        """Find a basis of the matroid greedily with |E| independence tests.
+
+        Returns:
+            set[T]: A basis of the matroid.
+        """
+        E = self.encoder.encode(self.ground_set)
+        return self.encoder.decode(greedy_mask(0, E, self.independence_oracle))
+
     def closure(self, subset: set[T]) -> set[T]:
         """Find the closure of a given subset.
 
@@ -310,6 +641,11 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             set[T]: The closure of a given subset.
         """
+        if self.__oracle_cache is not None:
+            return self.__oracle_cache.closure_function(subset)
+        if "flat_lattice" in self.__dict__:
+            # The smallest flat containing the subset is found by climbing the covers.
+            return self.encoder.decode(self.flat_lattice.closure(self.encoder.encode(subset)))
         return self.closure_function(subset)
     
     def girth(self, subset: Union[set[T], None]=None) -> Union[int, float]:
@@ -323,9 +659,9 @@ class Matroid(object, metaclass=MatroidMetaClass):
             Union[int, float]: The girth of the matroid restricted to a given subset.
         """
         X = subset if subset is not None else self.ground_set
-        Cs_X = [C for C in self.circuits if C <= X]
+        Cs_X = self.bitmask_family("circuits").subsets_of(X)
         if Cs_X:
-            return min(map(len, Cs_X))
+            return min(map(popcount, Cs_X))
         else:
             return inf
         
@@ -359,10 +695,10 @@ class Matroid(object, metaclass=MatroidMetaClass):
         """
         if e not in (self.E - B):
             raise ValueError("The element e needs to be in E - B!!")
-        if B not in self.bases:
+        if not self.is_basis(B):
             raise ValueError("The set B needs to be a basis!!")
-        C_ = [C for C in self.circuits if C <= B | {e} ]
-        return C_[0]
+        # C(e, B) = {e} ∪ { b ∈ B : (B - {b}) ∪ {e} is independent }
+        return oracle_fundamental_circuit(e, B, self.is_independent)
     
     def fundamental_circuits_with_respect_to(self, B: set[T]) -> list[set[T]]:
         """Find the fundamental circuits with respect to B.
@@ -377,7 +713,7 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             list[set[T]]: The fundamental circuits with respect to B.
         """
-        Cs_ = [self.fundamental_circuit(e, B) for e in (self.ground_set - B)]
+        Cs_ = self.encoder.encode_family(self.fundamental_circuit(e, B) for e in (self.ground_set - B))
         return [C for C in self.circuits if C in Cs_]
     
     def is_loop(self, e: T) -> bool:
@@ -401,7 +737,7 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             bool: True if given elements f and g are parallel, False otherwise.
         """
-        return ({f, g} in self.circuits) or (f == g)
+        return ({f, g} in self.bitmask_family("circuits")) or (f == g)
     
     @property
     def loops(self) -> set[T]:
@@ -421,12 +757,12 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             list[set[T]]: The set of all the parallel classes of the matroid.
         """
-        if set() in self.bases:
+        if set() in self.bitmask_family("bases"):
             return []
         E = self.ground_set
         parallels = [{g for g in E if self.are_parallel(f,g) and (not self.is_loop(g))} for f in E if not self.is_loop(f)]
         parallel_sets = [*map(set, list({*map(tuple, parallels)}))] # Remove redundants
-        return [pc for pc in parallel_sets if all(map(lambda ps: not pc < ps, parallel_sets))]
+        return find_maximal_sets(parallel_sets)
     
     @property
     def parallel_classes_are_trivial(self) -> bool:
@@ -498,14 +834,54 @@ class Matroid(object, metaclass=MatroidMetaClass):
 
         if len(Nbs1) != len(Nbs2):
             return None
+        Nbs2 = {*map(frozenset, Nbs2)}
         
         for perms in permutations(E2, matroid.size):
             morphism = dict(zip(E1, perms))
-            transformed = [*map(lambda Nb: {*map(lambda e: morphism[e], Nb)} ,map(list, Nbs1))]
+            transformed = map(lambda Nb: frozenset(map(lambda e: morphism[e], Nb)), Nbs1)
             if all(Nb in Nbs2 for Nb in transformed):
                 return morphism
         return None
     
+    def has_minor(self, matroid: Matroid, certificate: bool=False) -> Union[bool, tuple[bool, Union[tuple[set[T], set[T], dict[T, Any]], None]]]:
+        """Check whether the matroid has a minor isomorphic to a given one.
+        Every minor is M / C \\ D for an independent set C and a coindependent set D of the right sizes, so only such pairs are searched.
+
+        Args:
+            matroid (Matroid): A matroid N.
+            certificate (bool, optional): If this is True, also returns (C, D, f), where f is an isomorphism from M / C \\ D to N. Defaults to False.
+
+        Returns:
+            Union[bool, tuple[bool, Union[tuple[set[T], set[T], dict[T, Any]], None]]]: True if the matroid has a minor isomorphic to N, False otherwise.
+                                                                                    If certificate is True, also returns (C, D, f) or None.
+        """
+        found = self.minor_isomorphic_to(matroid)
+        if certificate:
+            return (found is not None, found)
+        return found is not None
+
+    def minor_isomorphic_to(self, matroid: Matroid) -> Union[tuple[set[T], set[T], dict[T, Any]], None]:
+        """Find a minor M / C \\ D isomorphic to a given matroid N.
+        The search runs over the bitmasks of the bases, pruned by the rank, the corank, the number of bases and the girth.
+
+        Args:
+            matroid (Matroid): A matroid N.
+
+        Returns:
+            Union[tuple[set[T], set[T], dict[T, Any]], None]: The sets C and D, and an isomorphism from M / C \\ D to N as a dictionary,
+                                                             or None if there is no such minor.
+        """
+        if matroid.size > self.size or matroid.rank() > self.rank():
+            return None
+        Bs, Ns = self.bitmask_family("bases"), matroid.bitmask_family("bases")
+        found = find_minor_masks(Bs.masks, self.encoder.full, Ns.masks, matroid.encoder.full)
+        if found is None:
+            return None
+        C, D, isomorphism = found
+        decode, decode_N = self.encoder.decode, matroid.encoder.decode
+        f = { next(iter(decode(x))): next(iter(decode_N(y))) for x, y in isomorphism.items() }
+        return decode(C), decode(D), f
+
     def is_equal_to(self, matroid: Matroid) -> bool:
         """Check whether the matroid and a given one are equal.
 
@@ -522,22 +898,23 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Nbs2 = matroid.nonbases
         if len(Nbs1) != len(Nbs2):
             return False
-        return all(map(lambda Nb: Nb in Nbs2, Nbs1))
+        Nbs2 = {*map(frozenset, Nbs2)}
+        return all(map(lambda Nb: frozenset(Nb) in Nbs2, Nbs1))
     
     # ----------------------------------------------------------------------------------------------- #
     #                                           Duality                                               #
     # ----------------------------------------------------------------------------------------------- #
 
-    @property
+    @cached_property
     def dual(self) ->  Matroid:
-        """Construct the dual matroid. By default, it is given as BaseMatroid.
+        """Construct the dual matroid as a view answering through the matroid, so that no family is copied.
+        It is built once, and M.dual.dual is M.
 
         Returns:
             Matroid: The dual of the matroid.
         """
-        # Bs* = { E - B : B ∈ Bs }
-        Bs_ast = [ self.E - B for B in self.bases ]
-        return Matroid((self.E, Bs_ast), axiom_check=False)
+        from matroids.DualView import DualView
+        return DualView(self)
 
     @cached_property
     def coindependent_sets(self) -> list[set[T]]:
@@ -667,9 +1044,9 @@ class Matroid(object, metaclass=MatroidMetaClass):
             Union[int, float]: The cogirth of the matroid restricted to a given subset. 
         """
         X = subset if subset is not None else self.ground_set
-        Cs_ast_X = [C_ast for C_ast in self.cocircuits if C_ast <= X]
+        Cs_ast_X = self.bitmask_family("cocircuits").subsets_of(X)
         if Cs_ast_X:
-            return min(map(len, Cs_ast_X))
+            return min(map(popcount, Cs_ast_X))
         else:
             return inf
     
@@ -691,7 +1068,7 @@ class Matroid(object, metaclass=MatroidMetaClass):
         """
         if e not in B:
             raise ValueError("The element e needs to be in B!!")
-        if B not in self.bases:
+        if not self.is_basis(B):
             raise ValueError("The set B needs to be a basis!!")
         return self.dual.fundamental_circuit(e, self.ground_set - B)
     
@@ -708,7 +1085,7 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             list[set[T]]: The fundamental circuits with respect to B.
         """
-        Cs_ = [self.fundamental_cocircuit(e, B) for e in B]
+        Cs_ = self.encoder.encode_family(self.fundamental_cocircuit(e, B) for e in B)
         return [C for C in self.cocircuits if C in Cs_]
     
     def is_coloop(self, e: T) -> bool:
@@ -732,7 +1109,7 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             bool: True if given elements f and g are coparallel, False otherwise.
         """
-        return ({f, g} in self.cocircuits) or (f == g)
+        return ({f, g} in self.bitmask_family("cocircuits")) or (f == g)
     
     @property
     def coloops(self) -> set[T]:
@@ -752,7 +1129,7 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             list[set[T]]: The set of all the coparallel classes of the matroid.
         """
-        if set() in self.cobases:
+        if set() in self.bitmask_family("cobases"):
             return []
         E = self.ground_set
         coparallels = [{g for g in E if self.are_parallel(f,g) and (not self.is_coloop(g))} for f in E if not self.is_coloop(f)]
@@ -786,7 +1163,7 @@ class Matroid(object, metaclass=MatroidMetaClass):
 
     def restrict_to(self, X: Union[set[T], T]) -> Matroid:
         """Restrict the matroid to X.
-        For faster calculation and saving memory, the circuits are used in this operation.
+        The restriction is a view answering through the rank of the matroid, and no family is built until it is requested.
 
         Args:
             X (Union[set[T], T]): A subset of the ground set of the matroid.
@@ -797,19 +1174,19 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             Matroid: The restriction of the matroid to X
         """
+        from matroids.Minor import Minor
         E = self.ground_set
         if isinstance(X, set):
             if not X <= E:
                 raise ValueError("The set for the restriction must be a subset of the ground set!")
-            # Cs|X = { C ⊆ X : C ∈ Cs }
-            CsX = [C for C in self.circuits if C <= X]
-            return Matroid((X, CsX), axiom=MatroidAxiom.CIRCUITS, axiom_check=False)
+            # M|X = M \ (E - X)
+            return Minor(self, deleted=E - X)
         
         return self.restrict_to({X})
 
     def delete(self, X: Union[set[T], T]) -> Matroid:
         """Delete a given set X from the matroid.
-        For faster calculation and saving memory, the circuits are used in this operation.
+        The deletion is a view answering through the rank of the matroid, and no family is built until it is requested.
 
         Args:
             X (Union[set[T], T]): A subset of the ground set of the matroid.
@@ -820,14 +1197,15 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             Matroid: The deletion of X from the matroid
         """
+        from matroids.Minor import Minor
         if isinstance(X, set):
-            return self | (self.ground_set - X)
+            return Minor(self, deleted=X)
 
-        return self | (self.ground_set - {X})
+        return Minor(self, deleted={X})
     
     def contract(self, X: Union[set[T], T]) -> Matroid:
         """Contract a given set X from the matroid.
-        For faster calculation and saving memory, the circuits are used in this operation.
+        The contraction is a view with the rank r(Y) = r_M(Y ∪ X) - r_M(X), and no family is built until it is requested.
 
         Args:
             X (Union[set[T], T]): A subset of the ground set of the matroid.
@@ -838,10 +1216,11 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             Matroid: The contraction of X from the matroid
         """
+        from matroids.Minor import Minor
         if isinstance(X, set):
-            return (self.dual - X).dual
+            return Minor(self, contracted=X)
 
-        return (self.dual - {X}).dual
+        return Minor(self, contracted={X})
 
     def simplification(self) -> Matroid:
         """Construct a simple matroid associated with the matroid.
@@ -917,8 +1296,8 @@ class Matroid(object, metaclass=MatroidMetaClass):
         E = E1 | E2
         # Bs = { B ⊆ E1 ⊔ E2 : |B| = r(M1) + r(M2), B ∩ E1 ∈ Is1, B ∩ E2 ∈ Ss2 }
         size = self.rank() + matroid.rank()
-        Is1 = self.independent_sets
-        Ss2 = matroid.spanning_sets
+        Is1 = self.bitmask_family("independent_sets")
+        Ss2 = matroid.bitmask_family("spanning_sets")
         Bs = [B for B in map(set, combinations(E, size)) if (B & E1 in Is1) and (B & E2 in Ss2)]
         return Matroid((E, Bs))
 
@@ -933,7 +1312,8 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             bool: True when the matroid is free, False otherwise.
         """
-        return not self.dependent_sets
+        # There is no dependent set if and only if the ground set itself is independent.
+        return len(self.basis()) == self.size
     
     @property
     def is_trivial(self) -> bool:
@@ -942,7 +1322,7 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             bool: True when the matroid is trivial, False otherwise.
         """
-        return len(self.bases) == 1
+        return sum(1 for _ in islice(self.iter_bases(), 2)) == 1
     
     @property
     def is_empty(self) -> bool:
@@ -1001,6 +1381,98 @@ class Matroid(object, metaclass=MatroidMetaClass):
         """
         return self.is_equal_to(self.dual)
     
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        """Check whether the matroid is binary, that is, representable over GF(2).
+
+        Args:
+            certificate (bool, optional): If this is True, also returns a representing matrix. Defaults to False.
+
+        Returns:
+            Union[bool, tuple[bool, Union[list[list[int]], None]]]: True if the matroid is binary, False otherwise.
+                                                              If certificate is True, also returns the matrix of binary_representation.
+        """
+        matrix = self.binary_representation()
+        if certificate:
+            return (matrix is not None, matrix)
+        return matrix is not None
+
+    def binary_representation(self) -> Union[list[list[int]], None]:
+        """Find a matrix over GF(2) representing the matroid.
+        It is the fundamental circuit matrix [I | A] of a basis B, where the column of e ∉ B is the incidence of C(e, B) - {e},
+        and the matroid is binary if and only if M[I | A] has the same bases.
+        The columns are packed into integers, so that the independence over GF(2) is tested by XOR.
+        [Warning] This is not polynomial in the size of the ground set: every basis is built by bitmask_family("bases")
+        and tested in M[I | A], and the bases of M[I | A] are counted up to |Bs| + 1, so it takes Θ(|Bs|) tests,
+        which is up to C(n, r). It is meant for small matroids, not for the large ones in the catalog.
+
+        Returns:
+            Union[list[list[int]], None]: The 0-1 matrix whose columns correspond to self.encoder.elements, or None if the matroid is not binary.
+        """
+        # The bases are compared as a family, since enumerating them through a membership oracle costs |Bs| per test.
+        Bs = self.bitmask_family("bases").masks
+        columns = binary_representation_columns(self.encoder.full, self.independence_oracle, Bs)
+        if columns is None:
+            return None
+        return [ [ column >> i & 1 for column in columns ] for i in range(popcount(Bs[0])) ]
+
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        """Check whether the matroid is ternary, that is, representable over GF(3).
+
+        Args:
+            certificate (bool, optional): If this is True, also returns a representing matrix. Defaults to False.
+
+        Returns:
+            Union[bool, tuple[bool, Union[list[list[int]], None]]]: True if the matroid is ternary, False otherwise.
+                                                              If certificate is True, also returns the matrix of representation_over(3).
+        """
+        return self.is_representable_over(3, certificate)
+
+    def is_representable_over(self, q: int, certificate: bool=False, time_budget: Union[float, None]=None) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        """Check whether the matroid is representable over the finite field GF(q).
+
+        Args:
+            q (int): The order of the field, which must be a prime power.
+            certificate (bool, optional): If this is True, also returns a representing matrix. Defaults to False.
+            time_budget (Union[float, None], optional): The limit of seconds for the search. Defaults to None, i.e. no limit.
+
+        Raises:
+            ValueError: if q is not a prime power.
+            TimeoutError: if the search takes more than time_budget seconds.
+
+        Returns:
+            Union[bool, tuple[bool, Union[list[list[int]], None]]]: True if the matroid is representable over GF(q), False otherwise.
+                                                              If certificate is True, also returns the matrix of representation_over.
+        """
+        matrix = self.representation_over(q, time_budget)
+        if certificate:
+            return (matrix is not None, matrix)
+        return matrix is not None
+
+    def representation_over(self, q: int, time_budget: Union[float, None]=None) -> Union[list[list[int]], None]:
+        """Find a matrix over GF(q) representing the matroid.
+        It is of the form [I | A] for a basis B, where the support of A is given by the fundamental circuits,
+        and the entries on a spanning forest of the support are normalized to 1 before the others are searched.
+        The elements of GF(q) are the integers 0, 1, ..., q - 1 as in FiniteField.
+        [Warning] This is not polynomial in the size of the ground set: every basis is built by bitmask_family("bases"),
+        and a constraint is made for every pair of R ⊆ B and S ⊆ E - B with |R| = |S|, i.e. for all the C(n, r) r-subsets,
+        before the backtracking search, which is exponential in the number of entries in the worst case.
+        It is meant for small matroids, and time_budget bounds the search on the larger ones.
+
+        Args:
+            q (int): The order of the field, which must be a prime power.
+            time_budget (Union[float, None], optional): The limit of seconds for the search. Defaults to None, i.e. no limit.
+
+        Raises:
+            ValueError: if q is not a prime power.
+            TimeoutError: if the search takes more than time_budget seconds.
+
+        Returns:
+            Union[list[list[int]], None]: The matrix whose columns correspond to self.encoder.elements, or None if the matroid is not representable over GF(q).
+        """
+        field = FiniteField(q)
+        Bs = self.bitmask_family("bases").masks
+        return representation_matrix(self.encoder.full, self.independence_oracle, field, Bs, time_budget)
+
     # ----------------------------------------------------------------------------------------------- #
     #                                          Utilities                                              #
     # ----------------------------------------------------------------------------------------------- #
@@ -1070,7 +1542,9 @@ class Matroid(object, metaclass=MatroidMetaClass):
         Returns:
             str: Encoded matroid with respect to bases.
         """
-        encoded = "".join(basis_symbol if set(X) in self.bases else non_basis_symbol for X in sorted(combinations(self.ground_set, self.rank()), key=revlex_sort_key))
+        Bs = self.bitmask_family("bases")
+        encode = self.encoder.encode
+        encoded = "".join(basis_symbol if encode(X) in Bs else non_basis_symbol for X in sorted(combinations(self.ground_set, self.rank()), key=revlex_sort_key))
         if not show_with_order:
             return encoded
         
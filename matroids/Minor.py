@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, TypeVar
+
+from .Matroid import Matroid
+from .OracleBackedMatroid import OracleBackedMatroid
+
+from .core.bitset import iter_bits
+from .core.enumeration import greedy_mask
+
+
+T = TypeVar("T")
+
+class Minor(OracleBackedMatroid):
+    """The minor M / C \\ D of a matroid M, which answers through the rank oracle of M without building any family.
+    The rank is r(X) = r_M(X ∪ C) - r_M(C) on E - C - D, and the families are enumerated only when they are requested.
+    A minor of a minor is collapsed into a single view of the original matroid, e.g. (M / a / b) \\ c = M / {a, b} \\ {c}.
+    """
+    def __init__(self, matroid: Matroid, contracted: set[T]=frozenset(), deleted: set[T]=frozenset()):
+        """
+        Args:
+            matroid (Matroid): A matroid M.
+            contracted (set[T], optional): The set C to be contracted. Defaults to the empty set.
+            deleted (set[T], optional): The set D to be deleted. Defaults to the empty set.
+
+        Raises:
+            ValueError: if C or D is not included in the ground set of M, or C and D are not disjoint.
+        """
+        C, D = set(contracted), set(deleted)
+        if not (C | D) <= matroid.ground_set:
+            raise ValueError("The sets to be contracted and deleted must be subsets of the ground set!")
+        if not C.isdisjoint(D):
+            raise ValueError("The sets to be contracted and deleted must be disjoint!")
+        if isinstance(matroid, Minor):
+            C, D = C | matroid.contracted, D | matroid.deleted
+            matroid = matroid.parent
+        self.__parent = matroid
+        self.__contracted = C
+        self.__deleted = D
+        self.__ground_set = matroid.ground_set - C - D
+
+    def __repr__(self) -> str:
+        return f"Matroid of rank {self.rank()} on {self.size} elements as a minor of {self.__parent!r}"
+
+    @property
+    def parent(self) -> Matroid:
+        return self.__parent
+
+    @property
+    def contracted(self) -> set[T]:
+        return set(self.__contracted)
+
+    @property
+    def deleted(self) -> set[T]:
+        return set(self.__deleted)
+
+    @property
+    def ground_set(self) -> set[T]:
+        return self.__ground_set
+
+    @cached_property
+    def __rank_of_contracted(self) -> int:
+        return self.__parent.rank(self.__contracted)
+
+    @cached_property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        # X is independent in M / C \ D ⇔ X ∪ B_C is independent in M for a basis B_C of C.
+        is_independent = self.__parent.independence_oracle
+        encode = self.__parent.encoder.encode
+        B_C = greedy_mask(0, encode(self.__contracted), is_independent)
+        bits = [ encode({e}) for e in self.encoder.elements ]
+        to_parent = lambda X: sum(bits[b.bit_length() - 1] for b in iter_bits(X))
+        return lambda X: is_independent(to_parent(X) | B_C)
+
+    def is_independent(self, X: set[T]) -> bool:
+        return self.rank(X) == len(X)
+
+    @cached_property
+    def rank_function(self) -> Callable[[set[T]], int]:
+        M, C = self.__parent, self.__contracted
+        # r(X) = r_M(X ∪ C) - r_M(C)
+        return lambda X: M.rank(X | C) - self.__rank_of_contracted
+
+    @cached_property
+    def closure_function(self) -> Callable[[set[T]], set[T]]:
+        M, C, E = self.__parent, self.__contracted, self.__ground_set
+        # cl(X) = cl_M(X ∪ C) - C - D
+        return lambda X: M.closure(X | C) & E
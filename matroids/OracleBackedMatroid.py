@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, TypeVar
+
+from .Matroid import Matroid
+
+from .core.enumeration import circuit_masks_by_elimination
+
+
+T = TypeVar("T")
+
+class OracleBackedMatroid(Matroid):
+    """A matroid which holds no family but answers through its own independence oracle and rank function,
+    e.g. a matroid given by a matrix, a graph or a set system, or a view over another matroid.
+    Subclasses provide the ground set, independence_oracle on the bitmasks of self.encoder and rank_function,
+    and the families below are enumerated by the independence oracle only when they are requested.
+    """
+    @cached_property
+    def independent_sets(self) -> list[set[T]]:
+        return [*self.iter_independent_sets()]
+
+    @cached_property
+    def bases(self) -> list[set[T]]:
+        return [*self.iter_bases()]
+
+    @cached_property
+    def circuits(self) -> list[set[T]]:
+        # The fundamental circuits of a basis are closed under the circuit elimination.
+        return [*map(self.encoder.decode, circuit_masks_by_elimination(self.encoder.full, self.independence_oracle))]
+
+    @cached_property
+    def nulity_function(self) -> Callable[[set[T]], int]:
+        r = self.rank_function
+        return lambda X: len(X) - r(X)
@@ -0,0 +1,86 @@
+from functools import cached_property
+from typing import Callable, TypeVar
+
+from .OracleBackedMatroid import OracleBackedMatroid
+
+from matroids.construct import (
+    dependent_sets,
+    open_sets,
+    spanning_sets,
+)
+
+from .core.oracle import (
+    greedy_rank,
+    oracle_closure,
+    oracle_is_basis,
+)
+
+
+T = TypeVar("T")
+
+class OracleMatroid(OracleBackedMatroid):
+    """A matroid which only has to answer whether a given subset is independent or not.
+    The rank, the closure and the test of bases are computed by greedy algorithms
+    whose number of oracle calls is polynomial in the size of the ground set,
+    and so the power set is enumerated only when a whole family is requested.
+    """
+    def __init__(self, matroid: tuple[set[T], Callable[[set[T]], bool]]):
+        """
+        Args:
+            matroid (tuple[set[T], Callable[[set[T]], bool]]): The pair of a ground set and an independence oracle.
+        """
+        self.__ground_set = matroid[0]
+        self.__is_independent = matroid[1]
+
+    def __repr__(self) -> str:
+        return f"Matroid of rank {self.rank()} on {self.size} elements given by an independence oracle"
+
+    @property
+    def ground_set(self) -> set[T]:
+        return self.__ground_set
+
+    def is_independent(self, X: set[T]) -> bool:
+        return self.__is_independent(X)
+
+    def is_basis(self, X: set[T]) -> bool:
+        return oracle_is_basis(X, self.ground_set, self.is_independent)
+
+    @cached_property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        decode = self.encoder.decode
+        return lambda X: self.__is_independent(decode(X))
+
+    @cached_property
+    def rank_function(self) -> Callable[[set[T]], int]:
+        return lambda X: greedy_rank(X, self.is_independent)
+
+    @cached_property
+    def closure_function(self) -> Callable[[set[T]], set[T]]:
+        return lambda X: oracle_closure(X, self.ground_set, self.is_independent)
+
+    # The families below are built only when they are requested.
+    # The circuits, the flats and the hyperplanes are collected by the streaming enumerations,
+    # while the others need the whole power set.
+    @cached_property
+    def dependent_sets(self) -> list[set[T]]:
+        return dependent_sets.from_rank_matroid((self.ground_set, self.rank_function))
+
+    @cached_property
+    def circuits(self) -> list[set[T]]:
+        return [*self.iter_circuits()]
+
+    @cached_property
+    def flats(self) -> list[set[T]]:
+        return [*self.iter_flats()]
+
+    @cached_property
+    def open_sets(self) -> list[set[T]]:
+        return open_sets.from_rank_matroid((self.ground_set, self.rank_function))
+
+    @cached_property
+    def hyperplanes(self) -> list[set[T]]:
+        return [*self.iter_hyperplanes()]
+
+    @cached_property
+    def spanning_sets(self) -> list[set[T]]:
+        return spanning_sets.from_rank_matroid((self.ground_set, self.rank_function))
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from math import comb
+from typing import Sequence, TypeVar, Union
+
+from .Matroid import Matroid
+from .LaminarMatroid import LaminarMatroid
+
+
+T = TypeVar("T")
+
+class PartitionMatroid(LaminarMatroid):
+    """The partition matroid of disjoint blocks B_1, B_2, ..., B_m with capacities c_1, c_2, ..., c_m,
+    whose independent sets are the subsets X with |X ∩ B_i| ≦ c_i for all i. Elements in no B_i are free.
+    It is the laminar matroid of a family without nesting, and the number of bases is Π_i C(|B_i|, min(c_i, |B_i|)).
+    """
+    def __init__(self, blocks: Sequence[set[T]], capacities: Sequence[int], ground_set: Union[set[T], None]=None):
+        """
+        Args:
+            blocks (Sequence[set[T]]): The disjoint blocks B_1, B_2, ..., B_m.
+            capacities (Sequence[int]): The capacities c_1, c_2, ..., c_m.
+            ground_set (Union[set[T], None], optional): The ground set. Defaults to the union of the blocks.
+
+        Raises:
+            ValueError: if the blocks are not disjoint, the capacities are not as many as the blocks or negative,
+                        or a block is not included in the given ground set.
+        """
+        if sum(map(len, blocks)) != len(set().union(*blocks)):
+            raise ValueError("The blocks of a partition matroid must be disjoint!")
+        super().__init__(blocks, capacities, ground_set)
+
+    def __repr__(self) -> str:
+        return f"Partition matroid of rank {self.rank()} on {self.size} elements"
+
+    @property
+    def blocks(self) -> list[set[T]]:
+        return self.laminar_family
+
+    def count_bases(self) -> int:
+        # |Bs| = Π_i C(|B_i|, min(c_i, |B_i|)), since a basis takes min(c_i, |B_i|) elements of each block and all the free elements.
+        count = 1
+        for B, c in zip(self.blocks, self.capacities):
+            count *= comb(len(B), min(c, len(B)))
+        return count
+
+    def direct_sum(self, matroid: Matroid) -> Matroid:
+        # The direct sum of partition matroids is the partition matroid of the union of the blocks.
+        if not isinstance(matroid, PartitionMatroid):
+            return super().direct_sum(matroid)
+        if not self.ground_set.isdisjoint(matroid.ground_set):
+            raise ValueError("The ground sets of two matroids must be disjoint!!")
+        return PartitionMatroid(self.blocks + matroid.blocks, self.capacities + matroid.capacities, self.ground_set | matroid.ground_set)
+
+    def union(self, matroid: Matroid) -> Matroid:
+        # On the same blocks, X = I_1 ∪ I_2 if and only if |X ∩ B_i| ≦ c_i + c'_i for all i.
+        if not isinstance(matroid, PartitionMatroid) or self.ground_set != matroid.ground_set:
+            return super().union(matroid)
+        capacity_of = { frozenset(B): c for B, c in zip(matroid.blocks, matroid.capacities) }
+        if set(capacity_of) != { frozenset(B) for B in self.blocks }:
+            return super().union(matroid)
+        capacities = [ c + capacity_of[frozenset(B)] for B, c in zip(self.blocks, self.capacities) ]
+        return PartitionMatroid(self.blocks, capacities, self.ground_set)
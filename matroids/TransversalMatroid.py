@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, Sequence, TypeVar, Union
+
+from .OracleBackedMatroid import OracleBackedMatroid
+
+from .core.bitset import popcount
+from .core.matching import IncrementalMatching, augment, maximum_matching
+
+
+T = TypeVar("T")
+
+class TransversalMatroid(OracleBackedMatroid):
+    """The transversal matroid M[A_1, A_2, ..., A_m] of a set system, whose independent sets are the partial transversals,
+    i.e. the subsets X which can be matched to distinct sets A_i with x ∈ A_i for x ∈ X.
+    The rank r(X) is the size of a maximum matching between X and the sets, found by the Hopcroft-Karp algorithm,
+    and the independence oracle extends the matching of the previous query by one augmenting path when X grows by one element.
+    """
+    def __init__(self, family: Sequence[set[T]], ground_set: Union[set[T], None]=None):
+        """
+        Args:
+            family (Sequence[set[T]]): The sets A_1, A_2, ..., A_m, which may be repeated.
+            ground_set (Union[set[T], None], optional): The ground set, whose elements in no A_i are loops. Defaults to the union of the sets.
+
+        Raises:
+            ValueError: if a set of the family is not included in the given ground set.
+        """
+        family = [ set(A) for A in family ]
+        union = set().union(*family)
+        if ground_set is not None and not union <= ground_set:
+            raise ValueError("Every set of the family must be a subset of the ground set!")
+        self.__family = family
+        self.__ground_set = union if ground_set is None else set(ground_set)
+        # The indices of the sets containing each element, i.e. the neighbors in the bipartite graph.
+        self.__sets_of = { e: [ i for i, A in enumerate(family) if e in A ] for e in self.__ground_set }
+
+    def __repr__(self) -> str:
+        return f"Transversal matroid of rank {self.rank()} on {self.size} elements"
+
+    @property
+    def family(self) -> list[set[T]]:
+        return [ set(A) for A in self.__family ]
+
+    @property
+    def ground_set(self) -> set[T]:
+        return self.__ground_set
+
+    @cached_property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        matching = IncrementalMatching([ self.__sets_of[e] for e in self.encoder.elements ])
+        return lambda X: matching.rank(X) == popcount(X)
+
+    @cached_property
+    def rank_function(self) -> Callable[[set[T]], int]:
+        sets_of = self.__sets_of
+        return lambda X: len(maximum_matching(X, sets_of))
+
+    @cached_property
+    def closure_function(self) -> Callable[[set[T]], set[T]]:
+        sets_of = self.__sets_of
+        # e ∈ cl(X) ⇔ a maximum matching of X has no augmenting path from e.
+        def closure(X: set[T]) -> set[T]:
+            mates = maximum_matching(X, sets_of)
+            return X | { e for e in self.__ground_set - X if not augment(e, sets_of, dict(mates)) }
+        return closure
@@ -7,4 +7,14 @@ from matroids.RankMatroid import RankMatroid
 from matroids.ClosureMatroid import ClosureMatroid
 from matroids.OpenMatroid import OpenMatroid
 from matroids.HyperplanesMatroid import HyperplanesMatroid
-from matroids.SpanningMatroid import SpanningMatroid
\ No newline at end of file
+from matroids.SpanningMatroid import SpanningMatroid
+from matroids.OracleBackedMatroid import OracleBackedMatroid
+from matroids.OracleMatroid import OracleMatroid
+from matroids.DualView import DualView
+from matroids.Minor import Minor
+from matroids.BinaryMatroid import BinaryMatroid
+from matroids.LinearMatroid import LinearMatroid
+from matroids.GraphicMatroid import GraphicMatroid
+from matroids.TransversalMatroid import TransversalMatroid
+from matroids.LaminarMatroid import LaminarMatroid
+from matroids.PartitionMatroid import PartitionMatroid
\ No newline at end of file
@@ -1,6 +1,6 @@
 from typing    import Callable, TypeVar
 
-from matroids.core.set_operator import powset
+from matroids.core.set_operator import find_maximal_sets, find_minimal_sets, powset
 
 import matroids.construct.independent_sets as independent_sets
 
@@ -18,7 +18,7 @@ def from_independent_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T
     """
     E, Is = matroid
     # Bs = { B ∈ Is : B ⊈ I, ∀I ∈ Is\{B} }
-    return [B for B in Is if all(map(lambda I: not B < I, Is))]
+    return find_maximal_sets(Is)
 
 
 def from_dependent_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
@@ -138,4 +138,4 @@ def from_spanning_matroid(matroid: tuple[set[T],list[set[T]]]) -> list[set[T]]:
     """
     E, Ss = matroid
     # Bs: The minimal set of Ss.
-    return [B for B in Ss if all(map(lambda S: not S < B, Ss))]
\ No newline at end of file
+    return find_minimal_sets(Ss, allow_emptyset=True)
\ No newline at end of file
@@ -1,6 +1,8 @@
 from typing    import Callable, TypeVar
 
-from matroids.core.set_operator import powset
+from matroids.core.bitset import BitEncoder, popcount
+from matroids.core.enumeration import circuit_masks_by_elimination
+from matroids.core.set_operator import find_minimal_sets
 
 import matroids.construct.dependent_sets as dependent_sets
 
@@ -17,10 +19,10 @@ def from_independent_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T
         list[set[T]]: The circuits of a given matroid.
     """
     E, Is = matroid
-    # Ds = { D ⊆ E : D ∈ Is }
-    Ds = [D for D in powset(E) if D not in Is]
-    # Cs = { C ∈ Ds : D ⊈ C, ∀D ∈ Ds\{C} }
-    return [C for C in Ds if all(map(lambda D: not D < C, Ds))]
+    encoder = BitEncoder(E)
+    Is = encoder.encode_family(Is).index
+    # Cs = { C ∉ Is : C - {c} ∈ Is, ∀c ∈ C }, collected by the circuit elimination.
+    return [ encoder.decode(C) for C in circuit_masks_by_elimination(encoder.full, Is.__contains__) ]
 
 
 def from_dependent_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
@@ -34,7 +36,7 @@ def from_dependent_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]
     """
     E, Ds = matroid
     # Cs = { C ∈ Ds : D ⊈ C, ∀D ∈ Ds\{C} }
-    return [ C for C in Ds if all(map(lambda D: not D < C, Ds)) ]
+    return find_minimal_sets(Ds)
 
 
 def from_bases_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
@@ -60,8 +62,10 @@ def from_rank_matroid(matroid: tuple[set[T], Callable[[set[T]], int]]) -> list[s
         list[set[T]]: The circuits of a given matroid.
     """
     E, r = matroid
-    # Cs = { C ⊆ E : C ≠ ∅ and r(C\{c}) = |C| - 1 = r(C), ∀c ∈ C }
-    return [C for C in powset(E) if (C != set()) and all(map(lambda c: (r(C - {c}) == len(C) - 1) and (len(C) - 1 == r(C)), C))]
+    encoder = BitEncoder(E)
+    # Cs = { C ⊆ E : C ≠ ∅ and r(C\{c}) = |C| - 1 = r(C), ∀c ∈ C }, where X is independent iff r(X) = |X|.
+    is_independent = lambda X: r(encoder.decode(X)) == popcount(X)
+    return [ encoder.decode(C) for C in circuit_masks_by_elimination(encoder.full, is_independent) ]
 
 
 def from_nulity_matroid(matroid: tuple[set[T], Callable[[set[T]], int]]) -> list[set[T]]:
@@ -74,8 +78,10 @@ def from_nulity_matroid(matroid: tuple[set[T], Callable[[set[T]], int]]) -> list
         list[set[T]]: The circuits of a given matroid.
     """
     E, n = matroid
-    # Cs = { C ⊆ E : C ≠ ∅ and n(C\{c}) = 0 and n(C) = 1, ∀c ∈ C }
-    return [C for C in powset(E) if (C != set()) and all(map(lambda c: (n(C - {c}) == 0) and (n(C) == 1), C))]
+    encoder = BitEncoder(E)
+    # Cs = { C ⊆ E : C ≠ ∅ and n(C\{c}) = 0 and n(C) = 1, ∀c ∈ C }, where X is independent iff n(X) = 0.
+    is_independent = lambda X: n(encoder.decode(X)) == 0
+    return [ encoder.decode(C) for C in circuit_masks_by_elimination(encoder.full, is_independent) ]
 
 
 def from_closure_matroid(matroid: tuple[set[T], Callable[[set[T]], set[T]]]) -> list[set[T]]:
@@ -88,10 +94,12 @@ def from_closure_matroid(matroid: tuple[set[T], Callable[[set[T]], set[T]]]) ->
         list[set[T]]: The circuits of a given matroid.
     """
     E, cl = matroid
-    # Ds' = { D ⊆ E : D ≠ ∅ and d ∈ cl(D\{d}), ∀d ∈ D }
-    # Cs: The minimal set of Ds' (Note that all the members in Ds are dependent but Ds' does NOT include all of the dependent sets.)
-    Ds_ = [D_ for D_ in powset(E) if D_ and all(map(lambda d_: d_ in cl(D_ - {d_}), D_))]
-    return [C for C in Ds_ if all(map(lambda D_: not D_ < C, Ds_))]
+    encoder = BitEncoder(E)
+    # X is independent iff x ∉ cl(X\{x}) for all x ∈ X, and Cs is collected by the circuit elimination.
+    def is_independent(X: int) -> bool:
+        X = encoder.decode(X)
+        return all(x not in cl(X - {x}) for x in X)
+    return [ encoder.decode(C) for C in circuit_masks_by_elimination(encoder.full, is_independent) ]
 
 
 def from_flats_matroid(matroid: tuple[set[T],list[set[T]]]) -> list[set[T]]:
@@ -72,7 +72,10 @@ def from_rank_matroid(matroid: tuple[set[T], Callable[[set[T]], int]]) -> Callab
     """
     E, r = matroid
     # cl(X) = { e ∈ E | r(X) = r(X ∪ {e}) }, ∀X ⊆ E
-    return lambda X: {e for e in E if r(X) == r(X | {e})}
+    def cl(X: set[T]) -> set[T]:
+        rX = r(X)
+        return {e for e in E if e in X or rX == r(X | {e})}
+    return cl
 
 
 def from_nulity_matroid(matroid: tuple[set[T], Callable[[set[T]], int]]) -> Callable[[set[T]], set[T]]:
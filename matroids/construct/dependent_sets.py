@@ -1,5 +1,6 @@
 from typing    import Callable, TypeVar
 
+from matroids.core.bitset import BitEncoder
 from matroids.core.set_operator import powset
 
 import matroids.construct.independent_sets as independent_sets
@@ -18,6 +19,7 @@ def from_independent_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T
         list[set[T]]: The dependent sets of a given matroid.
     """
     E, Is = matroid
+    Is = BitEncoder(E).encode_family(Is)
     # Ds = {D ⊆ E : D ∉ Is}
     return [D for D in powset(E) if D not in Is]
 
@@ -1,7 +1,7 @@
-from itertools import combinations_with_replacement
 from typing    import Callable, TypeVar
 
-from matroids.core.set_operator import powset
+from matroids.core.bitset import BitEncoder
+from matroids.core.lattice import flats_by_intersection, hasse_diagram_of_flats
 
 import matroids.construct.closure_function as closure_function
 
@@ -70,9 +70,9 @@ def from_rank_matroid(matroid: tuple[set[T], Callable[[set[T]], int]]) -> list[s
     Returns:
         list[set[T]]: The flats of a given matroid.
     """
-    E, r = matroid
-    # Fs = { F ⊆ E : r(F ∪ {e}) = r(F) + 1, ∀e ∈ E\F }
-    return [ F for F in powset(E) if all(map(lambda e: r(F | {e}) == r(F) + 1, E - F))]
+    E, _ = matroid
+    # Fs = { F ⊆ E : r(F ∪ {e}) = r(F) + 1, ∀e ∈ E\F }, i.e. the sets closed under cl(X) = { e ∈ E : r(X ∪ {e}) = r(X) }.
+    return from_closure_matroid((E, closure_function.from_rank_matroid(matroid)))
 
 
 def from_nulity_matroid(matroid: tuple[set[T], Callable[[set[T]], int]]) -> list[set[T]]:
@@ -84,9 +84,9 @@ def from_nulity_matroid(matroid: tuple[set[T], Callable[[set[T]], int]]) -> list
     Returns:
         list[set[T]]: The flats of a given matroid.
     """
-    E, n = matroid
-    # Fs = { F ⊆ E : n(F ∪ {e}) - n(F) = |F ∪ {e}| - |F| + 1, ∀e ∈ E\F }
-    return [ F for F in powset(E) if all(map(lambda e: n(F | {e}) - n(F) == len(F | {e}) - len(F) - 1, E - F))]
+    E, _ = matroid
+    # Fs = { F ⊆ E : n(F ∪ {e}) - n(F) = |F ∪ {e}| - |F| + 1, ∀e ∈ E\F }, i.e. the sets closed under the closure function.
+    return from_closure_matroid((E, closure_function.from_nulity_matroid(matroid)))
 
 
 def from_closure_matroid(matroid: tuple[set[T], Callable[[set[T]], set[T]]]) -> list[set[T]]:
@@ -99,8 +99,10 @@ def from_closure_matroid(matroid: tuple[set[T], Callable[[set[T]], set[T]]]) ->
         list[set[T]]: The flats of a given matroid.
     """
     E, cl = matroid
-    # Fs = { F ⊆ E | cl(F) = F }
-    return [F for F in powset(E) if cl(F) == F]
+    # Fs = { F ⊆ E | cl(F) = F }, generated from cl(∅) by the covers cl(F ∪ {e}) instead of scanning 2^E.
+    encoder = BitEncoder(E)
+    levels, _ = hasse_diagram_of_flats(encoder.full, lambda X: encoder.encode(cl(encoder.decode(X))))
+    return [ encoder.decode(F) for level in levels for F in level ]
 
 
 def from_open_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
@@ -118,7 +120,7 @@ def from_open_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
 
 
 def from_hyperplanes_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
-    """COnstruct flats from a matroid defined by hyperplanes.
+    """Construct flats from a matroid defined by hyperplanes.
 
     Args:
         matroid (tuple[set[T], list[set[T]]]): A matroid defined by hyperplanes.
@@ -127,18 +129,9 @@ def from_hyperplanes_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T
         list[set[T]]: The flats of a given matroid.
     """
     E, Hs = matroid
-    # Fs is a group generated by Hs under the intersection.
-    Hs.append(E)
-    all_intersection = lambda Xs: [X for X in powset(E) if X in [A & B for A, B in combinations_with_replacement(Xs, 2)]]
-    
-    tmp = all_intersection(Hs)
-    # Repeat unless the set is closed under the intersection.
-    # This loop must be stopped because E is finite, and E includes any intersection.
-    while True:
-        next_tmp = all_intersection(tmp)
-        if len(tmp) == len(next_tmp):
-            return tmp
-        tmp = next_tmp
+    # Fs is the family generated by Hs ∪ {E} under the intersection.
+    encoder = BitEncoder(E)
+    return [ encoder.decode(F) for F in flats_by_intersection(encoder.full, map(encoder.encode, Hs)) ]
 
 
 def from_spanning_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
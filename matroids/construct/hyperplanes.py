@@ -1,6 +1,7 @@
 from typing    import Callable, TypeVar
 
-from matroids.core.set_operator import powset
+from matroids.core.bitset import BitEncoder
+from matroids.core.set_operator import find_maximal_sets, powset
 
 import matroids.construct.bases as bases
 
@@ -46,7 +47,7 @@ def from_bases_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
     # Hs is the maximal set in { H ⊆ E : B ⊈ H, ∀B ∈ Bs }
     set_containing_no_bases = [X for X in powset(E) if all(map(lambda B: not (B <= X), Bs))]
     # Maximalization
-    return [H for H in set_containing_no_bases if all(map(lambda X: not (H < X), set_containing_no_bases))]
+    return find_maximal_sets(set_containing_no_bases)
 
 
 def from_circuits_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
@@ -74,7 +75,7 @@ def from_rank_matroid(matroid: tuple[set[T], Callable[[set[T]],int]]) -> list[se
     E, r = matroid
     # Hs: maximal set of { H ⊆ E : r(H) = r(E) - 1 }
     Hs_ = [ H for H in powset(E) if r(H) == r(E) - 1 ]
-    return [H for H in Hs_ if all(map(lambda H_: not H < H_, Hs_))]
+    return find_maximal_sets(Hs_)
 
 
 def from_nulity_matroid(matroid: tuple[set[T], Callable[[set[T]],int]]) -> list[set[T]]:
@@ -89,7 +90,7 @@ def from_nulity_matroid(matroid: tuple[set[T], Callable[[set[T]],int]]) -> list[
     E, n = matroid
     # Hs: maximal set of { H ⊆ E : n(E) - n(H) = |E| - |H| - 1 }
     Hs_ = [ H for H in powset(E) if n(E) - n(H) == len(E) - len(H) - 1 ]
-    return [H for H in Hs_ if all(map(lambda H_: not H < H_, Hs_))]
+    return find_maximal_sets(Hs_)
 
 
 def from_closure_matroid(matroid: tuple[set[T], Callable[[set[T]],set[T]]]) -> list[set[T]]:
@@ -116,7 +117,7 @@ def from_flats_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
     """
     E, Fs = matroid
     # Hs = { H ∈ Fs\{E} : H ⊈ F, ∀F ∈ Fs\{E} }
-    return [H for H in Fs if ((H != E) and all(map(lambda F: (not H < F) or (F == E), Fs)))]
+    return find_maximal_sets([ F for F in Fs if F != E ])
 
 
 def from_open_matroid(matroid: tuple[set[T], Callable[[set[T]],set[T]]]) -> list[set[T]]:
@@ -142,7 +143,8 @@ def from_spanning_matroid(matroid: tuple[set[T], list[set[T]]]) -> list[set[T]]:
         list[set[T]]: The hyperplanes of a given matroid.
     """
     E, Ss = matroid
+    Ss = BitEncoder(E).encode_family(Ss)
     # Hs is the maximal set of the non-spanning sets { N ⊆ E : N ∉ Ss }
     non_spannings = [N for N in powset(E) if N not in Ss]
     # Maximalization
-    return [H for H in non_spannings if all(map(lambda X: not (H < X), non_spannings))]
\ No newline at end of file
+    return find_maximal_sets(non_spannings)
\ No newline at end of file
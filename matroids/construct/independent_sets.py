@@ -1,5 +1,6 @@
 from typing    import Callable, TypeVar
 
+from matroids.core.bitset import BitEncoder
 from matroids.core.set_operator import powset
 
 import matroids.construct.bases as bases
@@ -19,6 +20,7 @@ def from_dependent_matroid(matroid: tuple[set[T], list[set]]) -> list[set[T]]:
         list[set[T]]: The independent sets of a given matroid.
     """
     E, Ds = matroid
+    Ds = BitEncoder(E).encode_family(Ds)
     return [I for I in powset(E) if I not in Ds]
 
 
@@ -1,5 +1,7 @@
 from typing    import Callable, TypeVar
 
+from matroids.core.bitset import BitEncoder
+from matroids.core.oracle import indexed_greedy_rank
 from matroids.core.set_operator import powset
 from matroids.construct import independent_sets
 
@@ -14,9 +16,10 @@ def from_independent_matroid(matroid: tuple[set[T], list[set[T]]]) -> Callable[[
     Returns:
         Callable[[set[T]], int]: The nulity function of a given matroid.
     """
-    _, Is = matroid
+    E, Is = matroid
+    Is = BitEncoder(E).encode_family(Is)
     # n(X) = |X| - max{|I|: I ∈ Is, I ⊆ X}, ∀X ⊆ E.
-    return lambda X: len(X) - max(map(len, (I for I in Is if I <= X)))
+    return lambda X: len(X) - indexed_greedy_rank(X, Is)
 
 
 def from_dependent_matroid(matroid: tuple[set[T], list[set[T]]]) -> Callable[[set[T]], int]:
@@ -1,5 +1,7 @@
 from typing    import Callable, TypeVar
 
+from matroids.core.bitset import BitEncoder
+from matroids.core.oracle import indexed_greedy_rank
 from matroids.core.set_operator import powset
 
 import matroids.construct.independent_sets as independent_sets
@@ -18,8 +20,9 @@ def from_independent_matroid(matroid: tuple[set[T], list[set[T]]]) -> Callable[[
         Callable[set[T], int]: The rank function of a given matroid.
     """
     E, Is = matroid
-    # r(X) = max{|I|: I ∈ Is, I ⊆ X}, ∀X ⊆ E.
-    return lambda X: max(map(len, (I for I in Is if I <= X)))
+    Is = BitEncoder(E).encode_family(Is)
+    # r(X) = max{|I|: I ∈ Is, I ⊆ X}, ∀X ⊆ E, which is the size of any maximal independent subset of X.
+    return lambda X: indexed_greedy_rank(X, Is)
 
 
 def from_dependent_matroid(matroid: tuple[set[T], list[set[T]]]) -> Callable[[set[T]], int]:
@@ -0,0 +1,146 @@
+from itertools import islice
+from typing import Callable, Iterable, Sequence, Union
+
+from .bitset import iter_bits, popcount
+from .enumeration import greedy_mask, iter_basis_masks
+
+
+def gf2_echelon(vectors: Iterable[int], pivots: Union[dict[int, int], None]=None) -> dict[int, int]:
+    """Reduce vectors over GF(2) packed into integers to an echelon form by the elimination with XOR.
+    Each pivot is kept with its highest bit, which no other pivot has.
+
+    Args:
+        vectors (Iterable[int]): Vectors over GF(2) whose i-th coordinates are the i-th bits.
+        pivots (Union[dict[int, int], None], optional): An echelon form to be extended in place. Defaults to a new one.
+
+    Returns:
+        dict[int, int]: The pivots keyed by their highest bits, which span the same space as the vectors.
+    """
+    pivots = {} if pivots is None else pivots
+    for v in vectors:
+        v = gf2_reduce(v, pivots)
+        if v:
+            pivots[v.bit_length() - 1] = v
+    return pivots
+
+
+def gf2_reduce(v: int, pivots: dict[int, int]) -> int:
+    """Reduce a vector over GF(2) by an echelon form. The result is 0 if and only if v is spanned by the pivots.
+
+    Args:
+        v (int): A vector packed into an integer.
+        pivots (dict[int, int]): An echelon form of gf2_echelon.
+
+    Returns:
+        int: The reduced vector, whose highest bit is not that of any pivot.
+    """
+    while v:
+        top = v.bit_length() - 1
+        if top not in pivots:
+            break
+        v ^= pivots[top]
+    return v
+
+
+def gf2_rank(vectors: Iterable[int]) -> int:
+    """Calculate the rank over GF(2) of vectors packed into integers, by the elimination with XOR.
+
+    Args:
+        vectors (Iterable[int]): Vectors over GF(2) whose i-th coordinates are the i-th bits.
+
+    Returns:
+        int: The rank of the vectors.
+    """
+    return len(gf2_echelon(vectors))
+
+
+def gf2_ranks(columns: Sequence[int], masks: Iterable[int]) -> list[int]:
+    """Calculate the ranks over GF(2) of many subsets of columns at once.
+    The subsets are visited in the lexicographic order of their bits, and the echelon form of the longest common prefix
+    with the previous subset is reused, so that the subsets sharing their lowest elements are reduced only once for them.
+
+    Args:
+        columns (Sequence[int]): The columns packed into integers, where the j-th column represents the j-th bit.
+        masks (Iterable[int]): The bitmasks of the subsets of columns.
+
+    Returns:
+        list[int]: The rank of each subset in the given order.
+    """
+    masks = [*masks]
+    bits_of = [ [ b.bit_length() - 1 for b in iter_bits(X) ] for X in masks ]
+    ranks = [0] * len(masks)
+    # stack[d] is the echelon form of the first d bits of the previous subset.
+    prefix, stack = [], [{}]
+    for k in sorted(range(len(masks)), key=bits_of.__getitem__):
+        bits = bits_of[k]
+        common = 0
+        while common < min(len(prefix), len(bits)) and prefix[common] == bits[common]:
+            common += 1
+        del stack[common + 1:]
+        for j in bits[common:]:
+            stack.append(gf2_echelon([columns[j]], dict(stack[-1])))
+        prefix = bits
+        ranks[k] = len(stack[-1])
+    return ranks
+
+
+def gf2_independence_oracle(columns: list[int]) -> Callable[[int], bool]:
+    """Return the independence oracle of the binary matroid represented by given columns.
+
+    Args:
+        columns (list[int]): The columns packed into integers, where the j-th column represents the j-th bit of the ground set.
+
+    Returns:
+        Callable[[int], bool]: A function returning True if the columns of a given bitmask are linearly independent over GF(2).
+    """
+    return lambda X: gf2_rank(columns[x.bit_length() - 1] for x in iter_bits(X)) == popcount(X)
+
+
+def fundamental_circuit_columns(E: int, B: int, is_independent: Callable[[int], bool]) -> list[int]:
+    """Build the columns of [I | A] for a basis B, where A is the incidence of the fundamental circuits.
+    The i-th row corresponds to the i-th lowest bit of B, and the column of e ∉ B has 1s at the rows of C(e, B) - {e}.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        B (int): The bitmask of a basis.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+
+    Returns:
+        list[int]: The columns packed into integers, one for each bit position of E.
+    """
+    rows = { b: 1 << i for i, b in enumerate(iter_bits(B)) }
+    columns = [0] * E.bit_length()
+    for x in iter_bits(E):
+        if x & B:
+            columns[x.bit_length() - 1] = rows[x]
+        else:
+            # C(x, B) - {x} = { b ∈ B : B - {b} ∪ {x} is independent }
+            columns[x.bit_length() - 1] = sum(rows[b] for b in iter_bits(B) if is_independent(B & ~b | x))
+    return columns
+
+
+def binary_representation_columns(E: int, is_independent: Callable[[int], bool], bases: Union[Iterable[int], None]=None) -> Union[list[int], None]:
+    """Find a representation over GF(2) of the matroid given by an independence oracle.
+    If the matroid is binary, it is represented by the fundamental circuit matrix [I | A] of any basis,
+    since a binary representation is unique up to row operations. Hence the matroid is binary if and only if
+    every basis of it is a basis of M[I | A] and both have the same number of bases.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+        bases (Union[Iterable[int], None], optional): The bitmasks of the bases if they are at hand. Defaults to None, and then they are enumerated by the oracle.
+
+    Returns:
+        Union[list[int], None]: The columns of [I | A] packed into integers, or None if the matroid is not binary.
+    """
+    B = greedy_mask(0, E, is_independent)
+    columns = fundamental_circuit_columns(E, B, is_independent)
+    is_binary_independent = gf2_independence_oracle(columns)
+    count = 0
+    for basis in (iter_basis_masks(E, is_independent) if bases is None else bases):
+        if not is_binary_independent(basis):
+            return None
+        count += 1
+    if count != sum(1 for _ in islice(iter_basis_masks(E, is_binary_independent), count + 1)):
+        return None
+    return columns
@@ -0,0 +1,201 @@
+from typing import Any, Iterable, Iterator, TypeVar, Union
+
+T = TypeVar('T')
+
+
+def popcount(mask: int) -> int:
+    """Count the number of bits set in a given bitmask, that is, the cardinality of the encoded set.
+
+    Args:
+        mask (int): A bitmask.
+
+    Returns:
+        int: The number of bits set in the bitmask.
+    """
+    return bin(mask).count("1")
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Iterate over the single-bit masks contained in a given bitmask from the lowest bit.
+
+    Args:
+        mask (int): A bitmask.
+
+    Yields:
+        int: Each bit of the given bitmask as a bitmask with just one bit.
+    """
+    while mask:
+        bit = mask & -mask
+        yield bit
+        mask ^= bit
+
+
+class BitEncoder(object):
+    """Map the elements of a ground set to bit positions once, so that subsets can be handled as integers.
+    Then X ∪ Y, X ∩ Y, X - Y and X ⊆ Y become the integer operations |, &, & ~ and (X & ~Y) == 0.
+
+    The bit positions follow the sorted order of the elements if they can be sorted,
+    and the iteration order of the ground set otherwise.
+    """
+    def __init__(self, ground_set: Iterable[T]):
+        try:
+            elements = tuple(sorted(ground_set))
+        except TypeError:
+            elements = tuple(ground_set)
+        self.__elements = elements
+        self.__bits = { e: 1 << i for i, e in enumerate(elements) }
+        self.__full = (1 << len(elements)) - 1
+
+    def __repr__(self) -> str:
+        return f"BitEncoder on {len(self.__elements)} elements"
+
+    def __len__(self) -> int:
+        return len(self.__elements)
+
+    @property
+    def elements(self) -> tuple[T, ...]:
+        """Return the elements of the ground set in the order of their bit positions."""
+        return self.__elements
+
+    @property
+    def full(self) -> int:
+        """Return the bitmask of the whole ground set."""
+        return self.__full
+
+    def bit(self, e: T) -> int:
+        """Return the bitmask of a single element. An element out of the ground set is encoded as 0.
+
+        Args:
+            e (T): An element.
+
+        Returns:
+            int: The bitmask with just the bit of e.
+        """
+        return self.__bits.get(e, 0)
+
+    def encode(self, X: Iterable[T]) -> int:
+        """Encode a subset of the ground set as a bitmask. Elements out of the ground set are ignored.
+
+        Args:
+            X (Iterable[T]): A subset of the ground set.
+
+        Returns:
+            int: The bitmask of X.
+        """
+        bits = self.__bits
+        mask = 0
+        for e in X:
+            mask |= bits.get(e, 0)
+        return mask
+
+    def decode(self, mask: int) -> set[T]:
+        """Decode a bitmask into the subset of the ground set.
+
+        Args:
+            mask (int): A bitmask.
+
+        Returns:
+            set[T]: The subset encoded by the given bitmask.
+        """
+        elements = self.__elements
+        X = set()
+        i = 0
+        while mask:
+            if mask & 1:
+                X.add(elements[i])
+            mask >>= 1
+            i += 1
+        return X
+
+    def encode_family(self, family: Iterable[Iterable[T]]) -> "BitFamily":
+        """Encode a family of subsets of the ground set.
+
+        Args:
+            family (Iterable[Iterable[T]]): A family of subsets of the ground set.
+
+        Returns:
+            BitFamily: The bitmask-encoded family.
+        """
+        return BitFamily(self, map(self.encode, family))
+
+
+class BitFamily(object):
+    """An immutable family of subsets of a ground set stored as a sorted tuple and a hash set of bitmasks.
+    Each member is decoded into a set only when it is requested, so the family can be used in place of list[set[T]].
+    """
+    def __init__(self, encoder: BitEncoder, masks: Iterable[int]):
+        self.__encoder = encoder
+        self.__index = frozenset(masks)
+        self.__masks = tuple(sorted(self.__index))
+
+    def __repr__(self) -> str:
+        return f"BitFamily of {len(self)} subsets on {len(self.__encoder)} elements"
+
+    def __len__(self) -> int:
+        return len(self.__masks)
+
+    def __iter__(self) -> Iterator[set[T]]:
+        decode = self.__encoder.decode
+        return (decode(mask) for mask in self.__masks)
+
+    def __contains__(self, X: Union[set[T], int, Any]) -> bool:
+        """Check the membership of a subset in O(|X|) instead of scanning the family.
+
+        Args:
+            X (Union[set[T], int]): A subset of the ground set or its bitmask.
+
+        Returns:
+            bool: True if X is a member of the family, False otherwise.
+        """
+        if isinstance(X, int):
+            return X in self.__index
+        if not all(map(self.__encoder.bit, X)):
+            return False
+        return self.__encoder.encode(X) in self.__index
+
+    @property
+    def encoder(self) -> BitEncoder:
+        return self.__encoder
+
+    @property
+    def masks(self) -> tuple[int, ...]:
+        """Return the bitmasks of the members in increasing order."""
+        return self.__masks
+
+    @property
+    def index(self) -> frozenset[int]:
+        """Return the bitmasks of the members as a hash set."""
+        return self.__index
+
+    def to_list(self) -> list[set[T]]:
+        """Decode all the members of the family.
+
+        Returns:
+            list[set[T]]: The members of the family as sets.
+        """
+        return [*self]
+
+    def subsets_of(self, X: Union[set[T], int]) -> list[int]:
+        """Find the bitmasks of all the members included in a given subset.
+
+        Args:
+            X (Union[set[T], int]): A subset of the ground set or its bitmask.
+
+        Returns:
+            list[int]: The bitmasks of the members Y such that Y ⊆ X.
+        """
+        mask = X if isinstance(X, int) else self.__encoder.encode(X)
+        outside = ~mask
+        return [Y for Y in self.__masks if not Y & outside]
+
+    def supersets_of(self, X: Union[set[T], int]) -> list[int]:
+        """Find the bitmasks of all the members including a given subset.
+
+        Args:
+            X (Union[set[T], int]): A subset of the ground set or its bitmask.
+
+        Returns:
+            list[int]: The bitmasks of the members Y such that X ⊆ Y.
+        """
+        mask = X if isinstance(X, int) else self.__encoder.encode(X)
+        return [Y for Y in self.__masks if Y & mask == mask]
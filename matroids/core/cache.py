@@ -0,0 +1,152 @@
+from collections import OrderedDict, namedtuple
+from typing import Callable, Generic, Hashable, TypeVar, Union
+
+from .bitset import BitEncoder
+
+T = TypeVar('T')
+V = TypeVar('V')
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LRUCache(Generic[V]):
+    """A bounded memo which evicts the least recently used entry when it is full.
+    The numbers of hits and misses are counted like functools.lru_cache.
+    """
+    def __init__(self, maxsize: Union[int, None]=1024):
+        """
+        Args:
+            maxsize (Union[int, None], optional): The maximum number of entries. None means unbounded. Defaults to 1024.
+
+        Raises:
+            ValueError: if maxsize is negative.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("The maximum size of a cache must be non-negative!")
+        self.__maxsize = maxsize
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __repr__(self) -> str:
+        return f"LRUCache({self.info()})"
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__entries
+
+    @property
+    def maxsize(self) -> Union[int, None]:
+        return self.__maxsize
+
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def lookup(self, key: Hashable, compute: Callable[[], V]) -> V:
+        """Return the value memoized for a key, or compute and memoize it on a miss.
+
+        Args:
+            key (Hashable): A key.
+            compute (Callable[[], V]): A function computing the value of the key.
+
+        Returns:
+            V: The value of the key.
+        """
+        entries = self.__entries
+        if key in entries:
+            self.__hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self.__misses += 1
+        value = compute()
+        if self.__maxsize is None or self.__maxsize > 0:
+            entries[key] = value
+            if self.__maxsize is not None and len(entries) > self.__maxsize:
+                entries.popitem(last=False)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Report the statistics of the cache.
+
+        Returns:
+            CacheInfo: The numbers of hits and misses, the maximum size and the current size.
+        """
+        return CacheInfo(self.__hits, self.__misses, self.__maxsize, len(self.__entries))
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the statistics."""
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+
+class OracleCache(object):
+    """Memoize the rank and the closure of subsets keyed by their bitmasks.
+    The nulity shares the entries of the rank since n(X) = |X| - r(X).
+    """
+    def __init__( self
+                , encoder         : BitEncoder
+                , rank_function   : Callable[[set[T]], int]
+                , closure_function: Callable[[set[T]], set[T]]
+                , maxsize         : Union[int, None]=1024):
+        """
+        Args:
+            encoder (BitEncoder): An encoder whose ground set includes every subset to be queried.
+            rank_function (Callable[[set[T]], int]): A rank function to be memoized.
+            closure_function (Callable[[set[T]], set[T]]): A closure function to be memoized.
+            maxsize (Union[int, None], optional): The maximum number of entries in each memo. Defaults to 1024.
+        """
+        self.__encoder = encoder
+        self.__rank_function = rank_function
+        self.__closure_function = closure_function
+        self.__ranks = LRUCache(maxsize)
+        self.__closures = LRUCache(maxsize)
+
+    def __repr__(self) -> str:
+        return f"OracleCache(rank={self.__ranks.info()}, closure={self.__closures.info()})"
+
+    @property
+    def ranks(self) -> LRUCache[int]:
+        return self.__ranks
+
+    @property
+    def closures(self) -> LRUCache[frozenset[T]]:
+        return self.__closures
+
+    def __key(self, X: set[T]) -> Union[int, None]:
+        # A subset with an element out of the encoder has no canonical key, and so it is never memoized.
+        bit = self.__encoder.bit
+        key = 0
+        for e in X:
+            b = bit(e)
+            if not b:
+                return None
+            key |= b
+        return key
+
+    def rank_function(self, X: set[T]) -> int:
+        key = self.__key(X)
+        if key is None:
+            return self.__rank_function(X)
+        return self.__ranks.lookup(key, lambda: self.__rank_function(X))
+
+    def nulity_function(self, X: set[T]) -> int:
+        return len(X) - self.rank_function(X)
+
+    def closure_function(self, X: set[T]) -> set[T]:
+        key = self.__key(X)
+        if key is None:
+            return self.__closure_function(X)
+        return set(self.__closures.lookup(key, lambda: frozenset(self.__closure_function(X))))
+
+    def clear(self) -> None:
+        """Remove all the memoized ranks and closures."""
+        self.__ranks.clear()
+        self.__closures.clear()
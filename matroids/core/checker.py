@@ -1,16 +1,252 @@
 from itertools import combinations
 from math import inf
-from typing import Callable, TypeVar, Union
+from typing import Any, Callable, Iterable, TypeVar, Union
 
-from .set_operator import powset
+from .bitset import BitEncoder, iter_bits, popcount
+from .parallel import any_shard
 
 T = TypeVar('T')
 
 
+# ------------------------------------------------------------------------------------------------ #
+#   Kernels of the checks. Each kernel receives the family as a tuple of bitmasks (with its hash set) #
+#   and the rows [start, stop) of its loop, and returns True if it finds a violation.              #
+#   They are module-level functions so that any_shard can send them to worker processes.           #
+# ------------------------------------------------------------------------------------------------ #
+def _submasks(X: int):
+    # All the bitmasks Y with Y ⊆ X, including 0 and X.
+    Y = X
+    while True:
+        yield Y
+        if not Y:
+            return
+        Y = (Y - 1) & X
+
+
+def _pairs(family: tuple[int, ...], start: int, stop: int):
+    # The pairs (family[i], family[j]) with start ≦ i < stop and i < j, in the order of combinations(family, 2).
+    for i in range(start, stop):
+        X = family[i]
+        for j in range(i + 1, len(family)):
+            yield X, family[j]
+
+
+def _hereditary_violated(data, start: int, stop: int) -> bool:
+    Is, index = data
+    return any(I1 not in index for I2 in Is[start:stop] for I1 in _submasks(I2))
+
+
+def _augmentation_violated(data, start: int, stop: int) -> bool:
+    Is, index = data
+    for I1 in Is[start:stop]:
+        size = popcount(I1)
+        for I2 in Is:
+            if popcount(I2) > size and not any(I1 | e in index for e in iter_bits(I2 & ~I1)):
+                return True
+    return False
+
+
+def _opposite_hereditary_violated(data, start: int, stop: int) -> bool:
+    Xs, index, E = data
+    return any(X1 | Y not in index for X1 in Xs[start:stop] for Y in _submasks(E & ~X1))
+
+
+def _diminishment_violated(data, start: int, stop: int) -> bool:
+    Ds, index, E = data
+    for D1, D2 in _pairs(Ds, start, stop):
+        if (D1 & D2 not in index) and any((D1 | D2) & ~e not in index for e in iter_bits(E)):
+            return True
+    return False
+
+
+def _local_exchange_violation(B1: int, index: frozenset[int], E: int) -> Union[tuple[int, int, int], None]:
+    # |B1 - B2| = 2, B2 = (B1 - {a1, a2}) ∪ {c1, c2}
+    for a1, a2 in combinations(iter_bits(B1), 2):
+        for c1, c2 in combinations(iter_bits(E & ~B1), 2):
+            B2 = B1 ^ a1 ^ a2 ^ c1 ^ c2
+            if B2 not in index:
+                continue
+            for b1 in (a1, a2):
+                if B1 ^ b1 ^ c1 not in index and B1 ^ b1 ^ c2 not in index:
+                    return B1, B2, b1
+    return None
+
+
+def _local_exchange_violated(data, start: int, stop: int) -> bool:
+    Bs, index, E = data
+    return any(_local_exchange_violation(B1, index, E) is not None for B1 in Bs[start:stop])
+
+
+def _disconnection_violation(index: frozenset[int], E: int) -> Union[tuple[int, int, int], None]:
+    start = next(iter(index))
+    component = {start}
+    queue = [start]
+    while queue:
+        B = queue.pop()
+        for b in iter_bits(B):
+            for e in iter_bits(E & ~B):
+                neighbor = B ^ b ^ e
+                if neighbor in index and neighbor not in component:
+                    component.add(neighbor)
+                    queue.append(neighbor)
+    if len(component) == len(index):
+        return None
+    # If B1 and B2 are the closest pair across the components, any b1 ∈ B1 - B2 has no exchange;
+    # otherwise (B1 - {b1}) ∪ {b2} would be a basis in the component of B1 which is closer to B2.
+    B1, B2 = min( ((B1, B2) for B1 in component for B2 in index - component)
+                , key=lambda pair: popcount(pair[0] & ~pair[1]) )
+    b1 = B1 & ~B2
+    return B1, B2, b1 & -b1
+
+
+def _not_minimal(data, start: int, stop: int) -> bool:
+    Cs, = data
+    return any(not C1 & ~C2 and C1 != C2 for C1, C2 in _pairs(Cs, start, stop))
+
+
+def _circuit_elimination_violated(data, start: int, stop: int) -> bool:
+    Cs, = data
+    for C1, C2 in _pairs(Cs, start, stop):
+        for e in iter_bits(C1 & C2):
+            U = (C1 | C2) & ~e
+            if not any(not C3 & ~U for C3 in Cs):
+                return True
+    return False
+
+
+def _not_closed_by_intersection(data, start: int, stop: int) -> bool:
+    Fs, index = data
+    return any(F1 & F2 not in index for F1, F2 in _pairs(Fs, start, stop))
+
+
+def _complement_not_partitioned(data, start: int, stop: int) -> bool:
+    # The minimal members of Fs properly including F, minus F, have to partition E - F.
+    Fs, E = data
+    for F in Fs[start:stop]:
+        uppers = [G for G in Fs if not F & ~G and G != F]
+        covers = [G for G in uppers if not any(not H & ~G and H != G for H in uppers)]
+        covered = 0
+        for G in covers:
+            if (G & ~F) & covered:
+                return True
+            covered |= G & ~F
+        if covered != E & ~F:
+            return True
+    return False
+
+
+def _not_closed_by_union(data, start: int, stop: int) -> bool:
+    Os, index = data
+    return any(O1 | O2 not in index for O1, O2 in _pairs(Os, start, stop))
+
+
+def _open_exchange_violated(data, start: int, stop: int) -> bool:
+    Os, = data
+    for O1, O2 in _pairs(Os, start, stop):
+        difference = (O1 | O2) & ~(O1 & O2)
+        for o in iter_bits(O1 & O2):
+            upper = O1 | (O2 & ~o)
+            if not any(not difference & ~O3 and not O3 & ~upper and O3 != upper for O3 in Os):
+                return True
+    return False
+
+
+def _not_clutter(data, start: int, stop: int) -> bool:
+    Hs, = data
+    return any((not H1 & ~H2 or not H2 & ~H1) and H1 != H2 for H1, H2 in _pairs(Hs, start, stop))
+
+
+def _hyperplane_exchange_violated(data, start: int, stop: int) -> bool:
+    Hs, E = data
+    for H1, H2 in _pairs(Hs, start, stop):
+        for e in iter_bits(E & ~(H1 | H2)):
+            X = (H1 & H2) | e
+            if not any(not X & ~H3 for H3 in Hs):
+                return True
+    return False
+
+
+def _decrement_violated(data, start: int, stop: int) -> bool:
+    Ss, index = data
+    for S1, S2 in _pairs(Ss, start, stop):
+        if popcount(S1) == popcount(S2):
+            continue
+        smaller, larger = (S1, S2) if popcount(S1) < popcount(S2) else (S2, S1)
+        if not any(S2 & ~s in index for s in iter_bits(larger & ~smaller)):
+            return True
+    return False
+
+
+def _not_locally_monotonic(data, start: int, stop: int) -> bool:
+    # r(X) ≦ r(X ∪ {e}) for all X and e, which is equivalent to the monotonicity by chains from X to Y.
+    r, E = data
+    return any(r[X] > r[X | e] for X in range(start, stop) for e in iter_bits(E & ~X))
+
+
+def _not_locally_submodular(data, start: int, stop: int) -> bool:
+    # r(X ∪ {e}) + r(X ∪ {f}) ≧ r(X ∪ {e,f}) + r(X) for all X and e ≠ f, which is equivalent to the submodularity.
+    r, E = data
+    for X in range(start, stop):
+        rX = r[X]
+        for e, f in combinations(iter_bits(E & ~X), 2):
+            if r[X | e] + r[X | f] < r[X | e | f] + rX:
+                return True
+    return False
+
+
+def _not_locally_distributed(data, start: int, stop: int) -> bool:
+    # n(X ∪ {e}) - n(X) ≦ 1 for all X and e, which is equivalent to n(Y) - n(X) ≦ |Y - X| by chains from X to Y.
+    n, E = data
+    return any(n[X | e] - n[X] > 1 for X in range(start, stop) for e in iter_bits(E & ~X))
+
+
+def _not_locally_supermodular(data, start: int, stop: int) -> bool:
+    # n(X ∪ {e}) + n(X ∪ {f}) ≦ n(X ∪ {e,f}) + n(X) for all X and e ≠ f, which is equivalent to the supermodularity.
+    n, E = data
+    for X in range(start, stop):
+        nX = n[X]
+        for e, f in combinations(iter_bits(E & ~X), 2):
+            if n[X | e] + n[X | f] > n[X | e | f] + nX:
+                return True
+    return False
+
+
+def _girth_symmetric_finiteness_violated(data, start: int, stop: int) -> bool:
+    g, = data
+    size = len(g)
+    for X in range(start, stop):
+        if g[X] != popcount(X):
+            continue
+        for Y in range(X + 1, size):
+            if g[Y] != popcount(Y) or not X & Y:
+                continue
+            if any(g[(X | Y) & ~e] == inf for e in iter_bits(X & Y)):
+                return True
+    return False
+
+
+def _closure_exchange_violated(data, start: int, stop: int) -> bool:
+    cl, E = data
+    for X in range(start, stop):
+        clX = cl[X]
+        for e1 in iter_bits(E):
+            for e2 in iter_bits((X | e1) & ~clX):
+                if not e1 & cl[X | e2] & ~clX:
+                    return True
+    return False
+
+
+def _tabulate(E: set[T], f: Callable[[set[T]], Any]) -> tuple[BitEncoder, tuple]:
+    # Evaluate f once for each subset of E, and index the values by the bitmasks of the subsets.
+    encoder = BitEncoder(E)
+    return encoder, tuple(f(encoder.decode(X)) for X in range(1 << len(encoder)))
+
+
 def satisfies_independent_axiom( maybe_matroid                      : tuple[set[T], list[set[T]]]
                                , clearly_has_emptyset               : bool=False
                                , clearly_hereditary                 : bool=False
-                               , clearly_has_augmentation_properties: bool=False) -> bool:
+                               , clearly_has_augmentation_properties: bool=False
+                               , workers                            : Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a family of its subsets is a matroid.
     This is done due to the axiom of independent sets.
 
@@ -19,6 +255,7 @@ def satisfies_independent_axiom( maybe_matroid                      : tuple[set[
         clearly_has_emptyset                 (bool, optional) - If this is True, the check of (I1) will be skipped. Defaults to False.
         clearly_hereditary                   (bool, optional) - If this is True, the check of (I2) will be skipped. Defaults to False.
         clearly_has_augmentation_properties  (bool, optional) - If this is True, the check of (I3) will be skipped. Defaults to False.
+        workers                   (Union[int, None], optional) - The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
     
     Returns:
         bool: True if the given family satisfies the axiom of independent sets, otherwise False.
@@ -27,32 +264,30 @@ def satisfies_independent_axiom( maybe_matroid                      : tuple[set[
     # [Prerequisits] I ∈ Is => I ⊆ E
     if not all(map(lambda I: I <= E, Is)):
         return False
+    Is_ = BitEncoder(E).encode_family(Is)
     
     # (I1) ∅ ∈ Is (non-empty)
-    if not clearly_has_emptyset and set() not in Is:
+    if not clearly_has_emptyset and set() not in Is_:
         return False
     
+    data = (tuple(map(Is_.encoder.encode, Is)), Is_.index)
+
     # (I2) I1 ⊆ I2 and I2 ∈ Is => I1 ∈ Is (hereditary)
-    if not clearly_hereditary:
-        for I2 in Is:
-            if any(I1 not in Is for I1 in powset(I2)):
-                return False
+    if not clearly_hereditary and any_shard(_hereditary_violated, data, len(Is), workers):
+        return False
 
     # (I3) I1, I2 ∈ Is and |I1| < |I2| => ∃e ∈ I2\I1 s.t. I1 ∪ {e} ∈ Is (independence augmentation property)
     if clearly_has_augmentation_properties:
         return True
 
-    for I1 in Is:
-        for I2 in (I2 for I2 in Is if len(I2) > len(I1)):
-            if not [e for e in I2 - I1 if (I1 | {e}) in Is]:
-                return False
-    return True
+    return not any_shard(_augmentation_violated, data, len(Is), workers)
 
 
 def satisfies_dependent_axiom( maybe_matroid                      : tuple[set[T], list[set[T]]]
                              , clearly_has_no_emptyset            : bool=False
                              , clearly_opposite_hereditary        : bool=False
-                             , clearly_has_diminishment_properties: bool=False) -> bool:
+                             , clearly_has_diminishment_properties: bool=False
+                             , workers                            : Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a family of its subsets is a matroid.
     This is done due to the axiom of dependent sets (derived from that of independent sets).
 
@@ -61,6 +296,7 @@ def satisfies_dependent_axiom( maybe_matroid                      : tuple[set[T]
         clearly_has_emptyset                 (bool, optional) - If this is True, the check of (D1) will be skipped. Defaults to False.
         clearly_opposite_hereditary          (bool, optional) - If this is True, the check of (D2) will be skipped. Defaults to False.
         clearly_has_diminishment_properties  (bool, optional) - If this is True, the check of (D3) will be skipped. Defaults to False.
+        workers                   (Union[int, None], optional) - The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
     
     Returns:
         bool: True if the given family satisfies the axiom of independent sets, otherwise False.
@@ -69,30 +305,83 @@ def satisfies_dependent_axiom( maybe_matroid                      : tuple[set[T]
     # [Prerequisits] D ∈ Ds => D ⊆ E
     if not all(map(lambda D: D <= E, Ds)):
         return False
+    Ds_ = BitEncoder(E).encode_family(Ds)
     
     # (D1) ∅ ∉ Ds (no empty)
-    if not clearly_has_no_emptyset and set() in Ds:
+    if not clearly_has_no_emptyset and set() in Ds_:
         return False
     
+    data = (tuple(map(Ds_.encoder.encode, Ds)), Ds_.index, Ds_.encoder.full)
+
     # (D2) D1 ⊆ D2 ⊆ E and D1 ∈ Ds => D2 ∈ Ds (opposite-hereditary)
-    if not clearly_opposite_hereditary:
-        for D1 in Ds:
-            if any(D2 not in Ds for D2 in [D for D in powset(E) if D1 <= D]):
-                return False
+    if not clearly_opposite_hereditary and any_shard(_opposite_hereditary_violated, data, len(Ds), workers):
+        return False
 
     # (D3) D1, D2 ∈ Ds and D1 ≠ D2 => (D1 ∩ D2 ∈ Ds) or ((D1 ∪ D2)\{e} ∈ Ds, ∀e ∈ E)
     if clearly_has_diminishment_properties:
         return True
 
-    for D1, D2 in combinations(Ds, 2):
-        if (D1 & D2 not in Ds) and any((D1 | D2) - {e} not in Ds for e in E):
-            return False
-    return True
+    return not any_shard(_diminishment_violated, data, len(Ds), workers, pairwise=True)
+
+
+def find_base_exchange_violation(Bs: Iterable[int]) -> Union[tuple[int, int, int], None]:
+    """Find a violation of the base exchange property (B2) in a family of equicardinal bitmasks.
+    It relies on the local characterization of bases; a family of equicardinal sets satisfies (B2) if and only if
+    (a) its basis graph, whose edges join B and (B - {b}) ∪ {e}, is connected, and
+    (b) the exchange holds for the pairs B1, B2 with |B1 - B2| = 2.
+    Hence only O(|Bs|・r^2・(n-r)^2) lookups of the hash set are needed instead of O(|Bs|^2) pairs.
+
+    Args:
+        Bs (Iterable[int]): The bitmasks of equicardinal subsets.
+
+    Returns:
+        Union[tuple[int, int, int], None]: A triple (B1, B2, b1) of bitmasks such that no b2 ∈ B2 - B1
+                                           makes (B1 - {b1}) ∪ {b2} a member, or None if there is no violation.
+    """
+    index = frozenset(Bs)
+    if not index:
+        return None
+    E = 0
+    for B in index:
+        E |= B
+
+    # (b) The exchange holds for the pairs with |B1 - B2| = 2.
+    for B1 in index:
+        violation = _local_exchange_violation(B1, index, E)
+        if violation is not None:
+            return violation
+
+    # (a) The basis graph is connected.
+    return _disconnection_violation(index, E)
+
+
+def base_exchange_violation(maybe_matroid: tuple[set[T], list[set[T]]]) -> Union[tuple[set[T], set[T], T], None]:
+    """Find a counterexample to the base exchange property (B2) of a family of equicardinal subsets.
+
+    Args:
+        maybe_matroid (tuple[set[T], list[set[T]]]): A tuple (E, Bs), where E is a ground set and Bs is a family of subsets of E.
+
+    Returns:
+        Union[tuple[set[T], set[T], T], None]: A triple (B1, B2, b1) such that b1 ∈ B1 - B2 and (B1 - {b1}) ∪ {b2} ∉ Bs for any b2 ∈ B2 - B1.
+                                               None if there is no such triple or the members of Bs have different sizes.
+    """
+    E, Bs = maybe_matroid
+    if len(set(map(len, Bs))) > 1:
+        return None
+    Bs_ = BitEncoder(E | set().union(*Bs)).encode_family(Bs)
+    violation = find_base_exchange_violation(Bs_.masks)
+    if violation is None:
+        return None
+    decode = Bs_.encoder.decode
+    B1, B2, b1 = violation
+    return decode(B1), decode(B2), next(iter(decode(b1)))
 
 
 def satisfies_bases_axiom( maybe_matroid: tuple[set[T], list[set[T]]]
                          , clearly_non_empty: bool=False
-                         , clearly_base_exchangable: bool=False) -> bool:
+                         , clearly_base_exchangable: bool=False
+                         , certificate: bool=False
+                         , workers: Union[int, None]=None) -> Union[bool, tuple[bool, Union[tuple[set[T], set[T], T], None]]]:
     """Judge whether the given pair of a ground set and a family of its subsets is a matroid.
     This is done due to the axiom of bases.
 
@@ -100,10 +389,17 @@ def satisfies_bases_axiom( maybe_matroid: tuple[set[T], list[set[T]]]
         maybe_matroid (tuple[set[T], list[set[T]]]): A tuple (E, Bs), where E is a ground set and Bs is a family of subsets of E.
         clearly_non_empty        (bool, optional): If this is True, the check of (B1) will be skipped. Defaults to False.
         clearly_base_exchangable (bool, optional): If this is True, the check of (B2) will be skipped. Defaults to False.
+        certificate              (bool, optional): If this is True, also returns a counterexample to (B2). Defaults to False.
+        workers      (Union[int, None], optional): The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
 
     Returns:
-        bool: True if the given family satisfies the axiom of bases, otherwise False.
+        Union[bool, tuple[bool, Union[tuple[set[T], set[T], T], None]]]: True if the given family satisfies the axiom of bases, otherwise False.
+                                  If certificate is True, also returns a violating triple (B1, B2, b1) of (B2) if it exists.
     """
+    if certificate:
+        satisfied = satisfies_bases_axiom(maybe_matroid, clearly_non_empty, clearly_base_exchangable, workers=workers)
+        return (satisfied, None if satisfied else base_exchange_violation(maybe_matroid))
+
     E, Bs = maybe_matroid
     # (B1) Bs ≠ ∅ (non-empty)
     if not clearly_non_empty and not Bs:
@@ -122,18 +418,22 @@ def satisfies_bases_axiom( maybe_matroid: tuple[set[T], list[set[T]]]
         return False
     
     # (B2) B1, B2 ∈ Bs, b1 ∈ B1 - B2 => ∃b2 ∈ B2 - B1: (B1 - {b1}) ∪ {b2} ∈ Bs
+    # It is checked locally as in find_base_exchange_violation.
     if not clearly_base_exchangable:
-        for B1, B2 in combinations(Bs, 2):
-            for b1 in B1 - B2:
-                if not [b2 for b2 in B2 - B1 if ((B1 - {b1}) | {b2}) in Bs]:
-                    return False
+        Bs_ = BitEncoder(E).encode_family(Bs)
+        data = (Bs_.masks, Bs_.index, Bs_.encoder.full)
+        if any_shard(_local_exchange_violated, data, len(Bs_), workers):
+            return False
+        if _disconnection_violation(Bs_.index, Bs_.encoder.full) is not None:
+            return False
     return True
 
 
 def satisfies_circuits_axiom( maybe_matroid               : tuple[set[T], list[set[T]]]
                             , clearly_has_no_emptyset     : bool=False
                             , clearly_minimal             : bool=False
-                            , clearly_circuits_exchangable: bool=False) -> bool:
+                            , clearly_circuits_exchangable: bool=False
+                            , workers                     : Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a family of its subsets is a matroid.
     This is done due to the axiom of circuits.
 
@@ -142,6 +442,7 @@ def satisfies_circuits_axiom( maybe_matroid               : tuple[set[T], list[s
         clearly_has_no_emptyset      (bool, optional): If this is True, the check of (C1) will be skipped. Defaults to False.
         clearly_minimal              (bool, optional): If this is True, the check of (C2) will be skipped. Defaults to False.
         clearly_circuits_exchangable (bool, optional): If this is True, the check of (C3) will be skipped. Defaults to False.
+        workers          (Union[int, None], optional): The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
 
     Returns:
         bool: True if the given family satisfies the axiom of circuits, otherwise False.
@@ -155,25 +456,23 @@ def satisfies_circuits_axiom( maybe_matroid               : tuple[set[T], list[s
     if not clearly_has_no_emptyset and set() in Cs:
         return False
 
+    data = (tuple(map(BitEncoder(E).encode, Cs)),)
+
     # (C2) C1, C2 ∈ Cs and C1 ⊆ C2 => C1 = C2.
-    if not clearly_minimal:
-        for C1, C2 in combinations(Cs, 2):
-            if C1 <= C2 and C1 != C2:
-                return False
+    if not clearly_minimal and any_shard(_not_minimal, data, len(Cs), workers, pairwise=True):
+        return False
     
     # (C3) C1, C2 ∉ Cs with C1 ≠ C2 and e ∈ C1 ∩ C2 => ∃C3 ∈ Cs s.t. C3 ⊆ (C1 ∪ C2) - e.
-    if not clearly_circuits_exchangable:
-        for C1, C2 in combinations(Cs, 2):
-            for e in C1 & C2:
-                if not any([C3 <= (C1 | C2) - {e} for C3 in Cs]):
-                    return False
+    if not clearly_circuits_exchangable and any_shard(_circuit_elimination_violated, data, len(Cs), workers, pairwise=True):
+        return False
     return True
 
 
 def satisfies_rank_function_axiom( maybe_matroid                        : tuple[set[T], Callable[[set[T]], int]]
                                  , clearly_bounded_above_by_cardinality : bool=False
                                  , clearly_monotonic                    : bool=False
-                                 , clearly_submodular                   : bool=False) -> bool:
+                                 , clearly_submodular                   : bool=False
+                                 , workers                              : Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a function from set to non-negative integers is a matroid.
     This is done due to the axiom of a rank function.
 
@@ -182,29 +481,31 @@ def satisfies_rank_function_axiom( maybe_matroid                        : tuple[
         clearly_bounded_above_by_cardinality (bool, optional): If this is True, the check of (R1) will be skipped. Defaults to False.
         clearly_monotonic                    (bool, optional): If this is True, the check of (R2) will be skipped. Defaults to False.
         clearly_submodular                   (bool, optional): If this is True, the check of (R3) will be skipped. Defaults to False.
+        workers                  (Union[int, None], optional): The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
 
     Returns:
         bool: True if the given family satisfies the axiom of a rank function, otherwise False.
     """
     E, r = maybe_matroid
+    if clearly_bounded_above_by_cardinality and clearly_monotonic and clearly_submodular:
+        return True
+    # r is evaluated once for each subset, and the checks below look up the table.
+    # (R2) and (R3) are checked by their local forms with O(2^n・n^2) lookups instead of all the pairs of subsets.
+    encoder, r_ = _tabulate(E, r)
+    data = (r_, encoder.full)
+
     # (R1) ∀X ⊆ E, 0 ≦ r(X) ≦ |X|
     if not clearly_bounded_above_by_cardinality:
-        for X in powset(E):
-            if not (0 <= r(X) <= len(X)):
-                return False
+        if not all(0 <= r_[X] <= popcount(X) for X in range(len(r_))):
+            return False
     
     # (R2) X ⊆ Y ⊆ E => r(X) ≦ r(Y) (monotonic)
-    if not clearly_monotonic:
-        for Y in powset(E):
-            for X in powset(Y):
-                if r(X) > r(Y):
-                    return False
+    if not clearly_monotonic and any_shard(_not_locally_monotonic, data, len(r_), workers):
+        return False
 
     # (R3) ∀X, Y ⊆ E, r(X) + r(Y) ≧ r(X ∪ Y) + r(X ∩ Y) (Submodularity)
-    if not clearly_submodular:
-        for X, Y in combinations(powset(E), 2):
-            if r(X) + r(Y) < r(X | Y) + r (X & Y):
-                return False
+    if not clearly_submodular and any_shard(_not_locally_submodular, data, len(r_), workers):
+        return False
 
     return True
 
@@ -212,7 +513,8 @@ def satisfies_rank_function_axiom( maybe_matroid                        : tuple[
 def satisfies_nulity_function_axiom( maybe_matroid                      : tuple[set[T], Callable[[set[T]], int]]
                                    , clearly_bounded_above_by_cardinality : bool=False
                                    , clearly_inequal_with_distribution    : bool=False
-                                   , clearly_supermodular                 : bool=False) -> bool:
+                                   , clearly_supermodular                 : bool=False
+                                   , workers                              : Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a function from set to non-negative integers is a matroid.
     This is done due to the axiom of a nulity function.
 
@@ -221,29 +523,31 @@ def satisfies_nulity_function_axiom( maybe_matroid                      : tuple[
         clearly_bounded_above_by_cardinality (bool, optional): If this is True, the check of (N1) will be skipped. Defaults to False.
         clearly_inequal_with_distribution    (bool, optional): If this is True, the check of (N2) will be skipped. Defaults to False.
         clearly_supermodular                 (bool, optional): If this is True, the check of (N3) will be skipped. Defaults to False.
+        workers                  (Union[int, None], optional): The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
 
     Returns:
         bool: True if the given family satisfies the axiom of a nulity function, otherwise False.
     """
     E, n = maybe_matroid
+    if clearly_bounded_above_by_cardinality and clearly_inequal_with_distribution and clearly_supermodular:
+        return True
+    # n is evaluated once for each subset, and the checks below look up the table.
+    # (N2) and (N3) are checked by their local forms with O(2^n・n^2) lookups instead of all the pairs of subsets.
+    encoder, n_ = _tabulate(E, n)
+    data = (n_, encoder.full)
+
     # (N1) ∀X ⊆ E, 0 ≦ n(X) ≦ |X|
     if not clearly_bounded_above_by_cardinality:
-        for X in powset(E):
-            if not (0 <= n(X) <= len(X)):
-                return False
+        if not all(0 <= n_[X] <= popcount(X) for X in range(len(n_))):
+            return False
     
     # (N2) X ⊆ Y ⊆ E => n(Y) - n(X) ≦ |Y - X|
-    if not clearly_inequal_with_distribution:
-        for Y in powset(E):
-            for X in powset(Y):
-                if n(Y) - n(X) > len(Y - X):
-                    return False
+    if not clearly_inequal_with_distribution and any_shard(_not_locally_distributed, data, len(n_), workers):
+        return False
 
     # (R3) ∀X, Y ⊆ E, n(X) + n(Y) ≦ n(X ∪ Y) + n(X ∩ Y) (Supermodularity)
-    if not clearly_supermodular:
-        for X, Y in combinations(powset(E), 2):
-            if n(X) + n(Y) > n(X | Y) + n(X & Y):
-                return False
+    if not clearly_supermodular and any_shard(_not_locally_supermodular, data, len(n_), workers):
+        return False
 
     return True
 
@@ -251,41 +555,65 @@ def satisfies_nulity_function_axiom( maybe_matroid                      : tuple[
 def satisfies_closure_axiom( maybe_matroid                        : tuple[set[T], Callable[[set[T]], set[T]]]
                            , clearly_increasing                   : bool=False
                            , clearly_monotonic                    : bool=False
-                           , clearly_MacLane_Steinitz_exchangable : bool=False) -> bool:
+                           , clearly_MacLane_Steinitz_exchangable : bool=False
+                           , count_calls                          : bool=False
+                           , workers                              : Union[int, None]=None) -> Union[bool, tuple[bool, int]]:
     """Judge whether the given pair of a ground set and a function from set to set is a matroid.
     This is done due to the axiom of a closure operator.
+    The function is called exactly once for each subset, and the axioms are checked on the table of the closures as bitmasks.
 
     Args:
         maybe_matroid (tuple[set[T], Callable[[set[T]], set[T]]]): A tuple (E, cl), where E is a ground set and cl is a function.
         clearly_increasing                   (bool, optional): If this is True, the check of (Cl1) will be skipped. Defaults to False.
         clearly_monotonic                    (bool, optional): If this is True, the check of (Cl2) will be skipped. Defaults to False.
         clearly_MacLane_Steinitz_exchangable (bool, optional): If this is True, the check of (Cl3) will be skipped. Defaults to False.
+        count_calls                          (bool, optional): If this is True, also returns the number of calls of cl. Defaults to False.
+        workers                  (Union[int, None], optional): The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
 
     Returns:
-        bool: True if the given family satisfies the axiom of a closure operator, otherwise False.
+        Union[bool, tuple[bool, int]]: True if the given family satisfies the axiom of a closure operator, otherwise False.
+                                       If count_calls is True, also returns the number of calls of cl.
     """
     E, cl = maybe_matroid
-    
+    calls = 0
+    def counted_cl(X: set[T]) -> set[T]:
+        nonlocal calls
+        calls += 1
+        return cl(X)
+
+    satisfied = True
+    if not (clearly_increasing and clearly_monotonic and clearly_MacLane_Steinitz_exchangable):
+        encoder, closures = _tabulate(E, counted_cl)
+        cl_ = tuple(map(encoder.encode, closures))
+        satisfied = _satisfies_closure_table(cl_, encoder.full, clearly_increasing, clearly_monotonic, clearly_MacLane_Steinitz_exchangable, workers)
+    return (satisfied, calls) if count_calls else satisfied
+
+
+def _satisfies_closure_table( cl                                   : tuple[int, ...]
+                            , E                                    : int
+                            , clearly_increasing                   : bool
+                            , clearly_monotonic                    : bool
+                            , clearly_MacLane_Steinitz_exchangable : bool
+                            , workers                              : Union[int, None]) -> bool:
     # (Cl1) ∀X ⊆ E, X ⊆ cl(X) (increasing)
-    if not clearly_increasing:
-        for X in powset(E):
-            if not (X <= cl(X)):
-                return False
+    if not clearly_increasing and any(X & ~cl[X] for X in range(len(cl))):
+        return False
     
     # (Cl2) ∀X, Y ⊆ E, X ⊆ cl(Y) => cl(X) ⊆ cl(Y) (monotonic)
+    # Let U(Z) be the union of cl(X) over X ⊆ Z, which is computed by the subset-sum (zeta) transform with the bitwise or.
+    # Then (Cl2) is equivalent to U(cl(Y)) ⊆ cl(Y) for all Y.
     if not clearly_monotonic:
-        for Y in powset(E):
-            for X in powset(cl(Y)):
-                if not (cl(X) <= cl(Y)):
-                    return False
+        U = [*cl]
+        for e in iter_bits(E):
+            for Z in range(len(U)):
+                if Z & e:
+                    U[Z] |= U[Z ^ e]
+        if any(U[cl[Y] & E] & ~cl[Y] for Y in range(len(cl))):
+            return False
 
     # (Cl3) ∀X ⊆ E, ∀e1 ∈ E, e2 ∈ (X ∪ {e1}) - cl(X) => e1 ∈ cl(X ∪ {e2}) - cl(X)  (Mac Lane-Steinitz exchange property)
-    if not clearly_MacLane_Steinitz_exchangable:
-        for X in powset(E):
-            for e1 in E:
-                for e2 in (e2 for e2 in E if e2 in (X | {e1}) - cl(X)):
-                    if e1 not in cl(X | {e2}) - cl(X):
-                        return False
+    if not clearly_MacLane_Steinitz_exchangable and any_shard(_closure_exchange_violated, (cl, E), len(cl), workers):
+        return False
     
     return True
 
@@ -293,7 +621,8 @@ def satisfies_closure_axiom( maybe_matroid                        : tuple[set[T]
 def satisfies_flats_axiom( maybe_matroid                        : tuple[set[T], list[set[T]]]
                          , clearly_has_ground_set               : bool=False
                          , clearly_closed_by_intersection       : bool=False
-                         , clearly_complement_partitionable     : bool=False) -> bool:
+                         , clearly_complement_partitionable     : bool=False
+                         , workers                              : Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a collection of subsets is a matroid.
     This is done due to the axiom of flats.
 
@@ -302,34 +631,39 @@ def satisfies_flats_axiom( maybe_matroid                        : tuple[set[T],
         clearly_has_ground_set (bool, optional)          : If this is True, the check of (F1) will be skipped. Defaults to False.
         clearly_closed_by_intersection (bool, optional)  : If this is True, the check of (F2) will be skipped. Defaults to False.
         clearly_complement_partitionable (bool, optional): If this is True, the check of (F3) will be skipped. Defaults to False.
+        workers              (Union[int, None], optional): The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
 
     Returns:
         bool: True if the given family satisfies the axiom of flats, False otherwise.
     """
     E, Fs = maybe_matroid
 
+    # [Prerequisits] F ∈ Fs => F ⊆ E
+    if not all(map(lambda F: F <= E, Fs)):
+        return False
+    Fs_ = BitEncoder(E).encode_family(Fs)
+
     # (F1) E ∈ Fs
-    if not clearly_has_ground_set and E not in Fs:
+    if not clearly_has_ground_set and E not in Fs_:
         return False
-    
+
     # (F2) F1, F2 ∈ Fs => F1 ∩ F2 ∈ Fs
-    if not clearly_closed_by_intersection and any(map(lambda F1, F2: F1 & F2 not in Fs ,combinations(Fs, 2))):
+    if not clearly_closed_by_intersection and any_shard(_not_closed_by_intersection, (Fs_.masks, Fs_.index), len(Fs_), workers, pairwise=True):
         return False
-    
-    # TODO: Implement the check of (F3)
-    # (F3) F ∈ Fs and {F1,F2, ..., Fk} is the set of minimal members of Fs s.t. F ⊊ ∪[i∈{1..k}] Fi,
+
+    # (F3) F ∈ Fs and {F1,F2, ..., Fk} is the set of minimal members of Fs s.t. F ⊊ Fi,
     #      F1 - F, F2 - F, ... , Fk - F partitions E - F.
-    if not clearly_complement_partitionable:
-        for F in Fs:
-            pass
-    
+    if not clearly_complement_partitionable and any_shard(_complement_not_partitioned, (Fs_.masks, Fs_.encoder.full), len(Fs_), workers):
+        return False
+
     return True
 
 
 def satisfies_open_sets_axiom( maybe_matroid          : tuple[set[T], list[set[T]]]
                              , clearly_has_emptyset   : bool=False
                              , clearly_closed_by_union: bool=False
-                             , clearly_exists_another : bool=False) -> bool:
+                             , clearly_exists_another : bool=False
+                             , workers                : Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a collection of subsets is a matroid.
     This is done due to the axiom of open sets.
 
@@ -338,6 +672,7 @@ def satisfies_open_sets_axiom( maybe_matroid          : tuple[set[T], list[set[T
         clearly_has_emptyset (bool, optional)   : If this is True, the check of (O1) will be skipped. Defaults to False.
         clearly_closed_by_union (bool, optional): If this is True, the check of (O2) will be skipped. Defaults to False.
         clearly_exists_another (bool, optional) : If this is True, the check of (O3) will be skipped. Defaults to False.
+        workers    (Union[int, None], optional) : The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
 
     Returns:
         bool: True if the given family satisfies the axiom of open sets, False otherwise.
@@ -347,31 +682,30 @@ def satisfies_open_sets_axiom( maybe_matroid          : tuple[set[T], list[set[T
     # [Prerequisits] O ∈ Os => O ⊆ E
     if not all(map(lambda O: O <= E, Os)):
         return False
+    Os_ = BitEncoder(E).encode_family(Os)
 
     # (O1) ∅ ∈ Os
-    if (not clearly_has_emptyset) and (set() not in Os):
+    if (not clearly_has_emptyset) and (set() not in Os_):
         print("Hey")
         return False
     
+    Os_masks = tuple(map(Os_.encoder.encode, Os))
+
     # (O2) O1, O2 ∈ Os => O1 ∪ O2 ∈ Os
-    if not clearly_closed_by_union:
-        for (O1, O2) in combinations(Os, 2):
-            if O1 | O2 not in Os:
-                return False
+    if not clearly_closed_by_union and any_shard(_not_closed_by_union, (Os_masks, Os_.index), len(Os), workers, pairwise=True):
+        return False
     
     # (O3) ∀O1, O2 ∈ Os, ∀o ∈ O1 ∩ O2, ∃O3 ∈ Os s.t. (O1 ∪ O2)\(O1 ∩ O2) ⊆ O3 ⊊ (O1 ∪ O2)\{o}
-    if not clearly_exists_another:
-        for O1, O2 in combinations(Os, 2):
-            for o in O1 & O2:
-                if not any(map(lambda O3: ((O1 | O2) - (O1 & O2)) <= O3 < (O1 | O2 - {o}), Os)):
-                    return False
+    if not clearly_exists_another and any_shard(_open_exchange_violated, (Os_masks,), len(Os), workers, pairwise=True):
+        return False
     return True
 
 
 def satisfies_hyperplanes_axiom( maybe_matroid: tuple[set[T], list[set[T]]]
                                , clearly_has_no_ground_set: bool=False
                                , clearly_clutter          : bool=False
-                               , clearly_exists_another   : bool=False) -> bool:
+                               , clearly_exists_another   : bool=False
+                               , workers                  : Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a collection of subsets is a matroid.
     This is done due to the axiom of hyperplanes.
 
@@ -380,6 +714,7 @@ def satisfies_hyperplanes_axiom( maybe_matroid: tuple[set[T], list[set[T]]]
         clearly_has_no_ground_set (bool, optional): If this is True, the check of (H1) will be skipped. Defaults to False.
         clearly_clutter (bool, optional)          : If this is True, the check of (H2) will be skipped. Defaults to False.
         clearly_exists_another (bool, optional)   : If this is True, the check of (H3) will be skipped. Defaults to False.
+        workers    (Union[int, None], optional)   : The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
     
     Returns:
         bool: True if the given family satisfies the axiom of hyperplanes, False otherwise.
@@ -390,28 +725,27 @@ def satisfies_hyperplanes_axiom( maybe_matroid: tuple[set[T], list[set[T]]]
         return False
     
     # (H1) E ∉ Hs
-    if (not clearly_has_no_ground_set) and (E in Hs):
+    if (not clearly_has_no_ground_set) and (E in BitEncoder(E).encode_family(Hs)):
         return False
     
+    encoder = BitEncoder(E)
+    Hs_masks = tuple(map(encoder.encode, Hs))
+
     # (H2) H1, H2 ∈ Hs and H1 ⊆ H2 => H1 = H2
-    if not clearly_clutter:
-        for H1, H2 in combinations(Hs, 2):
-            if ((H1 <= H2) or (H2 <= H1)) and H1 != H2:
-                return False
+    if not clearly_clutter and any_shard(_not_clutter, (Hs_masks,), len(Hs), workers, pairwise=True):
+        return False
     
     # (H3) H1, H2 ∈ Hs with H1 ≠ H2 and e ∈ E - (H1 ∪ H2) => ∃H3 ∈ Hs s.t. (H1 ∩ H2) ∪ {e} ⊆ H3.
-    if not clearly_exists_another:
-        for H1, H2 in combinations(Hs, 2):
-            for e in (E - (H1 | H2)):
-                if not any(map(lambda H3: ((H1 & H2) | {e}) <= H3, Hs)):
-                    return False
+    if not clearly_exists_another and any_shard(_hyperplane_exchange_violated, (Hs_masks, encoder.full), len(Hs), workers, pairwise=True):
+        return False
     return True
 
 
 def satisfies_spanning_sets_axiom( maybe_matroid: tuple[set[T], list[set[T]]]
                                  , clearly_has_ground_set     : bool=False
                                  , clearly_opposite_hereditary: bool=False
-                                 , clearly_exists_decrement   : bool=False) -> bool:
+                                 , clearly_exists_decrement   : bool=False
+                                 , workers                    : Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a collection of subsets is a matroid.
     This is done due to the axiom of spanning sets.
 
@@ -420,6 +754,7 @@ def satisfies_spanning_sets_axiom( maybe_matroid: tuple[set[T], list[set[T]]]
         clearly_has_ground_set (bool, optional)     : If this is True, the check of (S1) will be skipped. Defaults to False.
         clearly_opposite_hereditary (bool, optional): If this is True, the check of (S2) will be skipped. Defaults to False.
         clearly_exists_decrement (bool, optional)   : If this is True, the check of (S3) will be skipped. Defaults to False.
+        workers      (Union[int, None], optional)   : The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
 
     Returns:
         bool: True if the given family satisfies the axiom of hyperplanes, False otherwise.
@@ -428,32 +763,29 @@ def satisfies_spanning_sets_axiom( maybe_matroid: tuple[set[T], list[set[T]]]
     # [Prerequisits] S ∈ Ss => S ⊆ Ss
     if any(map(lambda S: not S <= E, Ss)):
         return False
+    Ss_ = BitEncoder(E).encode_family(Ss)
     
     # (S1) E ∈ Ss
-    if (not clearly_has_ground_set) and (E not in Ss):
+    if (not clearly_has_ground_set) and (E not in Ss_):
         return False
     
+    data = (tuple(map(Ss_.encoder.encode, Ss)), Ss_.index, Ss_.encoder.full)
+
     # (S2) S1 ∈ Ss and S1 ⊆ S2 => S2 ∈ Ss
-    if not clearly_opposite_hereditary:
-        for S1 in Ss:
-            if any(map(lambda S2: (S1 <= S2) and (S2 not in Ss), powset(E))):
-                return False
+    if not clearly_opposite_hereditary and any_shard(_opposite_hereditary_violated, data, len(Ss), workers):
+        return False
     
     # (S3) S1, S2 ∈ Ss and |S1| < |S2| => ∃s∈S2-S1 s.t. S2\{s} ∈ Ss.
-    if not clearly_exists_decrement:
-        for S1, S2 in combinations(Ss, 2):
-            if len(S1) == len(S2):
-                continue
-            smaller, larger = (S1, S2) if len(S1) < len(S2) else (S2, S1)
-            if not any(map(lambda s: S2 - {s} in Ss, larger - smaller)):
-                return False
+    if not clearly_exists_decrement and any_shard(_decrement_violated, data[:2], len(Ss), workers, pairwise=True):
+        return False
     
     return True
 
 def satisfies_girth_function_axiom( maybe_matroid: tuple[set[T], Callable[[set[T]], Union[int, float]]]
                                   , clearly_decrementable: bool=False
                                   , clearly_monotonic_decrease: bool=False
-                                  , clearly_symmetric_finite: bool=False) -> bool:
+                                  , clearly_symmetric_finite: bool=False
+                                  , workers: Union[int, None]=None) -> bool:
     """Judge whether the given pair of a ground set and a collection of subsets is a matroid.
     This is done due to the axiom of a girth function.
 
@@ -462,32 +794,31 @@ def satisfies_girth_function_axiom( maybe_matroid: tuple[set[T], Callable[[set[T
         clearly_decrementable (bool, optional): If this is True, the check of (G1) will be skipped. Defaults to False.
         clearly_monotonic_decrease (bool, optional): If this is True, the check of (G2) will be skipped. Defaults to False.
         clearly_symmetric_finite (bool, optional): If this is True, the check of (G3) will be skipped. Defaults to False.
+        workers (Union[int, None], optional): The number of processes sharing the checks. Defaults to parallel.DEFAULT_WORKERS.
 
     Returns:
         bool: True if the given family satisfies the axiom of a girth function, False otherwise.
     """
     E, g = maybe_matroid
+    if clearly_decrementable and clearly_monotonic_decrease and clearly_symmetric_finite:
+        return True
+    # g is evaluated once for each subset, and the checks below look up the table.
+    _, g_ = _tabulate(E, g)
 
     # (G1) X ⊆ E and g(X) < ∞ => ∃Y ⊊ X s.t. g(X) = g(Y) = |Y|.
     if not clearly_decrementable:
-        for X in powset(E):
-            if g(X) < inf:
-                if not any((g(X) == g(Y)) and (g(Y) == len(Y)) for Y in powset(X)):
+        for X in range(len(g_)):
+            if g_[X] < inf:
+                if not any((g_[X] == g_[Y]) and (g_[Y] == popcount(Y)) for Y in _submasks(X)):
                     return False
     
-    # (G2) X ⊆ Y ⊆ E => g(X) ≧ g(Y).
+    # (G2) X ⊆ Y ⊆ E => g(X) ≧ g(Y). It is checked by the local form g(X) ≧ g(X ∪ {e}).
     if not clearly_monotonic_decrease:
-        for Y in powset(E):
-            for X in powset(Y):
-                if g(X) < g(Y):
-                    return False
+        full = len(g_) - 1
+        if any(g_[X] < g_[X | e] for X in range(len(g_)) for e in iter_bits(full & ~X)):
+            return False
     
     # (G3) X, Y ⊆ E with X ≠ Y, g(X) = |X|, g(Y) = |Y|, and e ∈ X ∩ Y => g((X∪Y)\{e}) < ∞
-    if not clearly_symmetric_finite:
-        for X, Y in combinations(powset(E),2):
-            if (g(X) != len(X)) or (g(Y) != len(Y)) or X.isdisjoint(Y):
-                continue
-            for e in X & Y:
-                if g((X | Y) - {e}) == inf:
-                    return False
+    if not clearly_symmetric_finite and any_shard(_girth_symmetric_finiteness_violated, (g_,), len(g_), workers, pairwise=True):
+        return False
     return True
\ No newline at end of file
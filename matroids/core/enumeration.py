@@ -0,0 +1,176 @@
+from typing import Callable, Iterator, Union
+
+from .bitset import iter_bits, popcount
+
+
+def _above(mask: int, bit: int) -> int:
+    # The bits of the mask higher than the given single bit.
+    return mask & ~((bit << 1) - 1)
+
+
+def greedy_mask(I: int, X: int, is_independent: Callable[[int], bool]) -> int:
+    """Extend an independent set I to a maximal independent subset of I ∪ X by trying the bits of X from the lowest.
+
+    Args:
+        I (int): The bitmask of an independent set.
+        X (int): The bitmask of a subset of the ground set.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+
+    Returns:
+        int: The bitmask of a maximal independent subset of I ∪ X including I.
+    """
+    for b in iter_bits(X & ~I):
+        if is_independent(I | b):
+            I |= b
+    return I
+
+
+def iter_independent_masks(E: int, is_independent: Callable[[int], bool]) -> Iterator[int]:
+    """Enumerate the independent sets by depth-first search, where the children of I are I ∪ {e} for e > max(I).
+    Each independent set is visited exactly once since independence is hereditary,
+    and only a stack of O(|E|^2) bitmasks is held.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+
+    Yields:
+        int: The bitmask of each independent set in lexicographic order.
+    """
+    stack = [(0, E)]
+    while stack:
+        I, rest = stack.pop()
+        yield I
+        children = [ (I | b, _above(rest, b)) for b in iter_bits(rest) if is_independent(I | b) ]
+        stack.extend(reversed(children))
+
+
+def iter_basis_masks(E: int, is_independent: Callable[[int], bool]) -> Iterator[int]:
+    """Enumerate the bases by the flashlight search.
+    An independent set I is extended by e > max(I) only if I ∪ {e} still grows to a basis with the elements above e,
+    which is tested by the greedy algorithm, and so no branch of the search ends without a basis.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+
+    Yields:
+        int: The bitmask of each basis in lexicographic order.
+    """
+    r = popcount(greedy_mask(0, E, is_independent))
+    stack = [(0, E)]
+    while stack:
+        I, rest = stack.pop()
+        if popcount(I) == r:
+            yield I
+            continue
+        children = []
+        for b in iter_bits(rest):
+            J, above = I | b, _above(rest, b)
+            if is_independent(J) and popcount(greedy_mask(J, above, is_independent)) == r:
+                children.append((J, above))
+        stack.extend(reversed(children))
+
+
+def iter_circuit_masks(E: int, is_independent: Callable[[int], bool]) -> Iterator[int]:
+    """Enumerate the circuits. Each circuit C is found exactly once as I ∪ {e},
+    where e = max(C) and I = C - {e} is an independent set visited in the search of iter_independent_masks.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+
+    Yields:
+        int: The bitmask of each circuit.
+    """
+    stack = [(0, E)]
+    while stack:
+        I, rest = stack.pop()
+        children = []
+        for b in iter_bits(rest):
+            C = I | b
+            if is_independent(C):
+                children.append((C, _above(rest, b)))
+            elif all(is_independent(C & ~c) for c in iter_bits(I)):
+                yield C
+        stack.extend(reversed(children))
+
+
+def iter_flat_masks(E: int, is_independent: Callable[[int], bool], rank: Union[int, None]=None) -> Iterator[int]:
+    """Enumerate the flats by depth-first search over their lexicographically first bases.
+    If B is the first basis of a flat and e = max(B), then B - {e} is the first basis of cl(B - {e}).
+    Conversely, B ∪ {e} with e > max(B) is the first basis of F' = cl(B ∪ {e}) if and only if e = min(F' - cl(B)).
+    Hence each flat is visited exactly once, and the flats of rank k are found at the depth k.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+        rank (Union[int, None], optional): If it is given, only the flats of this rank are enumerated. Defaults to None.
+
+    Yields:
+        int: The bitmask of each flat.
+    """
+    def span(B: int, X: int) -> int:
+        # cl(X) = X ∪ { x ∈ E - X : B ∪ {x} is dependent } for a basis B of X.
+        return X | sum(x for x in iter_bits(E & ~X) if not is_independent(B | x))
+
+    stack = [(0, span(0, 0), E, 0)]
+    while stack:
+        B, F, rest, depth = stack.pop()
+        if rank is None or depth == rank:
+            yield F
+        if rank is not None and depth >= rank:
+            continue
+        children = []
+        for b in iter_bits(rest & ~F):
+            G = span(B | b, F | b)
+            new = G & ~F
+            if new & -new == b:
+                children.append((B | b, G, _above(rest, b), depth + 1))
+        stack.extend(reversed(children))
+
+
+def shrink_to_circuit(D: int, is_independent: Callable[[int], bool]) -> int:
+    """Shrink a dependent set to a circuit in it by dropping the elements which are not needed for the dependence.
+
+    Args:
+        D (int): The bitmask of a dependent set.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+
+    Returns:
+        int: The bitmask of a circuit included in D.
+    """
+    for d in iter_bits(D):
+        if not is_independent(D & ~d):
+            D &= ~d
+    return D
+
+
+def circuit_masks_by_elimination(E: int, is_independent: Callable[[int], bool]) -> list[int]:
+    """Collect the circuits from the fundamental circuits of a basis by the circuit elimination.
+    A family of circuits including the fundamental circuits of a basis is the family of all the circuits
+    if and only if, for every C1 ≠ C2 in it and e ∈ C1 ∩ C2, (C1 ∪ C2) - {e} includes a member of it.
+    Hence a pair violating this yields a new circuit in (C1 ∪ C2) - {e}, and the cost depends on the number of circuits instead of 2^|E|.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+
+    Returns:
+        list[int]: The bitmasks of the circuits.
+    """
+    B = greedy_mask(0, E, is_independent)
+    # C(e, B) = { e } ∪ { b ∈ B : B - {b} ∪ {e} is independent }
+    Cs = [ e | sum(b for b in iter_bits(B) if is_independent(B & ~b | e)) for e in iter_bits(E & ~B) ]
+    found = set(Cs)
+    for k, C1 in enumerate(Cs):
+        for C2 in Cs[:k]:
+            for e in iter_bits(C1 & C2):
+                X = (C1 | C2) & ~e
+                if any(not C & ~X for C in Cs):
+                    continue
+                C3 = shrink_to_circuit(X, is_independent)
+                if C3 not in found:
+                    found.add(C3)
+                    Cs.append(C3)
+    return Cs
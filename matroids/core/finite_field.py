@@ -0,0 +1,191 @@
+from itertools import product
+from typing import Iterable, Sequence, Union
+
+
+def _prime_power(q: int) -> tuple[int, int]:
+    # (p, k) with q = p^k, or (0, 0) if q is not a prime power.
+    p = next((p for p in range(2, q + 1) if q % p == 0), 0)
+    k = 0
+    while p and q % p == 0:
+        q, k = q // p, k + 1
+    return (p, k) if p and q == 1 else (0, 0)
+
+
+class FiniteField(object):
+    """The finite field GF(q) of a prime power q = p^k, whose elements are the integers 0, 1, ..., q - 1.
+    An element a represents the polynomial Σ a_i x^i over GF(p), where a_i is the i-th digit of a in base p,
+    modulo a monic irreducible polynomial of degree k. The arithmetic is looked up in tables built once,
+    so that it is meant for small fields.
+    """
+
+    def __init__(self, q: int):
+        """
+        Args:
+            q (int): The order of the field.
+
+        Raises:
+            ValueError: if q is not a prime power.
+        """
+        p, k = _prime_power(q)
+        if not p:
+            raise ValueError(f"The order of a finite field must be a prime power, but {q} is given!")
+        self.__order, self.__characteristic, self.__degree = q, p, k
+        digits = lambda a: [ a // p ** i % p for i in range(k) ]
+        number = lambda ds: sum(d * p ** i for i, d in enumerate(ds))
+        self.__add = [ [ number([ (x + y) % p for x, y in zip(digits(a), digits(b)) ]) for b in range(q) ] for a in range(q) ]
+        for modulus in product(range(p), repeat=k):
+            # x^k = -Σ modulus_i x^i, and the modulus is irreducible if and only if there is no zero divisor.
+            mul = [ [ number(self.__multiply(digits(a), digits(b), modulus)) for b in range(q) ] for a in range(q) ]
+            if all(0 not in row[1:] for row in mul[1:]):
+                break
+        self.__mul = mul
+        self.__neg = [ row.index(0) for row in self.__add ]
+        self.__inv = [0] + [ row.index(1) for row in self.__mul[1:] ]
+
+    def __multiply(self, xs: list[int], ys: list[int], modulus: Sequence[int]) -> list[int]:
+        p, k = self.__characteristic, self.__degree
+        zs = [0] * (2 * k - 1)
+        for i, x in enumerate(xs):
+            for j, y in enumerate(ys):
+                zs[i + j] = (zs[i + j] + x * y) % p
+        for d in range(2 * k - 2, k - 1, -1):
+            c, zs[d] = zs[d], 0
+            for i, m in enumerate(modulus):
+                zs[d - k + i] = (zs[d - k + i] - c * m) % p
+        return zs[:k]
+
+    def __repr__(self) -> str:
+        return f"GF({self.__order})"
+
+    def __len__(self) -> int:
+        return self.__order
+
+    @property
+    def order(self) -> int:
+        return self.__order
+
+    @property
+    def characteristic(self) -> int:
+        return self.__characteristic
+
+    def element(self, x: int) -> int:
+        """Convert an integer to an element of the field. An integer is taken modulo p in a prime field GF(p),
+        while it must be one of 0, 1, ..., q - 1 in an extension field.
+
+        Args:
+            x (int): An integer.
+
+        Raises:
+            ValueError: if x is not an element of the extension field.
+
+        Returns:
+            int: The element of the field.
+        """
+        if self.__degree == 1:
+            return x % self.__characteristic
+        if not 0 <= x < self.__order:
+            raise ValueError(f"The elements of {self!r} are 0, 1, ..., {self.__order - 1}, but {x} is given!")
+        return x
+
+    def add(self, a: int, b: int) -> int:
+        return self.__add[a][b]
+
+    def sub(self, a: int, b: int) -> int:
+        return self.__add[a][self.__neg[b]]
+
+    def mul(self, a: int, b: int) -> int:
+        return self.__mul[a][b]
+
+    def neg(self, a: int) -> int:
+        return self.__neg[a]
+
+    def inv(self, a: int) -> int:
+        """Return the multiplicative inverse of a.
+
+        Raises:
+            ZeroDivisionError: if a is zero.
+        """
+        if a == 0:
+            raise ZeroDivisionError("0 has no inverse!!")
+        return self.__inv[a]
+
+    def determinant(self, matrix: Sequence[Sequence[int]]) -> int:
+        """Calculate the determinant of a square matrix by Gaussian elimination.
+
+        Args:
+            matrix (Sequence[Sequence[int]]): A square matrix over the field.
+
+        Returns:
+            int: The determinant.
+        """
+        add, mul, neg, inv = self.__add, self.__mul, self.__neg, self.__inv
+        rows = [ list(row) for row in matrix ]
+        det = 1
+        for j in range(len(rows)):
+            i = next((i for i in range(j, len(rows)) if rows[i][j]), None)
+            if i is None:
+                return 0
+            if i != j:
+                rows[i], rows[j] = rows[j], rows[i]
+                det = neg[det]
+            pivot = rows[j]
+            det = mul[det][pivot[j]]
+            scale = inv[pivot[j]]
+            for row in rows[j + 1:]:
+                if row[j]:
+                    # row -= (row[j] / pivot[j]) * pivot
+                    c = neg[mul[row[j]][scale]]
+                    for l in range(j, len(row)):
+                        row[l] = add[row[l]][mul[c][pivot[l]]]
+        return det
+
+    def echelon(self, vectors: Iterable[Sequence[int]], pivots: Union[dict[int, list[int]], None]=None) -> dict[int, list[int]]:
+        """Reduce vectors to an echelon form by Gaussian elimination.
+        Each pivot is kept with the index of its first nonzero entry, which is normalized to 1.
+
+        Args:
+            vectors (Iterable[Sequence[int]]): Vectors of the same length over the field.
+            pivots (Union[dict[int, list[int]], None], optional): An echelon form to be extended in place. Defaults to a new one.
+
+        Returns:
+            dict[int, list[int]]: The pivots keyed by the indices of their leading entries, which span the same space as the vectors.
+        """
+        pivots = {} if pivots is None else pivots
+        mul, inv = self.__mul, self.__inv
+        for vector in vectors:
+            v = self.reduce(vector, pivots)
+            j = next((j for j, x in enumerate(v) if x), None)
+            if j is not None:
+                scale = inv[v[j]]
+                pivots[j] = [ mul[scale][x] for x in v ]
+        return pivots
+
+    def reduce(self, vector: Sequence[int], pivots: dict[int, list[int]]) -> list[int]:
+        """Reduce a vector by an echelon form. The result is zero if and only if the vector is spanned by the pivots.
+
+        Args:
+            vector (Sequence[int]): A vector over the field.
+            pivots (dict[int, list[int]]): An echelon form of echelon.
+
+        Returns:
+            list[int]: The reduced vector, whose leading entry is not at the index of any pivot.
+        """
+        add, mul, neg = self.__add, self.__mul, self.__neg
+        v = list(vector)
+        for j in range(len(v)):
+            if v[j] and j in pivots:
+                # v -= v[j] * pivot, where the pivot vanishes before j.
+                c = neg[v[j]]
+                v = [ add[x][mul[c][y]] for x, y in zip(v, pivots[j]) ]
+        return v
+
+    def rank(self, vectors: Iterable[Sequence[int]]) -> int:
+        """Calculate the rank of vectors over the field by Gaussian elimination.
+
+        Args:
+            vectors (Iterable[Sequence[int]]): Vectors of the same length over the field.
+
+        Returns:
+            int: The dimension of the space spanned by the vectors.
+        """
+        return len(self.echelon(vectors))
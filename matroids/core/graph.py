@@ -0,0 +1,163 @@
+from typing import Any, Hashable, Iterable, Iterator, Sequence
+
+from .rational import RationalField
+
+Edge = tuple[Hashable, Hashable]
+
+
+class UnionFind(object):
+    """Disjoint sets of vertices, which are added when they first appear.
+    The roots are found with path halving and merged by size, so that each operation takes almost constant time.
+    """
+    def __init__(self):
+        self.__parent = {}
+        self.__size = {}
+
+    def find(self, x: Hashable) -> Hashable:
+        """Return the representative of the set containing x.
+
+        Args:
+            x (Hashable): A vertex.
+
+        Returns:
+            Hashable: The root of the set of x.
+        """
+        parent = self.__parent
+        if x not in parent:
+            parent[x], self.__size[x] = x, 1
+            return x
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: Hashable, y: Hashable) -> bool:
+        """Merge the sets containing x and y.
+
+        Args:
+            x (Hashable): A vertex.
+            y (Hashable): A vertex.
+
+        Returns:
+            bool: True if x and y were in different sets, False otherwise.
+        """
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+        if self.__size[x] < self.__size[y]:
+            x, y = y, x
+        self.__parent[y] = x
+        self.__size[x] += self.__size[y]
+        return True
+
+
+def forest_rank(edges: Iterable[Edge]) -> int:
+    """Calculate the rank of edges in the cycle matroid, that is, |V(X)| - #components of the subgraph X.
+    Every edge joining two components decreases the number of components by one.
+
+    Args:
+        edges (Iterable[Edge]): The pairs of end vertices of edges.
+
+    Returns:
+        int: The number of edges in a spanning forest of the edges.
+    """
+    components = UnionFind()
+    return sum(1 for u, v in edges if components.union(u, v))
+
+
+def iter_cycle_masks(ends: Sequence[Edge]) -> Iterator[int]:
+    """Enumerate the cycles of a graph as bitmasks of edges, where the j-th edge corresponds to the j-th bit.
+    Each cycle C is found exactly once from its largest edge e = uv, as e together with a path from u to v
+    through the edges smaller than e, which are searched by depth-first search.
+
+    Args:
+        ends (Sequence[Edge]): The pairs of end vertices of edges. Loops and parallel edges are allowed.
+
+    Yields:
+        int: The bitmask of each cycle.
+    """
+    adjacency = {}
+    for j, (u, v) in enumerate(ends):
+        if u == v:
+            yield 1 << j
+            continue
+        # Simple paths from u to v, each of which is kept with the bitmask of its edges.
+        stack = [(u, 1 << j, {u})]
+        while stack:
+            x, path, visited = stack.pop()
+            for y, i in adjacency.get(x, ()):
+                if y == v:
+                    yield path | 1 << i
+                elif y not in visited:
+                    stack.append((y, path | 1 << i, visited | {y}))
+        adjacency.setdefault(u, []).append((v, j))
+        adjacency.setdefault(v, []).append((u, j))
+
+
+def count_spanning_forests(ends: Sequence[Edge]) -> int:
+    """Count the maximal spanning forests of a graph by Kirchhoff's matrix-tree theorem.
+    It is the product over the components of the determinants of their Laplacians with a row and a column removed,
+    which are calculated exactly by the Bareiss algorithm. Loops are in no spanning forest, and parallel edges are counted with multiplicity.
+
+    Args:
+        ends (Sequence[Edge]): The pairs of end vertices of edges.
+
+    Returns:
+        int: The number of spanning forests, i.e. the number of bases of the cycle matroid.
+    """
+    components = UnionFind()
+    for u, v in ends:
+        components.union(u, v)
+    members = {}
+    for u, v in ends:
+        for x in (u, v):
+            members.setdefault(components.find(x), {}).setdefault(x, None)
+    count = 1
+    for vertices in members.values():
+        # The vertices are indexed except the first one, whose row and column are removed.
+        index = { x: i - 1 for i, x in enumerate(vertices) }
+        laplacian = [ [0] * (len(index) - 1) for _ in range(len(index) - 1) ]
+        for u, v in ends:
+            if u == v or u not in index:
+                continue
+            i, j = index[u], index[v]
+            for k in (i, j):
+                if k >= 0:
+                    laplacian[k][k] += 1
+            if i >= 0 and j >= 0:
+                laplacian[i][j] -= 1
+                laplacian[j][i] -= 1
+        count *= int(RationalField().determinant(laplacian))
+    return count
+
+
+def incidence_matrix(ends: Sequence[Edge], one: Any, minus_one: Any, zero: Any=0) -> list[list[Any]]:
+    """Build the oriented incidence matrix of a graph, whose column of an edge uv has one at u and minus_one at v,
+    with the row of the first vertex of each component removed. It represents the cycle matroid over every field
+    with as many rows as the rank, where a loop gives the zero column.
+
+    Args:
+        ends (Sequence[Edge]): The pairs of end vertices of edges.
+        one (Any): The unit of the field.
+        minus_one (Any): The negative of the unit of the field.
+        zero (Any, optional): The zero of the field. Defaults to 0.
+
+    Returns:
+        list[list[Any]]: The matrix whose rows correspond to the remaining vertices in the order of their first appearance.
+    """
+    components = UnionFind()
+    for u, v in ends:
+        components.union(u, v)
+    vertices, first = {}, {}
+    for x in (x for u, v in ends for x in (u, v)):
+        root = first.setdefault(components.find(x), x)
+        if x != root and x not in vertices:
+            vertices[x] = len(vertices)
+    matrix = [ [zero] * len(ends) for _ in vertices ]
+    for j, (u, v) in enumerate(ends):
+        if u != v:
+            if u in vertices:
+                matrix[vertices[u]][j] = one
+            if v in vertices:
+                matrix[vertices[v]][j] = minus_one
+    return matrix
@@ -0,0 +1,113 @@
+from math import comb
+from typing import Hashable, Iterable, Sequence, Union
+
+
+class LaminarTree(object):
+    """The forest of a laminar family A_1, A_2, ..., A_m with capacities c_1, c_2, ..., c_m, where the parent of A_i is
+    the smallest set strictly including it (or an equal set listed later). Each element is counted at the smallest set containing it,
+    and the rank of X is found bottom-up as r_i(X) = min(c_i, |X ∩ (A_i - ∪ children)| + Σ_{children j} r_j(X)),
+    so that it takes O(|X| + m) time.
+    """
+
+    def __init__(self, family: Sequence[set[Hashable]], capacities: Sequence[int]):
+        """
+        Args:
+            family (Sequence[set[Hashable]]): A laminar family, any two of whose sets are disjoint or nested.
+            capacities (Sequence[int]): The capacities of the sets.
+
+        Raises:
+            ValueError: if the family is not laminar, or the capacities are not as many as the sets or negative.
+        """
+        if len(family) != len(capacities):
+            raise ValueError("The capacities must be as many as the sets!")
+        if any(c < 0 for c in capacities):
+            raise ValueError("The capacities must be non-negative!")
+        for i, A in enumerate(family):
+            for B in family[i + 1:]:
+                if A & B and not (A <= B or B <= A):
+                    raise ValueError("Any two sets of a laminar family must be disjoint or nested!")
+        # The nodes in the ascending order of their sizes, so that the children come before their parents.
+        self.__order = sorted(range(len(family)), key=lambda i: (len(family[i]), i))
+        position = { i: k for k, i in enumerate(self.__order) }
+        self.__parent = [ next((j for j in self.__order[position[i] + 1:] if family[i] <= family[j]), None) for i in range(len(family)) ]
+        self.__capacities = [*capacities]
+        self.__node_of = {}
+        for i in self.__order:
+            for e in family[i]:
+                self.__node_of.setdefault(e, i)
+        self.__sizes = [0] * len(family)
+        for i in self.__node_of.values():
+            self.__sizes[i] += 1
+
+    def node_of(self, e: Hashable) -> Union[int, None]:
+        """Return the index of the smallest set containing e, or None if e is in no set."""
+        return self.__node_of.get(e)
+
+    def parent(self, i: int) -> Union[int, None]:
+        """Return the index of the parent of the i-th set, or None if it is maximal."""
+        return self.__parent[i]
+
+    def __loads(self, nodes: Iterable[Union[int, None]]) -> tuple[list[int], int]:
+        # The numbers of elements below each node before the capacities are applied, and the rank.
+        loads, rank = [0] * len(self.__capacities), 0
+        for i in nodes:
+            if i is None:
+                rank += 1
+            else:
+                loads[i] += 1
+        for i in self.__order:
+            r = min(self.__capacities[i], loads[i])
+            if self.__parent[i] is None:
+                rank += r
+            else:
+                loads[self.__parent[i]] += r
+        return loads, rank
+
+    def rank(self, nodes: Iterable[Union[int, None]]) -> int:
+        """Calculate the rank of a set given by the nodes of its elements.
+
+        Args:
+            nodes (Iterable[Union[int, None]]): The index of the smallest set containing each element, or None if it is in no set.
+
+        Returns:
+            int: The rank.
+        """
+        return self.__loads(nodes)[1]
+
+    def saturated(self, nodes: Iterable[Union[int, None]]) -> list[bool]:
+        """Find the nodes an element of which is in the closure of a given set.
+        An element of A_i is spanned if and only if A_i or an ancestor of it is full, i.e. r_j(X) = c_j.
+
+        Args:
+            nodes (Iterable[Union[int, None]]): The index of the smallest set containing each element of a set X.
+
+        Returns:
+            list[bool]: Whether each node has a full ancestor or itself is full under X.
+        """
+        loads, _ = self.__loads(nodes)
+        saturated = [ loads[i] >= self.__capacities[i] for i in range(len(loads)) ]
+        for i in reversed(self.__order):
+            if self.__parent[i] is not None and saturated[self.__parent[i]]:
+                saturated[i] = True
+        return saturated
+
+    def independent_counts(self, free: int=0) -> list[int]:
+        """Count the independent sets of each size by multiplying the generating polynomials up the tree,
+        where the polynomial of a node is truncated at its capacity.
+
+        Args:
+            free (int, optional): The number of elements in no set. Defaults to 0.
+
+        Returns:
+            list[int]: The number of independent sets of size k for k = 0, 1, ..., r(M).
+        """
+        multiply = lambda f, g: [ sum(f[i] * g[k - i] for i in range(max(0, k - len(g) + 1), min(k, len(f) - 1) + 1)) for k in range(len(f) + len(g) - 1) ]
+        polynomials = [ [ comb(n, k) for k in range(n + 1) ] for n in self.__sizes ]
+        total = [ comb(free, k) for k in range(free + 1) ]
+        for i in self.__order:
+            f = polynomials[i][:self.__capacities[i] + 1]
+            if self.__parent[i] is None:
+                total = multiply(total, f)
+            else:
+                polynomials[self.__parent[i]] = multiply(polynomials[self.__parent[i]], f)
+        return total
@@ -0,0 +1,272 @@
+from functools import cached_property
+from typing import Callable, Iterable, Iterator, TypeVar, Union
+
+from .bitset import BitEncoder
+
+T = TypeVar('T')
+
+
+def hasse_diagram_of_flats(E: int, closure: Callable[[int], int]) -> tuple[list[list[int]], dict[int, list[int]]]:
+    """Generate the lattice of flats level by level from cl(∅).
+    In a matroid, the flats covering a flat F are exactly cl(F ∪ {e}) for e ∈ E - F,
+    and every e ∈ cl(F ∪ {e}) - F gives the same cover. Hence each cover costs just one call of the closure,
+    and the number of calls is the number of cover relations, which is at most (#flats)・n.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        closure (Callable[[int], int]): The closure operator of a matroid on bitmasks.
+
+    Returns:
+        tuple[list[list[int]], dict[int, list[int]]]: The flats grouped by rank, and the upper covers of each flat.
+    """
+    bottom = closure(0)
+    levels = [[bottom]]
+    covers = {}
+    while True:
+        next_level = {}
+        for F in levels[-1]:
+            upper = []
+            rest = E & ~F
+            while rest:
+                e = rest & -rest
+                G = closure(F | e)
+                upper.append(G)
+                next_level.setdefault(G, None)
+                rest &= ~G
+            covers[F] = upper
+        if not next_level:
+            return levels, covers
+        levels.append([*next_level])
+
+
+def flats_by_intersection(E: int, hyperplanes: Iterable[int]) -> list[int]:
+    """Generate the flats as the intersections of hyperplanes by breadth-first search from E.
+    Every flat is an intersection of hyperplanes, and so it is reached by intersecting the flats found so far with a hyperplane.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        hyperplanes (Iterable[int]): The bitmasks of the hyperplanes.
+
+    Returns:
+        list[int]: The bitmasks of the flats.
+    """
+    Hs = [*dict.fromkeys(hyperplanes)]
+    found = {E: None}
+    queue = [E]
+    for F in queue:
+        for H in Hs:
+            G = F & H
+            if G not in found:
+                found[G] = None
+                queue.append(G)
+    return queue
+
+
+class FlatLattice(object):
+    """The lattice of flats of a matroid, whose flats are stored as bitmasks grouped by rank with their cover relations.
+    Meets are intersections, joins are the smallest flats containing unions,
+    and the Möbius function from the bottom is computed once for the Whitney numbers and the characteristic polynomial.
+    """
+
+    def __init__(self, encoder: BitEncoder, closure: Callable[[int], int]):
+        """Build the lattice of flats with one call of a closure operator per cover relation.
+
+        Args:
+            encoder (BitEncoder): The encoder of the ground set.
+            closure (Callable[[int], int]): The closure operator of a matroid on bitmasks of encoder.
+        """
+        self.__encoder = encoder
+        levels, covers = hasse_diagram_of_flats(encoder.full, closure)
+        self.__levels = tuple(map(tuple, levels))
+        self.__covers = { F: tuple(Gs) for F, Gs in covers.items() }
+        self.__ranks = { F: k for k, level in enumerate(self.__levels) for F in level }
+        self.__lower_covers = { F: [] for F in self.__ranks }
+        for F, Gs in self.__covers.items():
+            for G in Gs:
+                self.__lower_covers[G].append(F)
+
+    def __repr__(self) -> str:
+        return f"FlatLattice(rank={self.rank}, flats={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.__ranks)
+
+    def __iter__(self) -> Iterator[set[T]]:
+        decode = self.__encoder.decode
+        return (decode(F) for level in self.__levels for F in level)
+
+    def __contains__(self, X: Union[set[T], int]) -> bool:
+        mask = X if isinstance(X, int) else self.__encoder.encode(X)
+        return mask in self.__ranks
+
+    def __mask(self, X: Union[set[T], int]) -> int:
+        return X if isinstance(X, int) else self.__encoder.encode(X)
+
+    @property
+    def encoder(self) -> BitEncoder:
+        return self.__encoder
+
+    @property
+    def rank(self) -> int:
+        """Return the rank of the matroid, i.e. the height of the lattice."""
+        return len(self.__levels) - 1
+
+    @property
+    def bottom(self) -> int:
+        """Return the bitmask of the least flat cl(∅), i.e. the set of loops."""
+        return self.__levels[0][0]
+
+    @property
+    def top(self) -> int:
+        """Return the bitmask of the greatest flat E."""
+        return self.__levels[-1][0]
+
+    def flats(self, rank: Union[int, None]=None) -> tuple[int, ...]:
+        """Return the bitmasks of the flats of a given rank, or all the flats if no rank is given.
+
+        Args:
+            rank (Union[int, None], optional): The rank of the flats. Defaults to None.
+
+        Returns:
+            tuple[int, ...]: The bitmasks of the flats.
+        """
+        if rank is None:
+            return tuple(F for level in self.__levels for F in level)
+        if 0 <= rank <= self.rank:
+            return self.__levels[rank]
+        return ()
+
+    def hyperplanes(self) -> tuple[int, ...]:
+        """Return the bitmasks of the hyperplanes, the flats of rank r(M) - 1."""
+        return self.flats(self.rank - 1)
+
+    def rank_of(self, F: Union[set[T], int]) -> int:
+        """Return the rank of a flat.
+
+        Args:
+            F (Union[set[T], int]): A flat or its bitmask.
+
+        Raises:
+            KeyError: if F is not a flat.
+
+        Returns:
+            int: The rank of F.
+        """
+        return self.__ranks[self.__mask(F)]
+
+    def upper_covers(self, F: Union[set[T], int]) -> tuple[int, ...]:
+        """Return the bitmasks of the flats covering a flat F. They partition E - F after F is removed from them.
+
+        Args:
+            F (Union[set[T], int]): A flat or its bitmask.
+
+        Raises:
+            KeyError: if F is not a flat.
+
+        Returns:
+            tuple[int, ...]: The bitmasks of the flats covering F.
+        """
+        return self.__covers[self.__mask(F)]
+
+    def lower_covers(self, F: Union[set[T], int]) -> tuple[int, ...]:
+        """Return the bitmasks of the flats covered by a flat F.
+
+        Args:
+            F (Union[set[T], int]): A flat or its bitmask.
+
+        Raises:
+            KeyError: if F is not a flat.
+
+        Returns:
+            tuple[int, ...]: The bitmasks of the flats covered by F.
+        """
+        return tuple(self.__lower_covers[self.__mask(F)])
+
+    def closure(self, X: Union[set[T], int]) -> int:
+        """Find the smallest flat containing X by climbing the covers from the bottom.
+        Since the covers of F partition E - F, an element e of X - F lies in exactly one cover,
+        so it takes at most r(M) steps, each scanning the covers of a single flat.
+
+        Args:
+            X (Union[set[T], int]): A subset of the ground set or its bitmask.
+
+        Returns:
+            int: The bitmask of the closure of X.
+        """
+        X = self.__mask(X)
+        F = self.bottom
+        while X & ~F:
+            e = X & ~F & -(X & ~F)
+            F = next(G for G in self.__covers[F] if G & e)
+        return F
+
+    def meet(self, F: Union[set[T], int], G: Union[set[T], int]) -> int:
+        """Return the meet of two flats, which is their intersection."""
+        return self.__mask(F) & self.__mask(G)
+
+    def join(self, F: Union[set[T], int], G: Union[set[T], int]) -> int:
+        """Return the join of two flats, which is the closure of their union."""
+        return self.closure(self.__mask(F) | self.__mask(G))
+
+    @cached_property
+    def __mobius_from_bottom(self) -> dict[int, int]:
+        # μ(0, 0) = 1 and μ(0, F) = -Σ_{G < F} μ(0, G), where the flats below F are collected through the lower covers.
+        mu = { self.bottom: 1 }
+        for level in self.__levels[1:]:
+            for F in level:
+                mu[F] = -sum(mu[G] for G in self.__down_set(F) if G != F)
+        return mu
+
+    def __down_set(self, F: int) -> list[int]:
+        found = { F: None }
+        stack = [F]
+        while stack:
+            for G in self.__lower_covers[stack.pop()]:
+                if G not in found:
+                    found[G] = None
+                    stack.append(G)
+        return [*found]
+
+    def mobius(self, F: Union[set[T], int], G: Union[set[T], int]) -> int:
+        """Calculate the Möbius function μ(F, G) of the lattice of flats.
+
+        Args:
+            F (Union[set[T], int]): A flat or its bitmask.
+            G (Union[set[T], int]): A flat or its bitmask.
+
+        Raises:
+            KeyError: if F or G is not a flat.
+
+        Returns:
+            int: μ(F, G), which is 0 unless F ⊆ G.
+        """
+        F, G = self.__mask(F), self.__mask(G)
+        if F not in self.__ranks or G not in self.__ranks:
+            raise KeyError("Both F and G need to be flats!!")
+        if F & ~G:
+            return 0
+        if F == self.bottom:
+            return self.__mobius_from_bottom[G]
+        # The interval [F, G] is walked upwards from F.
+        interval = sorted((H for H in self.__down_set(G) if not F & ~H), key=self.__ranks.__getitem__)
+        mu = {}
+        for H in interval:
+            mu[H] = 1 if H == F else -sum(mu[K] for K in interval if K in mu and K != H and not K & ~H)
+        return mu[G]
+
+    def whitney_numbers_of_the_first_kind(self) -> list[int]:
+        """Calculate the Whitney numbers of the first kind w_k = Σ_{r(F) = k} μ(cl(∅), F) for k = 0, 1, ..., r(M).
+
+        Returns:
+            list[int]: The Whitney numbers of the first kind.
+        """
+        mu = self.__mobius_from_bottom
+        return [ sum(mu[F] for F in level) for level in self.__levels ]
+
+    def whitney_numbers_of_the_second_kind(self) -> list[int]:
+        """Calculate the Whitney numbers of the second kind W_k, the number of flats of rank k, for k = 0, 1, ..., r(M).
+
+        Returns:
+            list[int]: The Whitney numbers of the second kind.
+        """
+        return [ len(level) for level in self.__levels ]
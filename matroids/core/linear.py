@@ -0,0 +1,68 @@
+from typing import Any, Sequence, Union
+
+from .bitset import iter_bits
+from .finite_field import FiniteField
+from .rational import RationalField
+
+Field = Union[FiniteField, RationalField]
+
+
+class PrefixEchelon(object):
+    """A rank oracle on bitmasks of columns which keeps the echelon forms of a chain of subsets X_1 ⊂ X_2 ⊂ ... ⊂ X_k,
+    one element larger at each step, that were queried last. A query X is answered from the largest X_i ⊆ X
+    by eliminating only the columns of X - X_i, and the chain is cut there and extended to X.
+    Since the depth-first enumerations and the greedy algorithm grow a subset by one element at a time,
+    most queries cost the elimination of a single column.
+    """
+
+    def __init__(self, field: Field, columns: Sequence[Sequence[Any]]):
+        """
+        Args:
+            field (Field): The field of the entries.
+            columns (Sequence[Sequence[Any]]): The columns, where the j-th column corresponds to the j-th bit.
+        """
+        self.__field = field
+        self.__columns = columns
+        self.__chain = [(0, {})]
+
+    def echelon(self, X: int) -> dict[int, list[Any]]:
+        """Return an echelon form of the columns of X. It must not be modified.
+
+        Args:
+            X (int): The bitmask of a subset of the columns.
+
+        Returns:
+            dict[int, list[Any]]: The pivots keyed by the indices of their leading entries.
+        """
+        chain = self.__chain
+        while chain[-1][0] & ~X:
+            chain.pop()
+        Y, pivots = chain[-1]
+        for b in iter_bits(X & ~Y):
+            Y |= b
+            pivots = self.__field.echelon([self.__columns[b.bit_length() - 1]], dict(pivots))
+            chain.append((Y, pivots))
+        return pivots
+
+    def rank(self, X: int) -> int:
+        """Calculate the rank of the columns of X.
+
+        Args:
+            X (int): The bitmask of a subset of the columns.
+
+        Returns:
+            int: The rank.
+        """
+        return len(self.echelon(X))
+
+    def spans(self, X: int, v: Sequence[Any]) -> bool:
+        """Check whether a vector is spanned by the columns of X.
+
+        Args:
+            X (int): The bitmask of a subset of the columns.
+            v (Sequence[Any]): A vector.
+
+        Returns:
+            bool: True if v is a linear combination of the columns of X, False otherwise.
+        """
+        return not any(self.__field.reduce(v, self.echelon(X)))
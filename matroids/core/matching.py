@@ -0,0 +1,129 @@
+from collections import deque
+from typing import Hashable, Iterable, Mapping, Sequence
+
+from .bitset import iter_bits
+
+
+def augment(x: Hashable, adjacency: Mapping[Hashable, Sequence[Hashable]], mates: dict[Hashable, Hashable]) -> bool:
+    """Search an augmenting path from an unmatched left vertex x by depth-first search, and flip it if it is found.
+
+    Args:
+        x (Hashable): An unmatched left vertex.
+        adjacency (Mapping[Hashable, Sequence[Hashable]]): The right vertices adjacent to each left vertex.
+        mates (dict[Hashable, Hashable]): The matching as the map from the matched right vertices to their left vertices,
+                                          which is updated in place.
+
+    Returns:
+        bool: True if the matching is augmented, False otherwise.
+    """
+    # path[i] is the edge from the left vertex of stack[i] to the right vertex through which stack[i + 1] is reached.
+    visited, stack, path = set(), [(x, iter(adjacency[x]))], []
+    while stack:
+        u, neighbors = stack[-1]
+        for s in neighbors:
+            if s in visited:
+                continue
+            visited.add(s)
+            path.append((u, s))
+            if s not in mates:
+                for v, t in path:
+                    mates[t] = v
+                return True
+            stack.append((mates[s], iter(adjacency[mates[s]])))
+            break
+        else:
+            stack.pop()
+            if path:
+                path.pop()
+    return False
+
+
+def maximum_matching(left: Iterable[Hashable], adjacency: Mapping[Hashable, Sequence[Hashable]]) -> dict[Hashable, Hashable]:
+    """Find a maximum matching of a bipartite graph by the Hopcroft-Karp algorithm.
+    Each phase finds the shortest augmenting paths by breadth-first search from the unmatched left vertices,
+    and augments a maximal set of disjoint ones along the layers, so that there are O(√V) phases of O(E) time.
+
+    Args:
+        left (Iterable[Hashable]): The left vertices.
+        adjacency (Mapping[Hashable, Sequence[Hashable]]): The right vertices adjacent to each left vertex.
+
+    Returns:
+        dict[Hashable, Hashable]: The matching as the map from the matched right vertices to their left vertices.
+    """
+    left = [*left]
+    mates, matched = {}, {}
+    while True:
+        # The layers of the left vertices by the length of the shortest alternating paths from the unmatched ones.
+        layer = { x: 0 for x in left if x not in matched }
+        queue, reachable = deque(layer), False
+        while queue:
+            u = queue.popleft()
+            for s in adjacency[u]:
+                v = mates.get(s)
+                if v is None:
+                    reachable = True
+                elif v not in layer:
+                    layer[v] = layer[u] + 1
+                    queue.append(v)
+        if not reachable:
+            return mates
+        dead = set()
+        for x in left:
+            if x in matched or x not in layer:
+                continue
+            stack, path = [(x, iter(adjacency[x]))], []
+            while stack:
+                u, neighbors = stack[-1]
+                for s in neighbors:
+                    v = mates.get(s)
+                    if v is None or (v not in dead and layer.get(v) == layer[u] + 1):
+                        path.append((u, s))
+                        break
+                else:
+                    dead.add(u)
+                    stack.pop()
+                    if path:
+                        path.pop()
+                    continue
+                if v is None:
+                    for w, t in path:
+                        mates[t], matched[w] = w, t
+                    # The vertices on the flipped path are not used again in this phase.
+                    dead.update(w for w, _ in path)
+                    break
+                stack.append((v, iter(adjacency[v])))
+
+
+class IncrementalMatching(object):
+    """A rank oracle of a transversal matroid on bitmasks, which keeps the maximum matchings of a chain of subsets
+    X_1 ⊂ X_2 ⊂ ... ⊂ X_k, one element larger at each step, that were queried last. A query X is answered from the largest X_i ⊆ X,
+    whose matching is extended by an augmenting path search for each element of X - X_i.
+    """
+
+    def __init__(self, adjacency: Sequence[Sequence[Hashable]]):
+        """
+        Args:
+            adjacency (Sequence[Sequence[Hashable]]): The sets containing each element, where the j-th element corresponds to the j-th bit.
+        """
+        self.__adjacency = dict(enumerate(adjacency))
+        self.__chain = [(0, {})]
+
+    def rank(self, X: int) -> int:
+        """Calculate the size of a maximum matching of the elements of X.
+
+        Args:
+            X (int): The bitmask of a subset of the elements.
+
+        Returns:
+            int: The rank of X.
+        """
+        chain = self.__chain
+        while chain[-1][0] & ~X:
+            chain.pop()
+        Y, mates = chain[-1]
+        for b in iter_bits(X & ~Y):
+            Y |= b
+            mates = dict(mates)
+            augment(b.bit_length() - 1, self.__adjacency, mates)
+            chain.append((Y, mates))
+        return len(mates)
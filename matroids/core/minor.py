@@ -0,0 +1,131 @@
+from itertools import combinations
+from math import inf
+from typing import Iterator, Sequence, Union
+
+from .bitset import iter_bits, popcount
+
+
+def _has_short_circuit(Bs: Sequence[int], E: int, size: int) -> bool:
+    # Whether a subset of E of the given size, or equivalently of at most the given size, is included in no basis.
+    return any(all(X & ~B for B in Bs) for X in map(sum, combinations(iter_bits(E), size)))
+
+
+def _girth(Bs: Sequence[int], E: int) -> Union[int, float]:
+    # The size of the smallest dependent subset of E. It is ∞ if E itself is a basis.
+    r = popcount(Bs[0]) if Bs else 0
+    return next((size for size in range(1, r + 2) if _has_short_circuit(Bs, E, size)), inf)
+
+
+def _pair_counts(Bs: Sequence[int]) -> dict[tuple[int, int], int]:
+    # The number of bases containing both x and y for each pair of bits x, y (including x = y).
+    counts = {}
+    for B in Bs:
+        bits = [*iter_bits(B)]
+        for x in bits:
+            for y in bits:
+                counts[x, y] = counts.get((x, y), 0) + 1
+    return counts
+
+
+def mask_isomorphism(Bs1: Sequence[int], E1: int, Bs2: Sequence[int], E2: int) -> Union[dict[int, int], None]:
+    """Find an isomorphism between two matroids given by bitmasks of their bases.
+    Elements are matched by backtracking only to elements in the same number of bases,
+    and every matched pair must be in the same number of bases as its image.
+
+    Args:
+        Bs1 (Sequence[int]): The bitmasks of the bases of the first matroid.
+        E1 (int): The bitmask of the ground set of the first matroid.
+        Bs2 (Sequence[int]): The bitmasks of the bases of the second matroid.
+        E2 (int): The bitmask of the ground set of the second matroid.
+
+    Returns:
+        Union[dict[int, int], None]: The map from the bits of E1 to the bits of E2, or None if they are not isomorphic.
+    """
+    if popcount(E1) != popcount(E2) or len(Bs1) != len(Bs2):
+        return None
+    degree1 = { x: sum(1 for B in Bs1 if B & x) for x in iter_bits(E1) }
+    degree2 = { y: sum(1 for B in Bs2 if B & y) for y in iter_bits(E2) }
+    if sorted(degree1.values()) != sorted(degree2.values()):
+        return None
+    pairs1, pairs2 = _pair_counts(Bs1), _pair_counts(Bs2)
+    # The elements of rarer degrees are matched first since they have fewer candidates.
+    frequency = { k: list(degree1.values()).count(k) for k in degree1.values() }
+    order = sorted(degree1, key=lambda x: (frequency[degree1[x]], x))
+    targets = set(Bs2)
+
+    def extend(i: int, mapping: dict[int, int], used: int) -> Union[dict[int, int], None]:
+        if i == len(order):
+            image = lambda B: sum(mapping[x] for x in iter_bits(B))
+            return dict(mapping) if all(image(B) in targets for B in Bs1) else None
+        x = order[i]
+        for y in iter_bits(E2 & ~used):
+            if degree2[y] != degree1[x] or any(pairs1.get((x, z), 0) != pairs2.get((y, mapping[z]), 0) for z in order[:i]):
+                continue
+            mapping[x] = y
+            found = extend(i + 1, mapping, used | y)
+            if found is not None:
+                return found
+            del mapping[x]
+        return None
+
+    return extend(0, {}, 0)
+
+
+def _subsets_with_bases(E: int, size: int, Bs: list[int], least: int, inside: bool) -> Iterator[tuple[int, list[int]]]:
+    # Enumerate X ⊆ E of the given size with the bases B including X if inside is True, or disjoint from X otherwise.
+    # Since the bases only decrease as X grows, a branch is pruned when fewer than least bases remain.
+    stack = [(0, E, Bs)]
+    while stack:
+        X, rest, BsX = stack.pop()
+        if popcount(X) == size:
+            yield X, BsX
+            continue
+        for b in iter_bits(rest):
+            BsXb = [ B for B in BsX if bool(B & b) is inside ]
+            if len(BsXb) >= least:
+                stack.append((X | b, rest & ~((b << 1) - 1), BsXb))
+
+
+def find_minor_masks(Bs: Sequence[int], E: int, Ns: Sequence[int], F: int) -> Union[tuple[int, int, dict[int, int]], None]:
+    """Search a minor M / C \\ D isomorphic to N, where C is independent and D is coindependent in M.
+    Then |C| = r(M) - r(N), |D| = r*(M) - r*(N), the bases of M / C are { B - C : C ⊆ B ∈ Bs },
+    and the bases of M / C \\ D are those disjoint from D. The search prunes with
+    - the rank and the corank,
+    - the number of bases, which never increases along C and D and must be equal to that of N at the end,
+    - the girth, since every circuit of N is a circuit of M / C,
+    and the minors visited through different pairs (C, D) are tested only once.
+
+    Args:
+        Bs (Sequence[int]): The bitmasks of the bases of M.
+        E (int): The bitmask of the ground set of M.
+        Ns (Sequence[int]): The bitmasks of the bases of N.
+        F (int): The bitmask of the ground set of N.
+
+    Returns:
+        Union[tuple[int, int, dict[int, int]], None]: The bitmasks of C and D with an isomorphism from the bits of E - C - D to those of F,
+                                                      or None if M has no minor isomorphic to N.
+    """
+    if not Bs or not Ns:
+        return None
+    r, r_N = popcount(Bs[0]), popcount(Ns[0])
+    k, d = r - r_N, (popcount(E) - r) - (popcount(F) - r_N)
+    if k < 0 or d < 0 or len(Ns) > len(Bs):
+        return None
+    b_N, g_N = len(Ns), _girth(Ns, F)
+    visited = set()
+    for C, BsC in _subsets_with_bases(E, k, [*Bs], b_N, inside=True):
+        BsC = [ B & ~C for B in BsC ]
+        if g_N < inf and not _has_short_circuit(BsC, E & ~C, g_N):
+            continue
+        for D, BsCD in _subsets_with_bases(E & ~C, d, BsC, b_N, inside=False):
+            if len(BsCD) != b_N:
+                continue
+            R = E & ~C & ~D
+            key = (R, frozenset(BsCD))
+            if key in visited:
+                continue
+            visited.add(key)
+            isomorphism = mask_isomorphism(BsCD, R, Ns, F)
+            if isomorphism is not None:
+                return C, D, isomorphism
+    return None
@@ -0,0 +1,107 @@
+from typing import Callable, Iterable, TypeVar, Union
+
+from .bitset import BitFamily
+
+T = TypeVar('T')
+
+
+def greedy_independent_subset( X             : Iterable[T]
+                             , is_independent: Callable[[set[T]], bool]
+                             , I             : Union[set[T], None]=None) -> set[T]:
+    """Grow a maximal independent subset of X greedily, by the augmentation property of independent sets.
+    It takes just |X| calls of the independence oracle.
+
+    Args:
+        X (Iterable[T]): A subset of the ground set. Its elements are tried in the order of iteration.
+        is_independent (Callable[[set[T]], bool]): An independence oracle.
+        I (Union[set[T], None], optional): An independent set to be extended. Defaults to the empty set.
+
+    Returns:
+        set[T]: A maximal independent subset of I ∪ X including I.
+    """
+    I = set() if I is None else set(I)
+    for e in X:
+        if e not in I and is_independent(I | {e}):
+            I.add(e)
+    return I
+
+
+def greedy_rank(X: Iterable[T], is_independent: Callable[[set[T]], bool]) -> int:
+    """Calculate the rank of X as the size of a maximal independent subset grown greedily.
+
+    Args:
+        X (Iterable[T]): A subset of the ground set.
+        is_independent (Callable[[set[T]], bool]): An independence oracle.
+
+    Returns:
+        int: The rank of X.
+    """
+    return len(greedy_independent_subset(X, is_independent))
+
+
+def oracle_closure(X: set[T], E: Iterable[T], is_independent: Callable[[set[T]], bool]) -> set[T]:
+    """Find the closure of X with |X| + |E| calls of the independence oracle.
+    If I is a maximal independent subset of X, then cl(X) = X ∪ { e ∈ E - X : I ∪ {e} is dependent }.
+
+    Args:
+        X (set[T]): A subset of the ground set.
+        E (Iterable[T]): The ground set.
+        is_independent (Callable[[set[T]], bool]): An independence oracle.
+
+    Returns:
+        set[T]: The closure of X.
+    """
+    I = greedy_independent_subset(X, is_independent)
+    return set(X) | { e for e in E if e not in X and not is_independent(I | {e}) }
+
+
+def oracle_is_basis(X: set[T], E: Iterable[T], is_independent: Callable[[set[T]], bool]) -> bool:
+    """Check whether X is a basis, that is, a maximal independent set, with at most |E - X| + 1 oracle calls.
+
+    Args:
+        X (set[T]): A subset of the ground set.
+        E (Iterable[T]): The ground set.
+        is_independent (Callable[[set[T]], bool]): An independence oracle.
+
+    Returns:
+        bool: True if X is a basis, False otherwise.
+    """
+    return is_independent(X) and all(not is_independent(X | {e}) for e in E if e not in X)
+
+
+def oracle_fundamental_circuit(e: T, B: set[T], is_independent: Callable[[set[T]], bool]) -> set[T]:
+    """Find the fundamental circuit C(e, B) with |B| calls of the independence oracle.
+    An element b ∈ B lies in C(e, B) if and only if (B - {b}) ∪ {e} is again a basis.
+
+    Args:
+        e (T): An element in E - B.
+        B (set[T]): A basis.
+        is_independent (Callable[[set[T]], bool]): An independence oracle.
+
+    Returns:
+        set[T]: The fundamental circuit of e with respect to B.
+    """
+    return {e} | { b for b in B if is_independent((B - {b}) | {e}) }
+
+
+def indexed_greedy_rank(X: Iterable[T], Is: BitFamily) -> int:
+    """Calculate the rank of X by growing a maximal independent subset greedily,
+    where each independence test is a lookup of a bitmask in the hash set of the independent sets.
+    It takes O(|X|) lookups instead of scanning all the independent sets.
+
+    Args:
+        X (Iterable[T]): A subset of the ground set.
+        Is (BitFamily): The independent sets of a matroid encoded as bitmasks.
+
+    Returns:
+        int: The rank of X.
+    """
+    bit = Is.encoder.bit
+    index = Is.index
+    I, r = 0, 0
+    for e in X:
+        b = bit(e)
+        if b and not (I & b) and (I | b) in index:
+            I |= b
+            r += 1
+    return r
@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Union
+
+# The number of worker processes used by the checkers when no workers are specified.
+# 1 means that every check runs in the current process.
+DEFAULT_WORKERS = 1
+
+# Each worker receives the shared data of a check once, when it starts.
+_shared_data = None
+
+# A check is sharded into this many shards per worker so that the shards finish at different times,
+# which makes the cancellation after a violation effective.
+_SHARDS_PER_WORKER = 4
+
+
+def resolve_workers(workers: Union[int, None]=None) -> int:
+    """Decide the number of worker processes.
+
+    Args:
+        workers (Union[int, None], optional): The number of workers. None means DEFAULT_WORKERS,
+                                              and 0 or a negative number means the number of CPUs. Defaults to None.
+
+    Returns:
+        int: The number of worker processes.
+    """
+    if workers is None:
+        workers = DEFAULT_WORKERS
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def split_range(size: int, shards: int, pairwise: bool=False) -> list[tuple[int, int]]:
+    """Split range(size) into consecutive shards of almost equal work.
+    If pairwise is True, the i-th row is assumed to be paired with the rows after it, so its work is size - i - 1.
+
+    Args:
+        size (int): The number of rows.
+        shards (int): The maximum number of shards.
+        pairwise (bool, optional): Whether the work of a row decreases linearly. Defaults to False.
+
+    Returns:
+        list[tuple[int, int]]: The pairs (start, stop) of the shards.
+    """
+    weights = [size - i - 1 for i in range(size)] if pairwise else [1] * size
+    total = sum(weights)
+    if total == 0:
+        return [(0, size)] if size else []
+    target = total / max(1, shards)
+    bounds, start, acc = [], 0, 0
+    for i, w in enumerate(weights):
+        acc += w
+        if acc >= target and i + 1 < size:
+            bounds.append((start, i + 1))
+            start, acc = i + 1, 0
+    bounds.append((start, size))
+    return bounds
+
+
+def _install(data: Any) -> None:
+    global _shared_data
+    _shared_data = data
+
+
+def _run_shard(kernel: Callable[[Any, int, int], bool], start: int, stop: int) -> bool:
+    return kernel(_shared_data, start, stop)
+
+
+def any_shard(kernel: Callable[[Any, int, int], bool], data: Any, size: int, workers: Union[int, None]=None, pairwise: bool=False) -> bool:
+    """Run kernel(data, start, stop) over the shards of range(size) and report whether any shard returns True.
+    The shards run in a process pool when more than one worker is requested,
+    and the remaining shards are cancelled as soon as a shard returns True.
+
+    Args:
+        kernel (Callable[[Any, int, int], bool]): A module-level function, so that it can be sent to the workers.
+        data (Any): Picklable data shared by all the shards, e.g. a tuple of bitmasks. It is sent to each worker once.
+        size (int): The number of rows to be sharded.
+        workers (Union[int, None], optional): The number of workers. Defaults to DEFAULT_WORKERS.
+        pairwise (bool, optional): Whether each row is paired with the rows after it. Defaults to False.
+
+    Returns:
+        bool: True if any shard returns True, False otherwise.
+    """
+    workers = resolve_workers(workers)
+    shards = split_range(size, workers * _SHARDS_PER_WORKER, pairwise)
+    if workers <= 1 or len(shards) <= 1:
+        return kernel(data, 0, size)
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_install, initargs=(data,))
+    try:
+        pending = { executor.submit(_run_shard, kernel, start, stop) for start, stop in shards }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            if any(future.result() for future in done):
+                return True
+        return False
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,145 @@
+from fractions import Fraction
+from math import gcd, lcm
+from typing import Iterable, Sequence, Union
+
+Number = Union[int, Fraction]
+
+
+def _integral(vector: Sequence[Number]) -> list[int]:
+    # The integer vector parallel to the given one, whose entries have no common divisor.
+    scale = lcm(*(Fraction(x).denominator for x in vector)) if vector else 1
+    v = [ int(Fraction(x) * scale) for x in vector ]
+    g = gcd(*v)
+    return [ x // g for x in v ] if g > 1 else v
+
+
+class RationalField(object):
+    """The field Q of rational numbers, whose elements are given as integers or fractions.
+    Every vector is scaled to an integer vector before the elimination, and the elimination is fraction-free,
+    so that no fraction appears during the computation and the entries are kept small by dividing the common divisors.
+    """
+
+    def __repr__(self) -> str:
+        return "QQ"
+
+    @property
+    def order(self) -> None:
+        return None
+
+    @property
+    def characteristic(self) -> int:
+        return 0
+
+    def element(self, x: Union[Number, str]) -> Fraction:
+        """Convert a number to a rational number.
+
+        Args:
+            x (Union[Number, str]): An integer, a fraction, or a string like "2/3".
+
+        Raises:
+            ValueError: if x is not a rational number.
+
+        Returns:
+            Fraction: The rational number.
+        """
+        try:
+            return Fraction(x)
+        except (TypeError, ValueError):
+            raise ValueError(f"{x!r} is not a rational number!")
+
+    def determinant(self, matrix: Sequence[Sequence[Number]]) -> Fraction:
+        """Calculate the determinant of a square matrix by the Bareiss algorithm,
+        where every entry in the elimination is a minor of the integral matrix and so the divisions are exact.
+
+        Args:
+            matrix (Sequence[Sequence[Number]]): A square matrix of rational numbers.
+
+        Returns:
+            Fraction: The determinant.
+        """
+        scales = [ lcm(*(Fraction(x).denominator for x in row)) if row else 1 for row in matrix ]
+        rows = [ [ int(Fraction(x) * s) for x in row ] for row, s in zip(matrix, scales) ]
+        n, sign, previous = len(rows), 1, 1
+        for k in range(n - 1):
+            i = next((i for i in range(k, n) if rows[i][k]), None)
+            if i is None:
+                return Fraction(0)
+            if i != k:
+                rows[i], rows[k] = rows[k], rows[i]
+                sign = -sign
+            pivot, pivot_row = rows[k][k], rows[k]
+            for i in range(k + 1, n):
+                row, c = rows[i], rows[i][k]
+                # The entries before k are no longer used.
+                rows[i] = row[:k + 1] + [ (pivot * x - c * y) // previous for x, y in zip(row[k + 1:], pivot_row[k + 1:]) ]
+            previous = pivot
+        det = rows[-1][-1] if n else 1
+        denominator = 1
+        for s in scales:
+            denominator *= s
+        return Fraction(sign * det, denominator)
+
+    def rank(self, vectors: Iterable[Sequence[Number]]) -> int:
+        """Calculate the rank of vectors by the Bareiss algorithm, skipping the columns without pivots.
+
+        Args:
+            vectors (Iterable[Sequence[Number]]): Vectors of the same length.
+
+        Returns:
+            int: The dimension of the space spanned by the vectors.
+        """
+        rows = [ _integral(v) for v in vectors ]
+        if not rows:
+            return 0
+        r, previous = 0, 1
+        for c in range(len(rows[0])):
+            i = next((i for i in range(r, len(rows)) if rows[i][c]), None)
+            if i is None:
+                continue
+            rows[i], rows[r] = rows[r], rows[i]
+            for i in range(r + 1, len(rows)):
+                for j in range(c + 1, len(rows[i])):
+                    rows[i][j] = (rows[r][c] * rows[i][j] - rows[i][c] * rows[r][j]) // previous
+                rows[i][c] = 0
+            previous = rows[r][c]
+            r += 1
+            if r == len(rows):
+                break
+        return r
+
+    def echelon(self, vectors: Iterable[Sequence[Number]], pivots: Union[dict[int, list[int]], None]=None) -> dict[int, list[int]]:
+        """Reduce vectors to an echelon form of primitive integer vectors by fraction-free elimination.
+
+        Args:
+            vectors (Iterable[Sequence[Number]]): Vectors of the same length.
+            pivots (Union[dict[int, list[int]], None], optional): An echelon form to be extended in place. Defaults to a new one.
+
+        Returns:
+            dict[int, list[int]]: The pivots keyed by the indices of their leading entries, which span the same space as the vectors.
+        """
+        pivots = {} if pivots is None else pivots
+        for vector in vectors:
+            v = self.reduce(vector, pivots)
+            j = next((j for j, x in enumerate(v) if x), None)
+            if j is not None:
+                pivots[j] = v
+        return pivots
+
+    def reduce(self, vector: Sequence[Number], pivots: dict[int, list[int]]) -> list[int]:
+        """Reduce a vector by an echelon form up to a nonzero scalar.
+        The result is zero if and only if the vector is spanned by the pivots.
+
+        Args:
+            vector (Sequence[Number]): A vector.
+            pivots (dict[int, list[int]]): An echelon form of echelon.
+
+        Returns:
+            list[int]: The reduced primitive integer vector, whose leading entry is not at the index of any pivot.
+        """
+        v = _integral(vector)
+        for j in range(len(v)):
+            if v[j] and j in pivots:
+                # v ← p[j]・v - v[j]・p, where the pivot p vanishes before j.
+                p = pivots[j]
+                v = _integral([ p[j] * x - v[j] * y for x, y in zip(v, p) ])
+        return v
@@ -0,0 +1,145 @@
+from itertools import combinations
+from time import monotonic
+from typing import Callable, Iterable, Union
+
+from .binary import fundamental_circuit_columns
+from .bitset import iter_bits, popcount
+from .enumeration import greedy_mask
+from .finite_field import FiniteField
+
+
+def _spanning_forest(supports: dict[int, list[int]]) -> set[tuple[int, int]]:
+    # The edges (i, j) of a spanning forest of the bipartite graph between the rows i and the columns j with supports[j] ∋ i.
+    neighbors = {}
+    for j, rows in supports.items():
+        neighbors.setdefault(("c", j), []).extend(("r", i) for i in rows)
+        for i in rows:
+            neighbors.setdefault(("r", i), []).append(("c", j))
+    forest, seen = set(), set()
+    for root in neighbors:
+        if root in seen:
+            continue
+        seen.add(root)
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            for v in neighbors[u]:
+                if v not in seen:
+                    seen.add(v)
+                    stack.append(v)
+                    (_, i), (_, j) = (u, v) if u[0] == "r" else (v, u)
+                    forest.add((i, j))
+    return forest
+
+
+def representation_matrix(E: int,
+                          is_independent: Callable[[int], bool],
+                          field: FiniteField,
+                          bases: Union[Iterable[int], None]=None,
+                          time_budget: Union[float, None]=None) -> Union[list[list[int]], None]:
+    """Find a matrix over a finite field representing the matroid given by an independence oracle.
+    If a matrix [I | A] represents M for a basis B, the entry of A at (b, e) is nonzero if and only if b ∈ C(e, B),
+    and its rows and columns can be scaled so that the entries on a spanning forest of the support of A are 1.
+    The other nonzero entries are searched by backtracking under the constraints that the square submatrix of A
+    on rows R ⊆ B and columns S ⊆ E - B is nonsingular if and only if (B - R) ∪ S is a basis.
+    A constraint is propagated when all but one of its entries x are fixed; since its determinant is a·x + b,
+    it excludes the value -b/a or forces it.
+
+    Args:
+        E (int): The bitmask of the ground set.
+        is_independent (Callable[[int], bool]): An independence oracle on bitmasks.
+        field (FiniteField): The field over which the matrix is searched.
+        bases (Union[Iterable[int], None], optional): The bitmasks of the bases if they are at hand. Defaults to None.
+        time_budget (Union[float, None], optional): The limit of seconds for the search. Defaults to None, i.e. no limit.
+
+    Raises:
+        TimeoutError: if the search takes more than time_budget seconds.
+
+    Returns:
+        Union[list[list[int]], None]: The r × n matrix whose j-th column corresponds to the j-th bit of E,
+                                      or None if the matroid is not representable over the field.
+    """
+    deadline = None if time_budget is None else monotonic() + time_budget
+
+    def check_deadline():
+        if deadline is not None and monotonic() > deadline:
+            raise TimeoutError(f"The search of a representation over {field!r} exceeded {time_budget} seconds!")
+
+    B = greedy_mask(0, E, is_independent)
+    r = popcount(B)
+    basis_set = None if bases is None else set(bases)
+    is_basis = (lambda X: X in basis_set) if basis_set is not None else is_independent
+
+    rows = [*iter_bits(B)]
+    columns = [*iter_bits(E & ~B)]
+    incidence = fundamental_circuit_columns(E, B, is_independent)
+    supports = { j: [ i for i in range(r) if incidence[e.bit_length() - 1] >> i & 1 ] for j, e in enumerate(columns) }
+    forest = _spanning_forest(supports)
+
+    # The entries of A, which are 0 off the support, 1 on the forest, and None until they are assigned.
+    A = [ [ 0 ] * len(columns) for _ in range(r) ]
+    variables = []
+    for j in range(len(columns)):
+        for i in supports[j]:
+            if (i, j) in forest:
+                A[i][j] = 1
+            else:
+                A[i][j] = None
+                variables.append((i, j))
+    order = { cell: k for k, cell in enumerate(variables) }
+
+    # Each constraint is attached to the variable assigned last among its entries, where it is propagated.
+    # The 1 × 1 submatrices are nonsingular exactly on the support, so they need no check.
+    constraints = [ [] for _ in variables ]
+    for k in range(2, min(r, len(columns)) + 1):
+        for R in combinations(range(r), k):
+            check_deadline()
+            X = B & ~sum(rows[i] for i in R)
+            for S in combinations(range(len(columns)), k):
+                nonsingular = is_basis(X | sum(columns[j] for j in S))
+                last = max((order[i, j] for i in R for j in S if (i, j) in order), default=None)
+                if last is not None:
+                    constraints[last].append((R, S, nonsingular))
+                elif bool(field.determinant([ [ A[i][j] for j in S ] for i in R ])) is not nonsingular:
+                    return None
+
+    def domain(v: int) -> list[int]:
+        i, j = variables[v]
+        values = set(range(1, field.order))
+        for R, S, nonsingular in constraints[v]:
+            A[i][j] = 0
+            b = field.determinant([ [ A[x][y] for y in S ] for x in R ])
+            A[i][j] = 1
+            a = field.sub(field.determinant([ [ A[x][y] for y in S ] for x in R ]), b)
+            A[i][j] = None
+            if a:
+                # det = a·x + b vanishes only at x = -b/a.
+                root = field.mul(field.neg(b), field.inv(a))
+                values = values - {root} if nonsingular else values & {root}
+            elif bool(b) is not nonsingular:
+                values = set()
+            if not values:
+                break
+        return sorted(values)
+
+    def search(v: int) -> bool:
+        check_deadline()
+        if v == len(variables):
+            return True
+        i, j = variables[v]
+        for value in domain(v):
+            A[i][j] = value
+            if search(v + 1):
+                return True
+        A[i][j] = None
+        return False
+
+    if not search(0):
+        return None
+    matrix = [ [ 0 ] * E.bit_length() for _ in range(r) ]
+    for i, b in enumerate(rows):
+        matrix[i][b.bit_length() - 1] = 1
+    for j, e in enumerate(columns):
+        for i in range(r):
+            matrix[i][e.bit_length() - 1] = A[i][j]
+    return matrix
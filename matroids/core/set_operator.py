@@ -3,6 +3,8 @@ from itertools import chain, combinations
 from operator import or_
 from typing import Any, Iterable, TypeVar
 
+from .bitset import BitEncoder, popcount
+
 T = TypeVar('T')
 
 def powset(E: set[T]) -> list[set[T]]:
@@ -30,16 +32,96 @@ def is_minimal(someset: set[T], set_collection: list[set[T]]) -> bool:
     return bool(someset) and all(map(lambda X: (X == set()) or not (X < someset), set_collection))
 
 
-def find_minimal_sets(set_collection: list[set[T]]) -> list[set[T]]:
-    """Find all of the minimal set in a given collection of sets
+class SubsetTrie(object):
+    """A trie of bitmasks keyed by their bits from the lowest, which answers whether it holds a subset of a given bitmask.
+    The search only follows the bits of the given bitmask, so it visits a small part of the trie.
+    """
+    def __init__(self, masks: Iterable[int]=()):
+        # Each node maps a bit to its child, and the key 0 marks the end of a stored bitmask.
+        self.__root = {}
+        for mask in masks:
+            self.add(mask)
+
+    def add(self, mask: int) -> None:
+        """Store a bitmask.
+
+        Args:
+            mask (int): A bitmask.
+        """
+        node = self.__root
+        while mask:
+            bit = mask & -mask
+            node = node.setdefault(bit, {})
+            mask ^= bit
+        node[0] = None
+
+    def has_subset_of(self, mask: int) -> bool:
+        """Check whether a stored bitmask is a subset of a given bitmask.
+
+        Args:
+            mask (int): A bitmask.
+
+        Returns:
+            bool: True if some stored bitmask X satisfies X ⊆ mask, False otherwise.
+        """
+        stack = [self.__root]
+        while stack:
+            node = stack.pop()
+            if 0 in node:
+                return True
+            stack.extend(child for bit, child in node.items() if bit & mask)
+        return False
+
+
+def minimal_masks(masks: Iterable[int]) -> list[int]:
+    """Find the minimal bitmasks, the members of the clutter, in a given collection of bitmasks.
+    The candidates are checked from the smallest against a subset trie of the minimal ones accepted so far.
+
+    Args:
+        masks (Iterable[int]): A collection of bitmasks.
+
+    Returns:
+        list[int]: The distinct minimal bitmasks in the order of their cardinalities.
+    """
+    accepted = SubsetTrie()
+    minimals = []
+    for mask in sorted(set(masks), key=popcount):
+        if not accepted.has_subset_of(mask):
+            accepted.add(mask)
+            minimals.append(mask)
+    return minimals
+
+
+def maximal_masks(masks: Iterable[int]) -> list[int]:
+    """Find the maximal bitmasks in a given collection of bitmasks.
+    X is maximal if and only if its complement in the union of the collection is minimal among the complements.
+
+    Args:
+        masks (Iterable[int]): A collection of bitmasks.
+
+    Returns:
+        list[int]: The distinct maximal bitmasks in the decreasing order of their cardinalities.
+    """
+    masks = set(masks)
+    full = reduce(or_, masks, 0)
+    return [ full & ~X for X in minimal_masks(full & ~X for X in masks) ]
+
+
+def find_minimal_sets(set_collection: list[set[T]], allow_emptyset: bool=False) -> list[set[T]]:
+    """Find all of the minimal set in a given collection of sets.
+    The sets are encoded as bitmasks once, and then the minimal ones are extracted by minimal_masks.
 
     Args:
         set_collection (list[set[T]]): A collection of sets
+        allow_emptyset (bool, optional): Whether the empty set can be minimal. If it is False, the empty set is ignored. Defaults to False.
 
     Returns:
-        list[set[T]]: All of the minimal sets in the given collection of sets.
+        list[set[T]]: All of the minimal sets in the given collection of sets, in the given order.
     """
-    return [s for s in set_collection if is_minimal(s, set_collection)]
+    encoder = BitEncoder(set().union(*set_collection))
+    masks = [*map(encoder.encode, set_collection)]
+    minimals = set(minimal_masks(X for X in masks if X or allow_emptyset))
+    return [ s for s, X in zip(set_collection, masks) if X in minimals ]
 
 
 def is_maximal(someset: set[T], set_collection: list[set[T]]) -> bool:
@@ -56,15 +138,19 @@ def is_maximal(someset: set[T], set_collection: list[set[T]]) -> bool:
 
 
 def find_maximal_sets(set_collection: list[set[T]]) -> list[set[T]]:
-    """Find all of the maximal set in a given collection of sets
+    """Find all of the maximal set in a given collection of sets.
+    The sets are encoded as bitmasks once, and then the maximal ones are extracted by maximal_masks.
 
     Args:
         set_collection (list[set[T]]): A collection of sets
 
     Returns:
-        list[set[T]]: All of the minimal sets in the given collection of sets.
+        list[set[T]]: All of the maximal sets in the given collection of sets, in the given order.
     """
-    return [s for s in set_collection if is_maximal(s, set_collection)]
+    encoder = BitEncoder(set().union(*set_collection))
+    masks = [*map(encoder.encode, set_collection)]
+    maximals = set(maximal_masks(masks))
+    return [ s for s, X in zip(set_collection, masks) if X in maximals ]
 
 
 infinite = 99999999
@@ -1,3 +1,5 @@
+from typing import Union
+
 from matroids.Matroid import Matroid
 
 class AG32prime(Matroid):
@@ -89,8 +91,8 @@ class AG32prime(Matroid):
             {2,5,7,8},{3,4,5,8},{3,6,7,8},{4,5,6,7},{1,2,3,5,7},{1,3,4,5,7},{1,3,5,6,7},{1,3,5,7,8}
         ]
     
-    def is_binary(self) -> bool:
-        return False
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
 
-    def is_ternary(self) -> bool:
-        return False
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
\ No newline at end of file
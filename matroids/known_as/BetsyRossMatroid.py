@@ -1,3 +1,5 @@
+from typing import Union
+
 from matroids.Matroid import Matroid
 
 class BetsyRossMatroid(Matroid):
@@ -90,8 +92,8 @@ class BetsyRossMatroid(Matroid):
             {1,4,5,6,7,8,9,10,11},{2,3,4,6,7,8,9,10,11},{3,4,5,6,7,8,9,10,11}
         ]
     
-    def is_binary(self) -> bool:
-        return False
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
 
-    def is_ternary(self) -> bool:
-        return False
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
\ No newline at end of file
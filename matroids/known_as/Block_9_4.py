@@ -1,3 +1,5 @@
+from typing import Union
+
 from matroids.Matroid import Matroid
 
 class Block_9_4(Matroid):
@@ -89,8 +91,8 @@ class Block_9_4(Matroid):
             {1,3,4,5,7,8},{1,3,5,6,8,9},{1,4,6,7,8,9},{2,3,4,6,8,9},{2,3,5,7,8,9},{2,4,5,6,7,8},{3,4,5,6,7,9}
         ]
     
-    def is_binary(self) -> bool:
-        return False
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
     
-    def is_ternary(self) -> bool:
-        return True
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.representation_over(3)) if certificate else True
\ No newline at end of file
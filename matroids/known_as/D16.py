@@ -1,3 +1,4 @@
+from typing import Union
 from matroids.CircuitsMatroid import CircuitsMatroid
 
 class D16(CircuitsMatroid):
@@ -110,8 +111,8 @@ class D16(CircuitsMatroid):
             {3,4,5,9,11,12,13,14},{3,4,6,7,8,10,13,14},{3,4,6,7,11,12,13,14},{3,4,7,8,9,12,13,14},{3,4,7,9,10,11,13,14}
         ]
     
-    def is_binary(self) -> bool:
-        return True
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.binary_representation()) if certificate else True
 
-    def is_ternary(self) -> bool:
-        return False
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
\ No newline at end of file
@@ -1,3 +1,7 @@
+from functools import cached_property
+from typing import Callable, Union
+
+from matroids.LinearMatroid import LinearMatroid
 from matroids.Matroid import Matroid
 
 class ExtendedTernaryGolayCode(Matroid):
@@ -15,6 +19,33 @@ class ExtendedTernaryGolayCode(Matroid):
     def size(self) -> int:
         return 12
     
+    @cached_property
+    def linear_matroid(self) -> LinearMatroid:
+        # A representation over GF(3), whose j-th column is the element j.
+        matrix = [
+            [1,0,0,0,0,0,1,1,2,1,2,0],
+            [0,1,0,0,0,0,1,1,1,2,0,2],
+            [0,0,1,0,0,0,1,2,2,0,1,2],
+            [0,0,0,1,0,0,1,2,0,2,2,1],
+            [0,0,0,0,1,0,1,0,1,1,1,1],
+            [0,0,0,0,0,1,0,1,2,2,1,1],
+        ]
+        # The columns are labelled in the order of self.encoder, so that both matroids encode a subset by the same bitmask.
+        return LinearMatroid([ [ row[e - 1] for e in self.encoder.elements ] for row in matrix ], field=3, labels=self.encoder.elements)
+
+    # The rank, the closure and the independence are answered by the representation without the families below.
+    @property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        return self.linear_matroid.independence_oracle
+
+    @property
+    def rank_function(self) -> Callable[[set[int]], int]:
+        return self.linear_matroid.rank_function
+
+    @property
+    def closure_function(self) -> Callable[[set[int]], set[int]]:
+        return self.linear_matroid.closure_function
+
     @property
     def independent_sets(self) -> list[set[int]]:
         return [
@@ -447,8 +478,8 @@ class ExtendedTernaryGolayCode(Matroid):
             {5,6,7,8,9,10},{5,6,7,8,11,12},{5,7,9,10,11,12},{6,8,9,10,11,12}
         ]
     
-    def is_binary(self) -> bool:
-        return False
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
 
-    def is_ternary(self) -> bool:
-        return True
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.linear_matroid.matrix) if certificate else True
\ No newline at end of file
@@ -1,3 +1,7 @@
+from functools import cached_property
+from typing import Callable, Union
+
+from matroids.BinaryMatroid import BinaryMatroid
 from matroids.Matroid import Matroid
 
 class FanoMatroid(Matroid):
@@ -15,6 +19,30 @@ class FanoMatroid(Matroid):
     def size(self) -> int:
         return 7
     
+    @cached_property
+    def binary_matroid(self) -> BinaryMatroid:
+        # A representation over GF(2), whose j-th column is the element j.
+        matrix = [
+            [1,0,0,0,1,1,1],
+            [0,1,0,1,0,1,1],
+            [0,0,1,1,1,0,1],
+        ]
+        # The columns are labelled in the order of self.encoder, so that both matroids encode a subset by the same bitmask.
+        return BinaryMatroid([ [ row[e - 1] for e in self.encoder.elements ] for row in matrix ], labels=self.encoder.elements)
+
+    # The rank, the closure and the independence are answered by the representation without the families below.
+    @property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        return self.binary_matroid.independence_oracle
+
+    @property
+    def rank_function(self) -> Callable[[set[int]], int]:
+        return self.binary_matroid.rank_function
+
+    @property
+    def closure_function(self) -> Callable[[set[int]], set[int]]:
+        return self.binary_matroid.closure_function
+
     @property
     def independent_sets(self) -> list[set[int]]:
         return [
@@ -49,8 +77,8 @@ class FanoMatroid(Matroid):
     def cocircuits(self) -> list[set[int]]:
         return [{1,2,3,7},{1,2,4,5},{1,3,4,6},{1,5,6,7},{2,3,5,6},{2,4,6,7},{3,4,5,7}]
 
-    def is_binary(self) -> bool:
-        return True
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.binary_matroid.matrix) if certificate else True
 
-    def is_ternary(self) -> bool:
-        return False
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
\ No newline at end of file
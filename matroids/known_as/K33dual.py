@@ -1,3 +1,5 @@
+from typing import Union
+
 from matroids.Matroid import Matroid
 
 class K33dual(Matroid):
@@ -84,8 +86,5 @@ class K33dual(Matroid):
             {8,9,5,6},{1,2,4,6,8,9},{1,2,5,6,7,9},{1,3,4,5,8,9},{1,3,5,6,7,8},{2,3,4,5,7,9},{2,3,4,6,7,8}
         ]
     
-    def is_binary(self) -> bool:
-        return True
-
-    def is_binary(self) -> bool:
-        return True
\ No newline at end of file
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.binary_representation()) if certificate else True
\ No newline at end of file
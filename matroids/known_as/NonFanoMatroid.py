@@ -1,3 +1,5 @@
+from typing import Union
+
 from matroids.Matroid import Matroid
 
 class NonFanoMatroid(Matroid):
@@ -50,8 +52,8 @@ class NonFanoMatroid(Matroid):
     def cocircuits(self) -> list[set[int]]:
         return [{1,2,3,4,7},{1,2,3,5,7},{1,2,3,6,7},{1,2,4,5},{1,3,4,6},{1,5,6,7},{2,3,5,6},{2,4,6,7},{3,4,5,7}]
 
-    def is_binary(self) -> bool:
-        return False
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
 
-    def is_ternary(self) -> bool:
-        return True
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.representation_over(3)) if certificate else True
\ No newline at end of file
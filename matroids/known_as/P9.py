@@ -1,3 +1,5 @@
+from typing import Union
+
 from matroids.Matroid import Matroid
 
 class P9(Matroid):
@@ -79,8 +81,8 @@ class P9(Matroid):
             {1,3,4,5,6},{1,4,5,7,9},{2,3,4,5,8},{3,4,6,8,9},{1,2,3,7,8,9},{1,3,5,6,7,8}
         ]
     
-    def is_binary(self) -> bool:
-        return True
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.binary_representation()) if certificate else True
     
-    def is_ternary(self) -> bool:
-        return False
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (False, None) if certificate else False
\ No newline at end of file
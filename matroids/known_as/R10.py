@@ -1,3 +1,5 @@
+from typing import Union
+
 from matroids.Matroid import Matroid
 
 class R10(Matroid):
@@ -167,8 +169,8 @@ class R10(Matroid):
             {3,5,6,7,8,10}
         ]
     
-    def is_binary(self) -> bool:
-        return True
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.binary_representation()) if certificate else True
 
-    def is_ternary(self) -> bool:
-        return True 
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.representation_over(3)) if certificate else True 
\ No newline at end of file
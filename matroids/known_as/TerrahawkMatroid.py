@@ -1,3 +1,7 @@
+from functools import cached_property
+from typing import Callable, Union
+
+from matroids.BinaryMatroid import BinaryMatroid
 from matroids.Matroid import Matroid
 
 class TerrahawkMatroid(Matroid):
@@ -15,6 +19,35 @@ class TerrahawkMatroid(Matroid):
     def size(self) -> int:
         return 16
     
+    @cached_property
+    def binary_matroid(self) -> BinaryMatroid:
+        # A representation over GF(2), whose j-th column is the element j.
+        matrix = [
+            [1,0,0,0,1,0,0,1,0,0,0,0,1,0,0,1],
+            [0,1,0,0,1,1,0,0,0,0,0,0,1,1,0,0],
+            [0,0,1,0,0,1,1,0,0,0,0,0,0,1,1,0],
+            [0,0,0,1,0,0,1,1,0,0,0,0,0,0,1,1],
+            [0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,1],
+            [0,0,0,0,0,0,0,0,0,1,0,0,1,1,0,0],
+            [0,0,0,0,0,0,0,0,0,0,1,0,0,1,1,0],
+            [0,0,0,0,0,0,0,0,0,0,0,1,0,0,1,1],
+        ]
+        # The columns are labelled in the order of self.encoder, so that both matroids encode a subset by the same bitmask.
+        return BinaryMatroid([ [ row[e - 1] for e in self.encoder.elements ] for row in matrix ], labels=self.encoder.elements)
+
+    # The rank, the closure and the independence are answered by the representation without the families below.
+    @property
+    def independence_oracle(self) -> Callable[[int], bool]:
+        return self.binary_matroid.independence_oracle
+
+    @property
+    def rank_function(self) -> Callable[[set[int]], int]:
+        return self.binary_matroid.rank_function
+
+    @property
+    def closure_function(self) -> Callable[[set[int]], set[int]]:
+        return self.binary_matroid.closure_function
+
     @property
     def independent_sets(self) -> list[set[int]]:
         return [
@@ -3430,7 +3463,7 @@ class TerrahawkMatroid(Matroid):
         ]
     
     @property
-    def base(self) -> list[set[int]]:
+    def bases(self) -> list[set[int]]:
         return [
             {1,2,3,4,9,10,11,12},{1,2,3,4,9,10,11,15},{1,2,3,4,9,10,11,16},{1,2,3,4,9,10,12,14},{1,2,3,4,9,10,12,15},
             {1,2,3,4,9,10,14,15},{1,2,3,4,9,10,14,16},{1,2,3,4,9,10,15,16},{1,2,3,4,9,11,12,13},{1,2,3,4,9,11,12,14},
@@ -4223,8 +4256,8 @@ class TerrahawkMatroid(Matroid):
             {2,3,4,5,8,10,11,15,16},{2,3,4,5,8,10,12,14,15},{2,3,4,5,8,11,12,13,14},{2,4,5,6,7,8,9,14,15},{2,4,5,6,7,8,11,13,16}
         ]
     
-    def is_binary(self) -> bool:
-        return True
+    def is_binary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.binary_matroid.matrix) if certificate else True
 
-    def is_ternary(self) -> bool:
-        return True
\ No newline at end of file
+    def is_ternary(self, certificate: bool=False) -> Union[bool, tuple[bool, Union[list[list[int]], None]]]:
+        return (True, self.representation_over(3)) if certificate else True
\ No newline at end of file
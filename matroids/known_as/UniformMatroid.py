@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Callable
+from functools import cached_property
+from math import comb
+from typing import Callable, Union
 
 from matroids.core.set_operator import powset
 
@@ -61,10 +63,34 @@ class UniformMatroid(Matroid):
         # cl(X) = X if |X| ≦ k, E if |X| > k
         return lambda X: X if len(X) <= self.k else self.E
     
-    @property
+    def count_bases(self) -> int:
+        # |Bs(U_{k,n})| = C(n, k)
+        return comb(self.n, self.k)
+
+    def count_circuits(self) -> int:
+        # |Cs(U_{k,n})| = C(n, k+1) (it is 0 when k = n)
+        return comb(self.n, self.k + 1)
+
+    def count_flats(self, rank: Union[int, None]=None) -> int:
+        # The flats of U_{k,n} are the subsets of size less than k and E.
+        if rank is None:
+            return sum(comb(self.n, i) for i in range(self.k)) + 1
+        if rank < 0:
+            return 0
+        if rank < self.k:
+            return comb(self.n, rank)
+        return 1 if rank == self.k else 0
+
+    def f_vector(self) -> list[int]:
+        # f_i(U_{k,n}) = C(n, i) (0 ≦ i ≦ k)
+        return [ comb(self.n, i) for i in range(self.k + 1) ]
+
+    @cached_property
     def dual(self) -> UniformMatroid:
-        # U_{k,n}* = U_{n-k,n}
-        return UniformMatroid(self.n - self.k, self.n)
+        # U_{k,n}* = U_{n-k,n}, whose dual is this matroid again.
+        dual = UniformMatroid(self.n - self.k, self.n)
+        dual.__dict__["dual"] = self
+        return dual
     
     @property
     def coindependent_sets(self) -> list[set[int]]:
@@ -0,0 +1,14 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../'))
+
+from itertools import combinations
+
+from matroids.Matroid import Matroid
+
+# The matroids shared by the tests of the matroid classes.
+# The graphic matroid of K4, whose triangles are {1,2,3}, {1,4,5}, {2,4,6} and {3,5,6}.
+K4 = Matroid(( {1,2,3,4,5,6}, [ {*B} for B in combinations(range(1,7), 3) if {*B} not in [{1,2,3},{1,4,5},{2,4,6},{3,5,6}] ] ))
+# The matroid on {1,2,3,4} whose element 4 is a loop and whose elements 2, 3 are parallel.
+M = Matroid(( {1,2,3,4}, [{1,2},{1,3}] ))
+# U_{2,4} given by its bases.
+U24 = Matroid(( {1,2,3,4}, [ {*B} for B in combinations(range(1,5), 2) ] ))
@@ -1,2 +1,25 @@
 import sys, os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../'))
+
+from matroids.core.binary import gf2_independence_oracle
+
+# The matroids shared by the tests of the kernels, on bitmasks. A set of elements {1,2,3,4} is the bitmask Σ 2^(e-1).
+# U_{2,4} on the bits 0b1111, which is U_{2,n} on any n bits: every subset with at most 2 bits is independent.
+U24 = lambda X: bin(X).count("1") <= 2
+# The matroid on 0b1111 whose bases are 0b0011, 0b0101: the bit 0b1000 is a loop and 0b0010, 0b0100 are parallel.
+M = lambda X: not X & 0b1000 and X & 0b0110 != 0b0110 and bin(X).count("1") <= 2
+# The Fano matroid as the nonzero vectors of GF(2)^3.
+F7 = gf2_independence_oracle([1, 2, 3, 4, 5, 6, 7])
+
+# The bases and the closures of U24 and M.
+U24_BASES = [0b0011, 0b0101, 0b1001, 0b0110, 0b1010, 0b1100]
+M_BASES = [0b0011, 0b0101]
+U24_CLOSURE = lambda X: X if bin(X).count("1") < 2 else 0b1111
+def M_CLOSURE(X: int) -> int:
+    X |= 0b1000 | (0b0110 if X & 0b0110 else 0)
+    return 0b1111 if X & 0b0001 and X & 0b0110 else X
+
+
+def on_elements(is_independent):
+    # The same matroid on the elements {1,2,3,4}, whose independence oracle takes sets.
+    return lambda X: is_independent(sum(1 << (e - 1) for e in X))
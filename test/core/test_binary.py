@@ -0,0 +1,74 @@
+import pytest
+
+from matroids.core.binary import (
+    gf2_echelon,
+    gf2_reduce,
+    gf2_rank,
+    gf2_ranks,
+    gf2_independence_oracle,
+    fundamental_circuit_columns,
+    binary_representation_columns,
+)
+from matroids.core.enumeration import iter_basis_masks
+
+from . import F7, M, M_BASES, U24
+
+
+@pytest.mark.parametrize('vectors, expected', [
+    ([], 0),
+    ([0b000], 0),
+    ([0b011, 0b101, 0b110], 2),
+    ([0b001, 0b010, 0b100, 0b111], 3),
+    ([0b101, 0b101], 1),
+])
+def test_gf2_rank(vectors, expected):
+    assert gf2_rank(vectors) == expected
+
+
+@pytest.mark.parametrize('vectors, v, expected', [
+    ([0b011, 0b101], 0b110, 0b000),
+    ([0b011, 0b101], 0b100, 0b001),
+    ([]            , 0b010, 0b010),
+])
+def test_gf2_reduce(vectors, v, expected):
+    pivots = gf2_echelon(vectors)
+    assert all(p.bit_length() - 1 == top for top, p in pivots.items())
+    assert gf2_reduce(v, pivots) == expected
+
+
+@pytest.mark.parametrize('columns, masks, expected', [
+    ([0b01, 0b10, 0b11], [0b111, 0b011, 0b001, 0b000, 0b101, 0b110], [2, 2, 1, 0, 2, 2]),
+    ([0b1, 0b1, 0b0]   , [0b100, 0b011, 0b111, 0b010]              , [0, 1, 1, 1]),
+    ([0b001, 0b010, 0b100, 0b111], [0b1111, 0b1011, 0b0111, 0b1110], [3, 3, 3, 3]),
+])
+def test_gf2_ranks(columns, masks, expected):
+    assert gf2_ranks(columns, masks) == expected
+    assert gf2_ranks(columns, masks) == [ gf2_rank(columns[j] for j in range(len(columns)) if X >> j & 1) for X in masks ]
+
+
+@pytest.mark.parametrize('E, B, is_independent, expected', [
+    (0b0111, 0b0011, U24, [0b01, 0b10, 0b11]),
+    (0b1111, 0b0011, M  , [0b01, 0b10, 0b10, 0b00]),
+    (0b1111111, 0b0001011, F7, [0b001, 0b010, 0b011, 0b100, 0b101, 0b110, 0b111]),
+])
+def test_fundamental_circuit_columns(E, B, is_independent, expected):
+    assert fundamental_circuit_columns(E, B, is_independent) == expected
+
+
+@pytest.mark.parametrize('E, is_independent, expected', [
+    (0b0111, U24, True),
+    (0b1111, U24, False),
+    (0b1111, M  , True),
+    (0b1111111, F7, True),
+])
+def test_binary_representation_columns(E, is_independent, expected):
+    columns = binary_representation_columns(E, is_independent)
+    assert (columns is not None) is expected
+    if expected:
+        assert [*iter_basis_masks(E, gf2_independence_oracle(columns))] == [*iter_basis_masks(E, is_independent)]
+
+
+def test_binary_representation_columns_with_bases():
+    bases = [*iter_basis_masks(0b1111, U24)]
+    assert binary_representation_columns(0b1111, U24, bases) is None
+    assert binary_representation_columns(0b1111, M, M_BASES) == [0b01, 0b10, 0b10, 0b00]
@@ -0,0 +1,121 @@
+import pytest
+
+from matroids.core.bitset import (
+    popcount,
+    iter_bits,
+    BitEncoder,
+    BitFamily,
+)
+
+
+@pytest.mark.parametrize('mask, expected', [
+    (0b0   , 0),
+    (0b1   , 1),
+    (0b1011, 3),
+    (0b1111, 4),
+])
+def test_popcount(mask, expected):
+    assert popcount(mask) == expected
+
+
+@pytest.mark.parametrize('mask, expected', [
+    (0b0   , []),
+    (0b1   , [0b1]),
+    (0b1010, [0b10, 0b1000]),
+    (0b111 , [0b1, 0b10, 0b100]),
+])
+def test_iter_bits(mask, expected):
+    assert [*iter_bits(mask)] == expected
+
+
+@pytest.mark.parametrize('ground_set, subset, expected', [
+    ({1,2,3}      , set()    , 0b000),
+    ({1,2,3}      , {1}      , 0b001),
+    ({1,2,3}      , {2,3}    , 0b110),
+    ({3,1,2}      , {1,2,3}  , 0b111),
+    ({'a','b','c'}, {'a','c'}, 0b101),
+    ({1,2,3}      , {1,4}    , 0b001),
+])
+def test_encode(ground_set, subset, expected):
+    assert BitEncoder(ground_set).encode(subset) == expected
+
+
+@pytest.mark.parametrize('ground_set, subset', [
+    ({1,2,3}      , set()),
+    ({1,2,3}      , {2}),
+    ({1,2,3}      , {1,3}),
+    ({'a','b','c'}, {'a','b','c'}),
+    ({1,'a',(2,3)}, {1,(2,3)}),
+])
+def test_decode(ground_set, subset):
+    encoder = BitEncoder(ground_set)
+    assert encoder.decode(encoder.encode(subset)) == subset
+
+
+@pytest.mark.parametrize('family, member, expected', [
+    ([{1,2},{1,3},{2,3}], {1,2}  ,  True),
+    ([{1,2},{1,3},{2,3}], {3,2}  ,  True),
+    ([{1,2},{1,3},{2,3}], {1}    , False),
+    ([{1,2},{1,3},{2,3}], {1,2,3}, False),
+    ([{1,2},{1,3},{2,3}], {1,4}  , False),
+    ([set()]            , set()  ,  True),
+    ([]                 , set()  , False),
+])
+def test_bit_family_contains(family, member, expected):
+    Fs = BitEncoder({1,2,3}).encode_family(family)
+    assert (member in Fs) == expected
+
+
+@pytest.mark.parametrize('family, subset, expected', [
+    ([{1,2},{1,3},{2,3}], {1,2}  , [{1,2}]),
+    ([{1,2},{1,3},{2,3}], {1,2,3}, [{1,2},{1,3},{2,3}]),
+    ([{1,2},{1,3},{2,3}], {3}    , []),
+    ([set(),{1}]        , set()  , [set()]),
+])
+def test_bit_family_subsets_of(family, subset, expected):
+    Fs = BitEncoder({1,2,3}).encode_family(family)
+    subsets = [*map(Fs.encoder.decode, Fs.subsets_of(subset))]
+    assert all(map(lambda X: X in expected, subsets)) and all(map(lambda X: X in subsets, expected))
+
+
+@pytest.mark.parametrize('family', [
+    [],
+    [set()],
+    [{1,2},{1,3},{2,3}],
+    [{1},{1,2,3},{2}],
+])
+def test_bit_family_to_list(family):
+    Fs = BitEncoder({1,2,3}).encode_family(family)
+    decoded = Fs.to_list()
+    assert len(Fs) == len(family)
+    assert all(map(lambda X: X in family, decoded)) and all(map(lambda X: X in decoded, family))
+
+
+@pytest.mark.parametrize('family, subset, expected', [
+    ([{1,2},{1,3},{2,3}], {1}    , [{1,2},{1,3}]),
+    ([{1,2},{1,3},{2,3}], {1,2}  , [{1,2}]),
+    ([{1,2},{1,3},{2,3}], set()  , [{1,2},{1,3},{2,3}]),
+    ([{1,2},{1,3},{2,3}], {1,2,3}, []),
+    ([set(),{1}]        , {1}    , [{1}]),
+])
+def test_bit_family_supersets_of(family, subset, expected):
+    Fs = BitEncoder({1,2,3}).encode_family(family)
+    supersets = [*map(Fs.encoder.decode, Fs.supersets_of(subset))]
+    assert all(map(lambda X: X in expected, supersets)) and all(map(lambda X: X in supersets, expected))
+    assert Fs.supersets_of(Fs.encoder.encode(subset)) == Fs.supersets_of(subset)
+
+
+@pytest.mark.parametrize('masks, member, expected', [
+    ([0b011, 0b101, 0b110], 0b011  ,  True),
+    ([0b011, 0b101, 0b110], 0b111  , False),
+    ([0b011, 0b101, 0b110], {1,2}  ,  True),
+    ([0b011, 0b101, 0b110], {1,2,4}, False),
+    ([0b011, 0b101, 0b110], {4}    , False),
+    ([0b000]              , {4}    , False),
+    ([0b000]              , set()  ,  True),
+])
+def test_bit_family_from_masks(masks, member, expected):
+    Fs = BitFamily(BitEncoder({1,2,3}), masks + masks)
+    assert Fs.masks == tuple(sorted(set(masks)))
+    assert Fs.index == frozenset(masks)
+    assert (member in Fs) == expected
@@ -0,0 +1,38 @@
+import pytest
+
+from matroids.core.bitset import BitEncoder
+from matroids.core.cache import LRUCache, OracleCache
+
+
+@pytest.mark.parametrize('maxsize, keys, expected_hits, expected_misses, expected_keys', [
+    (None, [1,2,1,2]    , 2, 2, {1,2}),
+    (2   , [1,2,3]      , 0, 3, {2,3}),
+    (2   , [1,2,1,3,1]  , 2, 3, {1,3}),
+    (0   , [1,1]        , 0, 2, set()),
+])
+def test_lru_cache(maxsize, keys, expected_hits, expected_misses, expected_keys):
+    cache = LRUCache(maxsize)
+    for key in keys:
+        assert cache.lookup(key, lambda: key * 10) == key * 10
+    assert (cache.hits, cache.misses) == (expected_hits, expected_misses)
+    assert {key for key in keys if key in cache} == expected_keys
+
+
+def test_lru_cache_negative_size():
+    with pytest.raises(ValueError):
+        LRUCache(-1)
+
+
+def test_oracle_cache():
+    E = {1,2,3,4}
+    calls = []
+    def r(X):
+        calls.append(X)
+        return min(len(X), 2)
+    cl = lambda X: set(X) if len(X) < 2 else E
+    cache = OracleCache(BitEncoder(E), r, cl, maxsize=8)
+    assert cache.rank_function({1,2,3}) == 2
+    assert cache.rank_function({3,2,1}) == 2
+    assert cache.nulity_function({1,2,3}) == 1
+    assert len(calls) == 1 and cache.ranks.hits == 2
+    assert cache.closure_function({1,2}) == E
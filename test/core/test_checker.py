@@ -9,11 +9,13 @@ from matroids.core.checker import (
     satisfies_rank_function_axiom,
     satisfies_nulity_function_axiom,
     satisfies_closure_axiom,
+    satisfies_flats_axiom,
     satisfies_open_sets_axiom,
     satisfies_hyperplanes_axiom,
     satisfies_spanning_sets_axiom,
     satisfies_girth_function_axiom,
 )
+from matroids.core.set_operator import powset
 
 
 @pytest.mark.parametrize('maybe_matroid, expected', [
@@ -72,6 +74,19 @@ def test_satisfies_bases_axiom(maybe_matroid, expected):
     assert satisfies_bases_axiom(maybe_matroid) == expected
 
 
+@pytest.mark.parametrize('maybe_matroid', [
+    ( {1,2,3,4}, [{1,2},{3,4}] ),
+    ( {1,2,3,4}, [{1,2},{1,3},{3,4}] ),
+    ( {1,2,3,4,5,6}, [{1,2,3},{1,2,4},{4,5,6}] ),
+])
+def test_satisfies_bases_axiom_certificate(maybe_matroid):
+    satisfied, (B1, B2, b1) = satisfies_bases_axiom(maybe_matroid, certificate=True)
+    _, Bs = maybe_matroid
+    assert not satisfied
+    assert B1 in Bs and B2 in Bs and b1 in B1 - B2
+    assert all((B1 - {b1}) | {b2} not in Bs for b2 in B2 - B1)
+
+
 @pytest.mark.parametrize('maybe_matroid, expected', [
     (( {1,2,3}, [{1},{2},{3}] )      ,  True),
     (( {1,2,3}, [{2},{3}] )          ,  True),
@@ -137,6 +152,57 @@ def test_satisfies_nulity_function_axiom(maybe_matroid, expected):
     assert satisfies_nulity_function_axiom(maybe_matroid) == expected
 
 
+# functions for checking the local forms of the rank and nulity function axioms.
+def r_jump(X: set) -> int:
+    # r({1}) = 0 and r({1,2}) = 2, so the rank increases by 2 by adding one element.
+    return 0 if len(X) <= 1 else len(X)
+
+
+def r_not_submodular(X: set) -> int:
+    # Monotonic and increasing by at most 1, but r({1,2}) + r({1,3}) < r({1,2,3}) + r({1}).
+    return 2 if X == {1,2,3} else min(len(X), 1)
+
+
+def r_over_full_pairs(X: set) -> int:
+    # Looks like U(2,4) on every subset except E, so the violation is r({1,2,3}) + r({1,2,4}) < r(E) + r({1,2}).
+    return 3 if X == {1,2,3,4} else min(len(X), 2)
+
+
+def satisfies_by_all_pairs(E: set, r) -> bool:
+    subsets = powset(E)
+    return all(0 <= r(X) <= len(X) for X in subsets) \
+       and all(r(X) <= r(Y) for X in subsets for Y in subsets if X <= Y) \
+       and all(r(X) + r(Y) >= r(X | Y) + r(X & Y) for X in subsets for Y in subsets)
+
+
+@pytest.mark.parametrize('maybe_matroid, expected', [
+    (( {1,2,3}  , r_jump )                         , False),
+    (( {1,2,3}  , r_not_submodular )               , False),
+    (( {1,2,3,4}, r_over_full_pairs )              , False),
+    (( {1,2,3,4}, lambda X: min(len(X), 2) )       ,  True),
+    (( {1,2,3,4}, lambda X: len(X & {1,2}) )       ,  True),
+])
+def test_satisfies_rank_function_axiom_by_local_forms(maybe_matroid, expected):
+    assert satisfies_rank_function_axiom(maybe_matroid) == expected
+    assert satisfies_rank_function_axiom(maybe_matroid, workers=2) == expected
+    assert satisfies_by_all_pairs(*maybe_matroid) == expected
+
+
+@pytest.mark.parametrize('maybe_matroid, expected', [
+    (( {1,2,3}  , r_jump )                                   , False),
+    (( {1,2,3}  , lambda X: len(X) - r_jump(X) )             , False),
+    (( {1,2,3}  , lambda X: len(X) - r_not_submodular(X) )   , False),
+    (( {1,2,3,4}, lambda X: len(X) - r_over_full_pairs(X) )  , False),
+    (( {1,2,3,4}, lambda X: len(X) - min(len(X), 2) )        ,  True),
+    (( {1,2,3,4}, lambda X: len(X - {1,2}) )                 ,  True),
+])
+def test_satisfies_nulity_function_axiom_by_local_forms(maybe_matroid, expected):
+    E, n = maybe_matroid
+    assert satisfies_nulity_function_axiom(maybe_matroid) == expected
+    assert satisfies_nulity_function_axiom(maybe_matroid, workers=2) == expected
+    assert satisfies_by_all_pairs(E, lambda X: len(X) - n(X)) == expected
+
+
 # functions for checking the closure axiom.
 def ncl1(x: set[int]) -> set[int]:
     if x == {1,2,3} or not x:
@@ -177,6 +243,37 @@ def test_satisfies_closure_function_axiom(maybe_matroid, expected):
     assert satisfies_closure_axiom(maybe_matroid) == expected
 
 
+@pytest.mark.parametrize('maybe_matroid, expected', [
+    (( {1,2,3}  , lambda X: X | {3} ), ( True,  8)),
+    (( {1,2,3}  , lambda X: {1} )    , (False,  8)),
+    (( {1,2,3,4}, lambda X: X )      , ( True, 16)),
+])
+def test_satisfies_closure_function_axiom_count_calls(maybe_matroid, expected):
+    assert satisfies_closure_axiom(maybe_matroid, count_calls=True) == expected
+
+
+@pytest.mark.parametrize('maybe_matroid, expected', [
+    (( {1,2,3}, [{1,2,3}] )                                    , True ),
+    (( {1,2,3}, [set(),{1,2,3}] )                              , True ),
+    (( {1,2,3}, [{3},{1,2,3}] )                                , True ),
+    (( {1,2,3}, [set(),{1},{2,3},{1,2,3}] )                    , True ),
+    (( {1,2,3}, [set(),{1},{2},{3},{1,2,3}] )                  , True ),
+    (( {1,2,3}, [set(),{1},{2},{3},{1,2},{1,3},{2,3},{1,2,3}] ), True ),
+    (( {1,2}  , [set(),{1},{2},{1,2}] )                        , True ),
+    (( {1,2,3}, [set(),{1},{2},{3}] )                          , False),
+    (( {1,2,3}, [set(),{1,2},{2,3},{1,2,3}] )                  , False),
+    (( {1,2,3}, [set(),{1,3},{1,2,3}] )                        , False),
+    (( {1,2,3}, [set(),{1},{1,2,3}] )                          , False),
+    (( {1,2,3}, [set(),{1},{2},{1,2},{1,2,3}] )                , False),
+    (( {1,2}  , [set(),{2},{1,2}] )                            , False),
+    (( {1,2}  , [set(),{1},{2},{1,2,99}] )                     , False),
+    (( {4,5,6}, [set(),{1},{2},{1,2}] )                        , False),
+])
+def test_satisfies_flats_axiom(maybe_matroid, expected):
+    assert satisfies_flats_axiom(maybe_matroid) == expected
+    assert satisfies_flats_axiom(maybe_matroid, workers=2) == expected
+
+
 @pytest.mark.parametrize('maybe_matroid, expected', [
     (( {1,2,3}, [set()] )                                      , True ),
     (( {1,2,3}, [set(),{1}] )                                  , True ),
@@ -0,0 +1,81 @@
+import pytest
+
+from matroids.core.enumeration import (
+    greedy_mask,
+    iter_independent_masks,
+    iter_basis_masks,
+    iter_circuit_masks,
+    iter_flat_masks,
+    shrink_to_circuit,
+    circuit_masks_by_elimination,
+)
+
+from . import M, U24
+
+
+@pytest.mark.parametrize('I, X, is_independent, expected', [
+    (0b0000, 0b1111, U24, 0b0011),
+    (0b0100, 0b1111, U24, 0b0101),
+    (0b0000, 0b1110, M  , 0b0010),
+    (0b0000, 0b1111, M  , 0b0011),
+])
+def test_greedy_mask(I, X, is_independent, expected):
+    assert greedy_mask(I, X, is_independent) == expected
+
+
+@pytest.mark.parametrize('is_independent, expected', [
+    (U24, [0b0000, 0b0001, 0b0011, 0b0101, 0b1001, 0b0010, 0b0110, 0b1010, 0b0100, 0b1100, 0b1000]),
+    (M  , [0b0000, 0b0001, 0b0011, 0b0101, 0b0010, 0b0100]),
+])
+def test_iter_independent_masks(is_independent, expected):
+    assert [*iter_independent_masks(0b1111, is_independent)] == expected
+
+
+@pytest.mark.parametrize('is_independent, expected', [
+    (U24, [0b0011, 0b0101, 0b1001, 0b0110, 0b1010, 0b1100]),
+    (M  , [0b0011, 0b0101]),
+])
+def test_iter_basis_masks(is_independent, expected):
+    assert [*iter_basis_masks(0b1111, is_independent)] == expected
+
+
+@pytest.mark.parametrize('is_independent, expected', [
+    (U24, {0b0111, 0b1011, 0b1101, 0b1110}),
+    (M  , {0b1000, 0b0110}),
+])
+def test_iter_circuit_masks(is_independent, expected):
+    circuits = [*iter_circuit_masks(0b1111, is_independent)]
+    assert len(circuits) == len(expected) and set(circuits) == expected
+
+
+@pytest.mark.parametrize('is_independent, rank, expected', [
+    (U24, None, {0b0000, 0b0001, 0b0010, 0b0100, 0b1000, 0b1111}),
+    (U24, 1   , {0b0001, 0b0010, 0b0100, 0b1000}),
+    (M  , None, {0b1000, 0b1001, 0b1110, 0b1111}),
+    (M  , 2   , {0b1111}),
+])
+def test_iter_flat_masks(is_independent, rank, expected):
+    flats = [*iter_flat_masks(0b1111, is_independent, rank)]
+    assert len(flats) == len(expected) and set(flats) == expected
+
+
+@pytest.mark.parametrize('D, is_independent, expected', [
+    (0b1111, U24, 0b1110),
+    (0b1110, M  , 0b1000),
+    (0b0111, M  , 0b0110),
+])
+def test_shrink_to_circuit(D, is_independent, expected):
+    assert shrink_to_circuit(D, is_independent) == expected
+
+
+@pytest.mark.parametrize('is_independent, expected', [
+    (U24, {0b0111, 0b1011, 0b1101, 0b1110}),
+    (M  , {0b1000, 0b0110}),
+    # U_{2,3} whose first two points are doubled; the pairs 0b00011 and 0b01100 are parallel.
+    (lambda X: bin(X).count("1") <= 2 and X not in {0b00011, 0b01100}, None),
+])
+def test_circuit_masks_by_elimination(is_independent, expected):
+    E = 0b11111 if expected is None else 0b1111
+    circuits = circuit_masks_by_elimination(E, is_independent)
+    expected = set(iter_circuit_masks(E, is_independent)) if expected is None else expected
+    assert len(circuits) == len(expected) and set(circuits) == expected
@@ -0,0 +1,86 @@
+import pytest
+
+from matroids.core.finite_field import FiniteField
+
+
+@pytest.mark.parametrize('q', [2, 3, 4, 5, 8, 9])
+def test_field_axioms(q):
+    F = FiniteField(q)
+    for a in range(q):
+        assert F.add(a, F.neg(a)) == 0
+        assert F.sub(a, a) == 0
+        if a:
+            assert F.mul(a, F.inv(a)) == 1
+        for b in range(q):
+            assert F.add(a, b) == F.add(b, a)
+            assert F.mul(a, b) == F.mul(b, a)
+            for c in range(q):
+                assert F.mul(a, F.add(b, c)) == F.add(F.mul(a, b), F.mul(a, c))
+
+
+@pytest.mark.parametrize('q, characteristic', [(2, 2), (4, 2), (7, 7), (9, 3)])
+def test_characteristic(q, characteristic):
+    F = FiniteField(q)
+    assert (F.order, F.characteristic) == (q, characteristic)
+    total = 0
+    for _ in range(characteristic):
+        total = F.add(total, 1)
+    assert total == 0
+
+
+@pytest.mark.parametrize('q', [0, 1, 6, 12])
+def test_not_a_prime_power(q):
+    with pytest.raises(ValueError):
+        FiniteField(q)
+
+
+def test_inverse_of_zero():
+    with pytest.raises(ZeroDivisionError):
+        FiniteField(3).inv(0)
+
+
+@pytest.mark.parametrize('q, matrix, expected', [
+    (3, [[1, 1], [1, 2]], 1),
+    (3, [[1, 2], [2, 1]], 0),
+    (5, [[0, 1], [1, 0]], 4),
+    (5, [[2, 0, 0], [0, 3, 0], [1, 4, 4]], 4),
+    (2, [], 1),
+])
+def test_determinant(q, matrix, expected):
+    assert FiniteField(q).determinant(matrix) == expected
+
+
+@pytest.mark.parametrize('q, vectors, expected', [
+    (3, [[1, 1, 0], [2, 2, 0], [0, 1, 1]], 2),
+    (3, [[1, 0], [0, 1], [1, 1]], 2),
+    (4, [[1, 2], [2, 3]], 1),
+    (4, [[1, 2], [1, 3]], 2),
+    (2, [[0, 0]], 0),
+])
+def test_rank(q, vectors, expected):
+    assert FiniteField(q).rank(vectors) == expected
+
+
+@pytest.mark.parametrize('q, x, expected', [(3, -1, 2), (5, 7, 2), (4, 3, 3)])
+def test_element(q, x, expected):
+    assert FiniteField(q).element(x) == expected
+
+
+@pytest.mark.parametrize('q, x', [(4, 4), (9, -1)])
+def test_element_out_of_extension_field(q, x):
+    with pytest.raises(ValueError):
+        FiniteField(q).element(x)
+
+
+@pytest.mark.parametrize('q, vectors, v, spanned', [
+    (3, [[1, 1, 0], [0, 1, 1]], [1, 2, 1], True),
+    (3, [[1, 1, 0], [0, 1, 1]], [1, 0, 1], False),
+    (4, [[1, 2]]              , [2, 3]   , True),
+    (4, [[1, 2]]              , [1, 3]   , False),
+])
+def test_echelon_and_reduce(q, vectors, v, spanned):
+    F = FiniteField(q)
+    pivots = F.echelon(vectors)
+    assert all(p[j] == 1 and not any(p[:j]) for j, p in pivots.items())
+    assert (not any(F.reduce(v, pivots))) is spanned
+    assert len(F.echelon([v], dict(pivots))) == len(pivots) + (not spanned)
@@ -0,0 +1,58 @@
+import pytest
+
+from matroids.core.graph import UnionFind, count_spanning_forests, forest_rank, incidence_matrix, iter_cycle_masks
+
+# K4 on the vertices 0, 1, 2, 3.
+K4 = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+# A triangle with a loop at 0 and an edge parallel to 01.
+TRIANGLE = [(0, 1), (1, 2), (0, 2), (0, 0), (1, 0)]
+
+
+def test_union_find():
+    components = UnionFind()
+    assert components.union(0, 1) and components.union(2, 3)
+    assert not components.union(1, 0)
+    assert components.find(0) == components.find(1) != components.find(2)
+    assert components.union(1, 3)
+    assert len({ components.find(x) for x in range(4) }) == 1
+    assert components.find("new") == "new"
+
+
+@pytest.mark.parametrize('edges, expected', [
+    ([]                         , 0),
+    ([(0, 0)]                   , 0),
+    (K4                         , 3),
+    (TRIANGLE                   , 2),
+    ([(0, 1), (2, 3), (4, 5)]   , 3),
+    ([(0, 1), (1, 0), (2, 3)]   , 2),
+])
+def test_forest_rank(edges, expected):
+    assert forest_rank(edges) == expected
+
+
+@pytest.mark.parametrize('ends, expected', [
+    ([]      , []),
+    (K4      , [0b001011, 0b010101, 0b011110, 0b100110, 0b101101, 0b110011, 0b111000]),
+    (TRIANGLE, [0b00111, 0b01000, 0b10001, 0b10110]),
+])
+def test_iter_cycle_masks(ends, expected):
+    assert sorted(iter_cycle_masks(ends)) == expected
+
+
+@pytest.mark.parametrize('ends, expected', [
+    ([]                     , 1),
+    ([(0, 0)]               , 1),
+    (K4                     , 16),
+    (TRIANGLE               , 5),
+    (K4 + [(4, 5), (4, 5)]  , 32),
+])
+def test_count_spanning_forests(ends, expected):
+    assert count_spanning_forests(ends) == expected
+
+
+@pytest.mark.parametrize('ends, expected', [
+    ([(0, 1), (1, 2), (0, 2), (0, 0)], [[-1, 1, 0, 0], [0, -1, -1, 0]]),
+    ([(0, 1), (2, 3)]                , [[-1, 0], [0, -1]]),
+])
+def test_incidence_matrix(ends, expected):
+    assert incidence_matrix(ends, 1, -1) == expected
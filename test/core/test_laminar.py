@@ -0,0 +1,62 @@
+import pytest
+
+from matroids.core.laminar import LaminarTree
+
+# The sets 0 = {a, b}, 1 = {a, b, c, d}, 2 = {e, f} with the capacities 1, 2, 1, where g is free.
+FAMILY = [{"a", "b"}, {"a", "b", "c", "d"}, {"e", "f"}]
+CAPACITIES = [1, 2, 1]
+TREE = LaminarTree(FAMILY, CAPACITIES)
+
+
+@pytest.mark.parametrize('family, capacities', [
+    ([{1, 2}, {2, 3}]        , [1, 1]),
+    ([{1, 2}]                , [1, 1]),
+    ([{1, 2}, {1, 2, 3}]     , [1, -1]),
+])
+def test_invalid_family(family, capacities):
+    with pytest.raises(ValueError):
+        LaminarTree(family, capacities)
+
+
+@pytest.mark.parametrize('e, node, parent', [
+    ("a", 0   , 1   ),
+    ("c", 1   , None),
+    ("e", 2   , None),
+    ("g", None, None),
+])
+def test_node_of(e, node, parent):
+    assert TREE.node_of(e) == node
+    if node is not None:
+        assert TREE.parent(node) == parent
+
+
+@pytest.mark.parametrize('X, expected', [
+    (set()                    , 0),
+    ({"a", "b"}               , 1),
+    ({"a", "c"}               , 2),
+    ({"a", "b", "c", "d"}     , 2),
+    ({"e", "f", "g"}          , 2),
+    ({"a", "c", "d", "e", "g"}, 4),
+])
+def test_rank(X, expected):
+    assert TREE.rank(map(TREE.node_of, X)) == expected
+
+
+@pytest.mark.parametrize('X, expected', [
+    (set()          , [False, False, False]),
+    ({"a"}          , [True , False, False]),
+    ({"c", "d"}     , [True , True , False]),
+    ({"c", "f"}     , [False, False, True ]),
+])
+def test_saturated(X, expected):
+    assert TREE.saturated(map(TREE.node_of, X)) == expected
+
+
+@pytest.mark.parametrize('family, capacities, free, expected', [
+    ([]                                  , []       , 3, [1, 3, 3, 1]),
+    ([{1, 2, 3}, {4, 5}]                 , [2, 1]   , 0, [1, 5, 9, 6]),
+    (FAMILY                              , CAPACITIES, 1, [1, 7, 19, 23, 10]),
+    ([{1, 2}, {1, 2}]                    , [2, 1]   , 0, [1, 2]),
+])
+def test_independent_counts(family, capacities, free, expected):
+    assert LaminarTree(family, capacities).independent_counts(free) == expected
@@ -0,0 +1,65 @@
+import pytest
+
+from matroids.core.bitset import BitEncoder
+from matroids.core.lattice import FlatLattice, flats_by_intersection, hasse_diagram_of_flats
+
+from . import M_CLOSURE as M, U24_CLOSURE as U24
+
+
+@pytest.mark.parametrize('closure, expected_levels, expected_covers', [
+    (U24, [[0b0000], [0b0001, 0b0010, 0b0100, 0b1000], [0b1111]],
+          {0b0000: [0b0001, 0b0010, 0b0100, 0b1000], 0b0001: [0b1111], 0b0010: [0b1111], 0b0100: [0b1111], 0b1000: [0b1111], 0b1111: []}),
+    (M  , [[0b1000], [0b1001, 0b1110], [0b1111]],
+          {0b1000: [0b1001, 0b1110], 0b1001: [0b1111], 0b1110: [0b1111], 0b1111: []}),
+])
+def test_hasse_diagram_of_flats(closure, expected_levels, expected_covers):
+    assert hasse_diagram_of_flats(0b1111, closure) == (expected_levels, expected_covers)
+
+
+@pytest.mark.parametrize('hyperplanes, expected', [
+    ([0b0001, 0b0010, 0b0100, 0b1000], [0b1111, 0b0001, 0b0010, 0b0100, 0b1000, 0b0000]),
+    ([0b1001, 0b1110, 0b1001]        , [0b1111, 0b1001, 0b1110, 0b1000]),
+    ([]                              , [0b1111]),
+])
+def test_flats_by_intersection(hyperplanes, expected):
+    assert flats_by_intersection(0b1111, hyperplanes) == expected
+
+
+@pytest.mark.parametrize('closure, expected_mobius, expected_first, expected_second', [
+    (U24, {0b0000: 1, 0b0001: -1, 0b0010: -1, 0b0100: -1, 0b1000: -1, 0b1111: 3}, [1, -4, 3], [1, 4, 1]),
+    (M  , {0b1000: 1, 0b1001: -1, 0b1110: -1, 0b1111: 1}, [1, -2, 1], [1, 2, 1]),
+])
+def test_flat_lattice_mobius_and_whitney_numbers(closure, expected_mobius, expected_first, expected_second):
+    lattice = FlatLattice(BitEncoder([1, 2, 3, 4]), closure)
+    assert { F: lattice.mobius(lattice.bottom, F) for F in lattice.flats() } == expected_mobius
+    assert lattice.whitney_numbers_of_the_first_kind() == expected_first
+    assert lattice.whitney_numbers_of_the_second_kind() == expected_second
+
+
+@pytest.mark.parametrize('X, expected', [
+    (0b0000, 0b1000),
+    (0b0001, 0b1001),
+    (0b0100, 0b1110),
+    (0b1010, 0b1110),
+    (0b0011, 0b1111),
+])
+def test_flat_lattice_closure(X, expected):
+    lattice = FlatLattice(BitEncoder([1, 2, 3, 4]), M)
+    assert lattice.closure(X) == expected
+    assert lattice.closure(X) == M(X)
+
+
+def test_flat_lattice_covers_meet_join():
+    lattice = FlatLattice(BitEncoder([1, 2, 3, 4]), M)
+    assert (lattice.bottom, lattice.top, lattice.rank) == (0b1000, 0b1111, 2)
+    assert lattice.hyperplanes() == (0b1001, 0b1110)
+    assert lattice.lower_covers(0b1111) == (0b1001, 0b1110)
+    assert lattice.upper_covers({4}) == (0b1001, 0b1110)
+    assert lattice.meet(0b1001, 0b1110) == 0b1000
+    assert lattice.join(0b1001, 0b1110) == 0b1111
+    assert lattice.rank_of({1, 4}) == 1
+    assert {1, 4} in lattice and {1} not in lattice
+    assert [*lattice] == [{4}, {1, 4}, {2, 3, 4}, {1, 2, 3, 4}]
+    assert lattice.mobius(0b1001, 0b1110) == 0
+    with pytest.raises(KeyError):
+        lattice.mobius(0b0001, 0b1111)
@@ -0,0 +1,28 @@
+import pytest
+
+from matroids.core.finite_field import FiniteField
+from matroids.core.linear import PrefixEchelon
+from matroids.core.rational import RationalField
+
+# The columns of the matrix [[1, 0, 1, 1], [0, 1, 1, 2]], where the last two columns are parallel over GF(3).
+COLUMNS = [(1, 0), (0, 1), (1, 1), (1, 2)]
+
+
+@pytest.mark.parametrize('field, masks, expected', [
+    (FiniteField(3), [0b0000, 0b0001, 0b0011, 0b0111, 0b0101, 0b1100, 0b1101], [0, 1, 2, 2, 2, 2, 2]),
+    (FiniteField(5), [0b1100, 0b1000, 0b1010, 0b0101]                        , [2, 1, 2, 2]),
+    (RationalField(), [0b1100, 0b1111, 0b0100, 0b1001]                       , [2, 2, 1, 2]),
+])
+def test_prefix_echelon_rank(field, masks, expected):
+    echelon = PrefixEchelon(field, COLUMNS)
+    assert [ echelon.rank(X) for X in masks ] == expected
+
+
+@pytest.mark.parametrize('field, X, v, expected', [
+    (FiniteField(3) , 0b0100, (2, 2), True),
+    (FiniteField(3) , 0b0100, (1, 2), False),
+    (RationalField(), 0b0011, (5, 7), True),
+    (RationalField(), 0b0000, (0, 0), True),
+])
+def test_prefix_echelon_spans(field, X, v, expected):
+    assert PrefixEchelon(field, COLUMNS).spans(X, v) is expected
@@ -0,0 +1,53 @@
+import pytest
+
+from matroids.core.matching import IncrementalMatching, augment, maximum_matching
+
+# The elements a, b, c, d, e over the sets 0 = {a, b}, 1 = {b, c, e}, 2 = {a}.
+ADJACENCY = {"a": [0, 2], "b": [0, 1], "c": [1], "d": [], "e": [1]}
+
+
+def is_matching(mates, adjacency):
+    return len(set(mates.values())) == len(mates) and all(s in adjacency[x] for s, x in mates.items())
+
+
+@pytest.mark.parametrize('left, expected', [
+    ([]                    , 0),
+    (["d"]                 , 0),
+    (["a", "b", "c"]       , 3),
+    (["b", "c"]            , 2),
+    (["a", "b", "c", "d"]  , 3),
+])
+def test_maximum_matching(left, expected):
+    mates = maximum_matching(left, ADJACENCY)
+    assert len(mates) == expected
+    assert is_matching(mates, ADJACENCY)
+
+
+def test_maximum_matching_needs_augmenting_paths():
+    # The greedy matching 0-0, 1-1, ... blocks the last element, which needs the path through every element.
+    n = 6
+    adjacency = { i: [i, i + 1] if i < n - 1 else [0] for i in range(n) }
+    adjacency[n - 1] = [0]
+    mates = maximum_matching(range(n), adjacency)
+    assert len(mates) == n and is_matching(mates, adjacency)
+
+
+@pytest.mark.parametrize('mates, x, expected, expected_size', [
+    ({0: "a", 1: "b"}, "c", True , 3),
+    ({0: "a", 1: "c"}, "b", True , 3),
+    ({0: "a", 1: "c"}, "e", False, 2),
+    ({}              , "d", False, 0),
+])
+def test_augment(mates, x, expected, expected_size):
+    assert augment(x, ADJACENCY, mates) is expected
+    assert len(mates) == expected_size
+    assert is_matching(mates, ADJACENCY)
+
+
+@pytest.mark.parametrize('masks, expected', [
+    ([0b0001, 0b0011, 0b0111, 0b1111, 0b0110, 0b1000], [1, 2, 3, 3, 2, 0]),
+    ([0b1010, 0b1110, 0b0101]                        , [1, 2, 2]),
+])
+def test_incremental_matching(masks, expected):
+    matching = IncrementalMatching([ ADJACENCY[x] for x in "abcd" ])
+    assert [ matching.rank(X) for X in masks ] == expected
@@ -0,0 +1,45 @@
+import pytest
+
+from matroids.core.minor import find_minor_masks, mask_isomorphism
+
+from . import M_BASES as M, U24_BASES as U24
+
+# The bases of U_{2,3} on the bits 0b111.
+U23 = [0b011, 0b101, 0b110]
+# The bases of U_{2,5} on the bits 0b11111.
+U25 = [ B for B in range(32) if bin(B).count("1") == 2 ]
+# The bases of the graphic matroid of K4 on the bits 0b111111, where 0b000111, 0b011001, 0b101010, 0b110100 are the triangles.
+K4 = [ B for B in range(64) if bin(B).count("1") == 3 and B not in {0b000111, 0b011001, 0b101010, 0b110100} ]
+
+
+@pytest.mark.parametrize('Bs1, E1, Bs2, E2, expected', [
+    (U24, 0b1111, [0b0011, 0b0101, 0b1001, 0b0110, 0b1010, 0b1100], 0b1111, True ),
+    (M  , 0b1111, [0b1010, 0b1100]                                 , 0b1110, False),
+    (M  , 0b1111, [0b1010, 0b1100]                                 , 0b1111, True ),
+    (M  , 0b1111, [0b0011, 0b0110]                                 , 0b1111, True ),
+    (M  , 0b1111, U24                                              , 0b1111, False),
+])
+def test_mask_isomorphism(Bs1, E1, Bs2, E2, expected):
+    isomorphism = mask_isomorphism(Bs1, E1, Bs2, E2)
+    assert (isomorphism is not None) == expected
+    if expected:
+        image = lambda B: sum(isomorphism[x] for x in isomorphism if B & x)
+        assert sorted(map(image, Bs1)) == sorted(Bs2)
+
+
+@pytest.mark.parametrize('Bs, E, Ns, F, expected', [
+    (U25, 0b11111 , U24, 0b1111, True ),
+    (U24, 0b1111  , U23, 0b111 , True ),
+    (U23, 0b111   , U24, 0b1111, False),
+    (K4 , 0b111111, U24, 0b1111, False),
+    (K4 , 0b111111, U23, 0b111 , True ),
+    (M  , 0b1111  , U23, 0b111 , False),
+])
+def test_find_minor_masks(Bs, E, Ns, F, expected):
+    found = find_minor_masks(Bs, E, Ns, F)
+    assert (found is not None) == expected
+    if expected:
+        C, D, isomorphism = found
+        minor = [ B & ~C for B in Bs if not C & ~B and not B & D ]
+        image = lambda B: sum(isomorphism[x] for x in isomorphism if B & x)
+        assert sorted(map(image, minor)) == sorted(Ns)
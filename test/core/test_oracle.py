@@ -0,0 +1,86 @@
+import pytest
+
+from matroids.core.bitset import BitEncoder
+from matroids.core.oracle import (
+    greedy_independent_subset,
+    greedy_rank,
+    indexed_greedy_rank,
+    oracle_closure,
+    oracle_is_basis,
+    oracle_fundamental_circuit,
+)
+
+from . import M, U24, on_elements
+
+# U_{2,4} and the matroid whose bases are {1,2}, {1,3} on the elements {1,2,3,4}: 4 is a loop and 2, 3 are parallel.
+U24, M = on_elements(U24), on_elements(M)
+
+
+@pytest.mark.parametrize('X, is_independent, expected', [
+    (set()    , U24, 0),
+    ({1}      , U24, 1),
+    ({1,2,3}  , U24, 2),
+    ({4}      , M  , 0),
+    ({2,3,4}  , M  , 1),
+    ({1,2,3,4}, M  , 2),
+])
+def test_greedy_rank(X, is_independent, expected):
+    assert greedy_rank(X, is_independent) == expected
+
+
+@pytest.mark.parametrize('X, is_independent', [
+    ({1,2,3,4}, U24),
+    ({2,3,4}  , M),
+    ({1,2,3,4}, M),
+])
+def test_greedy_independent_subset(X, is_independent):
+    I = greedy_independent_subset(X, is_independent)
+    assert I <= X and is_independent(I)
+    assert all(not is_independent(I | {e}) for e in X - I)
+
+
+@pytest.mark.parametrize('X, is_independent, expected', [
+    (set()    , U24, set()),
+    ({1}      , U24, {1}),
+    ({1,2}    , U24, {1,2,3,4}),
+    (set()    , M  , {4}),
+    ({2}      , M  , {2,3,4}),
+    ({1,3}    , M  , {1,2,3,4}),
+])
+def test_oracle_closure(X, is_independent, expected):
+    assert oracle_closure(X, {1,2,3,4}, is_independent) == expected
+
+
+@pytest.mark.parametrize('X, is_independent, expected', [
+    ({1,2}  , U24,  True),
+    ({1}    , U24, False),
+    ({1,2,3}, U24, False),
+    ({1,3}  , M  ,  True),
+    ({2,3}  , M  , False),
+    ({1,4}  , M  , False),
+])
+def test_oracle_is_basis(X, is_independent, expected):
+    assert oracle_is_basis(X, {1,2,3,4}, is_independent) == expected
+
+
+@pytest.mark.parametrize('e, B, is_independent, expected', [
+    (3, {1,2}, U24, {1,2,3}),
+    (4, {1,3}, U24, {1,3,4}),
+    (3, {1,2}, M  , {2,3}),
+    (4, {1,2}, M  , {4}),
+])
+def test_oracle_fundamental_circuit(e, B, is_independent, expected):
+    assert oracle_fundamental_circuit(e, B, is_independent) == expected
+
+
+@pytest.mark.parametrize('X, is_independent, expected', [
+    (set()    , U24, 0),
+    ({1,2,3}  , U24, 2),
+    ({1,5}    , U24, 1),
+    ({2,3,4}  , M  , 1),
+    ({1,2,3,4}, M  , 2),
+])
+def test_indexed_greedy_rank(X, is_independent, expected):
+    E = {1,2,3,4}
+    Is = BitEncoder(E).encode_family(X for X in map(set, [(), (1,), (2,), (3,), (4,), (1,2), (1,3), (1,4), (2,3), (2,4), (3,4)]) if is_independent(X))
+    assert indexed_greedy_rank(X, Is) == expected
@@ -0,0 +1,35 @@
+import pytest
+
+from matroids.core.parallel import any_shard, resolve_workers, split_range
+
+
+def contains_negative(data, start, stop):
+    return any(x < 0 for x in data[start:stop])
+
+
+@pytest.mark.parametrize('size, shards, pairwise', [
+    (0 , 4, False),
+    (1 , 4, False),
+    (10, 3, False),
+    (10, 3, True),
+    (7 , 8, True),
+])
+def test_split_range(size, shards, pairwise):
+    bounds = split_range(size, shards, pairwise)
+    assert [i for start, stop in bounds for i in range(start, stop)] == [*range(size)]
+    assert len(bounds) <= max(1, shards)
+
+
+@pytest.mark.parametrize('data, workers, expected', [
+    ((1, 2, 3, 4, 5, 6, 7, 8) , 1, False),
+    ((1, 2, 3, 4, 5, 6, 7, -8), 1,  True),
+    ((1, 2, 3, 4, 5, 6, 7, 8) , 2, False),
+    ((1, -2, 3, 4, 5, 6, 7, 8), 2,  True),
+])
+def test_any_shard(data, workers, expected):
+    assert any_shard(contains_negative, data, len(data), workers) == expected
+
+
+def test_resolve_workers():
+    assert resolve_workers(3) == 3
+    assert resolve_workers(0) >= 1
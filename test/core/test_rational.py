@@ -0,0 +1,54 @@
+import pytest
+from fractions import Fraction
+
+from matroids.core.rational import RationalField
+
+
+@pytest.mark.parametrize('matrix, expected', [
+    ([]                                   , 1),
+    ([[2, 1], [1, 3]]                     , 5),
+    ([[0, 1], [1, 0]]                     , -1),
+    ([[1, 2], [2, 4]]                     , 0),
+    ([[Fraction(1, 2), 1], [1, 3]]        , Fraction(1, 2)),
+    ([[2, 0, 1], [1, 3, 2], [1, 1, 1]]    , 0),
+    ([[2, 0, 1], [1, 3, 2], [1, 1, 2]]    , 6),
+    ([[0, 0, 1], [0, 1, 0], [1, 0, 0]]    , -1),
+])
+def test_determinant(matrix, expected):
+    assert RationalField().determinant(matrix) == expected
+
+
+@pytest.mark.parametrize('vectors, expected', [
+    ([]                                    , 0),
+    ([[0, 0]]                              , 0),
+    ([[1, 2, 3], [2, 4, 6]]                , 1),
+    ([[1, 2, 3], [Fraction(1, 3), 1, 0]]   , 2),
+    ([[0, 1, 1], [1, 0, 1], [1, 1, 2]]     , 2),
+    ([[1, 0], [0, 1], [1, 1]]              , 2),
+])
+def test_rank(vectors, expected):
+    Q = RationalField()
+    assert Q.rank(vectors) == expected
+    assert len(Q.echelon(vectors)) == expected
+
+
+@pytest.mark.parametrize('vectors, v, spanned', [
+    ([[1, 1, 0], [0, 1, 1]], [1, 2, 1]                     , True),
+    ([[1, 1, 0], [0, 1, 1]], [1, -1, 1]                    , False),
+    ([[2, 4]]              , [Fraction(1, 2), 1]           , True),
+])
+def test_reduce(vectors, v, spanned):
+    Q = RationalField()
+    pivots = Q.echelon(vectors)
+    assert all(isinstance(x, int) for p in pivots.values() for x in p)
+    assert (not any(Q.reduce(v, pivots))) is spanned
+
+
+@pytest.mark.parametrize('x, expected', [(3, Fraction(3)), ("2/3", Fraction(2, 3)), (Fraction(1, 2), Fraction(1, 2))])
+def test_element(x, expected):
+    assert RationalField().element(x) == expected
+
+
+def test_element_not_rational():
+    with pytest.raises(ValueError):
+        RationalField().element("x")
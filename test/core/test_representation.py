@@ -0,0 +1,42 @@
+import pytest
+from itertools import combinations
+
+from matroids.core.enumeration import iter_basis_masks
+from matroids.core.finite_field import FiniteField
+from matroids.core.representation import representation_matrix
+
+from . import F7, M, U24
+
+
+def bases_of(matrix, field):
+    r, n = len(matrix), len(matrix[0])
+    return [ sum(1 << j for j in S) for S in combinations(range(n), r) if field.determinant([ [ row[j] for j in S ] for row in matrix ]) ]
+
+
+@pytest.mark.parametrize('E, is_independent, q, expected', [
+    (0b1111   , U24 , 2, False),
+    (0b1111   , U24 , 3, True),
+    (0b11111  , U24 , 3, False),
+    (0b11111  , U24 , 4, True),
+    (0b1111   , M   , 2, True),
+    (0b1111111, F7  , 2, True),
+    (0b1111111, F7  , 3, False),
+    (0b1111111, F7  , 4, True),
+])
+def test_representation_matrix(E, is_independent, q, expected):
+    field = FiniteField(q)
+    matrix = representation_matrix(E, is_independent, field)
+    assert (matrix is not None) is expected
+    if expected:
+        assert sorted(bases_of(matrix, field)) == sorted(iter_basis_masks(E, is_independent))
+
+
+def test_representation_matrix_with_bases():
+    bases = [*iter_basis_masks(0b11111, U24)]
+    assert representation_matrix(0b11111, U24, FiniteField(3), bases) is None
+    assert representation_matrix(0b11111, U24, FiniteField(5), bases) is not None
+
+
+def test_representation_matrix_time_budget():
+    with pytest.raises(TimeoutError):
+        representation_matrix(0b1111111, F7, FiniteField(3), time_budget=-1)
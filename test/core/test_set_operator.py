@@ -5,7 +5,10 @@ from matroids.core.set_operator import (
     is_minimal,
     is_maximal,
     find_minimal_sets,
-    find_maximal_sets
+    find_maximal_sets,
+    minimal_masks,
+    maximal_masks,
+    SubsetTrie,
 )
 
 @pytest.mark.parametrize('someset, expected', [
@@ -40,4 +43,41 @@ def test_is_minimal(someset, family, expected):
     ({1}, [{1},{1,2}]                      , False)
 ])
 def test_is_maximal(someset, family, expected):
-    assert is_maximal(someset, family) == expected
\ No newline at end of file
+    assert is_maximal(someset, family) == expected
+
+@pytest.mark.parametrize("family, allow_emptyset, expected", [
+    ([{1,2},{1},{2,3},{1,2,3},{3}]    , False, [{1},{3}]        ),
+    ([set(),{1},{2},{1,2}]            , False, [{1},{2}]        ),
+    ([set(),{1},{2},{1,2}]            , True , [set()]          ),
+    ([{1,2},{2,3},{1,2},{1,2,3}]      , False, [{1,2},{2,3},{1,2}]),
+    ([]                               , False, []               ),
+])
+def test_find_minimal_sets(family, allow_emptyset, expected):
+    assert find_minimal_sets(family, allow_emptyset) == expected
+
+
+@pytest.mark.parametrize("family, expected", [
+    ([{1,2},{1},{2,3},{1,2,3},{3}]    , [{1,2,3}]               ),
+    ([set(),{1},{2},{1,3}]            , [{2},{1,3}]             ),
+    ([set()]                          , [set()]                 ),
+    ([{1,2},{2,3},{1,2},{2}]          , [{1,2},{2,3},{1,2}]     ),
+])
+def test_find_maximal_sets(family, expected):
+    assert find_maximal_sets(family) == expected
+
+
+@pytest.mark.parametrize("masks, expected_minimal, expected_maximal", [
+    ([0b011, 0b001, 0b110, 0b111, 0b100], [0b001, 0b100], [0b111]),
+    ([0b000, 0b001, 0b010]              , [0b000]       , [0b001, 0b010]),
+])
+def test_minimal_and_maximal_masks(masks, expected_minimal, expected_maximal):
+    assert minimal_masks(masks) == expected_minimal
+    assert sorted(maximal_masks(masks)) == expected_maximal
+
+
+def test_subset_trie():
+    trie = SubsetTrie([0b0101, 0b0110])
+    assert trie.has_subset_of(0b0111) and trie.has_subset_of(0b1101)
+    assert not trie.has_subset_of(0b0011) and not trie.has_subset_of(0b1100)
+    trie.add(0)
+    assert trie.has_subset_of(0b0000)
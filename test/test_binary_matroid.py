@@ -0,0 +1,69 @@
+import pytest
+
+from matroids.BinaryMatroid import BinaryMatroid
+from matroids.known_as.FanoMatroid import FanoMatroid
+from matroids.core.set_operator import powset
+
+# The columns a, b, c, b + c, a + c, a + b, a + b + c, labelled as FanoMatroid.
+FANO = [
+    [1,0,0,0,1,1,1],
+    [0,1,0,1,0,1,1],
+    [0,0,1,1,1,0,1],
+]
+F7 = FanoMatroid()
+B = BinaryMatroid(FANO)
+
+
+def as_family(family):
+    return sorted(map(sorted, family))
+
+
+def test_rank_and_closure():
+    assert B.ground_set == F7.ground_set
+    for X in powset(B.ground_set):
+        assert B.rank(X) == F7.rank(X)
+        assert B.closure(X) == F7.closure(X)
+        assert B.is_independent(X) == (F7.rank(X) == len(X))
+
+
+def test_families():
+    assert as_family(B.bases) == as_family(F7.bases)
+    assert as_family(B.circuits) == as_family(F7.circuits)
+    assert B.count_bases() == len(F7.bases)
+
+
+def test_ranks():
+    subsets = powset(B.ground_set)
+    assert B.ranks(subsets) == [ B.rank(X) for X in subsets ]
+    assert B.ranks([]) == []
+
+
+def test_is_binary_follows_encoder():
+    # The labels are given in the reverse order, and the certificate is reordered as the encoder, i.e. 1, 2, ..., 7.
+    M = BinaryMatroid(FANO, [7, 6, 5, 4, 3, 2, 1])
+    is_binary, matrix = M.is_binary(certificate=True)
+    assert is_binary
+    assert matrix == [ row[::-1] for row in FANO ]
+    assert M.is_binary()
+
+
+def test_labels():
+    M = BinaryMatroid([[1, 1, 0]], ['x', 'y', 'z'])
+    assert M.labels == ['x', 'y', 'z']
+    assert M.loops == {'z'}
+    assert as_family(M.circuits) == [['x', 'y'], ['z']]
+    # A matrix without rows has the columns of the labels, all of which are loops.
+    L = BinaryMatroid([], ['a', 'b'])
+    assert L.ground_set == {'a', 'b'}
+    assert L.rank() == 0
+
+
+@pytest.mark.parametrize('args', [
+    ([[1, 2], [0, 1]],),
+    ([[1, 0, 1], [0, 1]],),
+    ([[1, 0], [0, 1]], ['a', 'a']),
+    ([[1, 0], [0, 1]], ['a', 'b', 'c']),
+])
+def test_raises_value_error(args):
+    with pytest.raises(ValueError):
+        BinaryMatroid(*args)
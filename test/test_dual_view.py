@@ -0,0 +1,40 @@
+import pytest
+
+from matroids.Matroid import Matroid
+from matroids.DualView import DualView
+from matroids.core.set_operator import powset
+
+from . import K4, M, U24
+
+
+def as_family(family):
+    return sorted(map(sorted, family))
+
+
+@pytest.mark.parametrize('matroid', [K4, M, U24])
+def test_dual_of_dual_is_primal(matroid):
+    assert isinstance(matroid.dual, DualView)
+    assert matroid.dual is matroid.dual
+    assert matroid.dual.dual is matroid
+
+
+@pytest.mark.parametrize('matroid', [K4, M, U24])
+def test_dual_rank(matroid):
+    E, dual = matroid.ground_set, matroid.dual
+    for X in powset(E):
+        # r*(X) = |X| - r(M) + r(E - X)
+        assert dual.rank(X) == len(X) - matroid.rank() + matroid.rank(E - X)
+        assert dual.nulity(X) == len(X) - dual.rank(X)
+
+
+@pytest.mark.parametrize('matroid', [K4, M, U24])
+def test_dual_families(matroid):
+    E, dual = matroid.ground_set, matroid.dual
+    assert as_family(dual.bases) == as_family(E - B for B in matroid.bases)
+    assert as_family(dual.circuits) == as_family(E - H for H in matroid.hyperplanes)
+    assert as_family(dual.hyperplanes) == as_family(E - C for C in matroid.circuits)
+    # The complemented families agree with the dual materialized from its bases.
+    materialized = Matroid(( E, [ E - B for B in matroid.bases ] ))
+    assert as_family(dual.circuits) == as_family(materialized.circuits)
+    assert as_family(dual.hyperplanes) == as_family(materialized.hyperplanes)
+    assert as_family(dual.independent_sets) == as_family(materialized.independent_sets)
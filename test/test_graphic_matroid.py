@@ -0,0 +1,65 @@
+import pytest
+
+from matroids.GraphicMatroid import GraphicMatroid
+from matroids.LinearMatroid import LinearMatroid
+from matroids.Matroid import Matroid
+from matroids.core.set_operator import powset
+
+from . import K4
+
+# K4 on the vertices 0, 1, 2, 3 labelled as the fixture K4, with a loop 7 at 0 and an edge 8 parallel to 1.
+EDGES = [(0, 1), (1, 2), (0, 2), (1, 3), (0, 3), (2, 3), (0, 0), (1, 0)]
+G = GraphicMatroid(EDGES)
+# The same matroid given by its bases: 7 is in no basis, and 8 can replace 1.
+EXPLICIT = Matroid(( {*range(1, 9)}, K4.bases + [ B - {1} | {8} for B in K4.bases if 1 in B ] ))
+
+
+def as_family(family):
+    return sorted(map(sorted, family))
+
+
+def test_labels():
+    assert G.ground_set == {*range(1, 9)}
+    assert G.edges == { i + 1: ends for i, ends in enumerate(EDGES) }
+    H = GraphicMatroid({ 'a': (0, 1), 'b': (1, 2), 'c': (2, 0) })
+    assert H.ground_set == {'a', 'b', 'c'}
+    assert H.vertices == {0, 1, 2}
+    assert as_family(H.circuits) == [['a', 'b', 'c']]
+
+
+def test_edges_must_be_pairs():
+    with pytest.raises(ValueError):
+        GraphicMatroid([(0, 1), (0, 1, 2)])
+
+
+def test_rank_and_closure():
+    for X in powset(G.ground_set):
+        assert G.rank(X) == EXPLICIT.rank(X)
+        assert G.closure(X) == EXPLICIT.closure(X)
+
+
+def test_families():
+    assert as_family(G.bases) == as_family(EXPLICIT.bases)
+    assert as_family(G.circuits) == as_family(EXPLICIT.circuits)
+    assert G.count_bases() == len(EXPLICIT.bases)
+    assert G.count_circuits() == len(EXPLICIT.circuits)
+
+
+@pytest.mark.parametrize('X', [{1}, {7}, {8}, {1,6}, {2,4,7}])
+def test_delete_and_contract(X):
+    assert as_family(G.delete(X).bases) == as_family(EXPLICIT.delete(X).bases)
+    assert as_family(G.contract(X).bases) == as_family(EXPLICIT.contract(X).bases)
+    assert as_family(G.restrict_to(X).bases) == as_family(EXPLICIT.restrict_to(X).bases)
+    assert isinstance(G.contract(X), GraphicMatroid)
+
+
+def test_delete_out_of_ground_set():
+    with pytest.raises(ValueError):
+        G.delete({9})
+
+
+@pytest.mark.parametrize('q', [2, 3, 4])
+def test_representation_over(q):
+    assert G.is_representable_over(q)
+    matrix = G.representation_over(q)
+    assert as_family(LinearMatroid(matrix, q, G.encoder.elements).bases) == as_family(EXPLICIT.bases)
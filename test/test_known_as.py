@@ -0,0 +1,54 @@
+import pytest
+
+from matroids.BinaryMatroid import BinaryMatroid
+from matroids.LinearMatroid import LinearMatroid
+from matroids.known_as.ExtendedBinaryGolayCode import ExtendedBinaryGolayCode
+from matroids.known_as.ExtendedTernaryGolayCode import ExtendedTernaryGolayCode
+from matroids.known_as.FanoMatroid import FanoMatroid
+from matroids.known_as.PappusMatroid import PappusMatroid
+from matroids.known_as.TerrahawkMatroid import TerrahawkMatroid
+from matroids.known_as.TernaryDowling3 import TernaryDowling3
+
+
+def as_family(family):
+    return sorted(map(sorted, family))
+
+
+@pytest.mark.parametrize('matroid', [PappusMatroid(), TernaryDowling3(), ExtendedTernaryGolayCode(), FanoMatroid(), TerrahawkMatroid()])
+def test_representation_agrees_with_families(matroid):
+    # The bases streamed by the independence oracle of the representation are the listed bases.
+    assert as_family(matroid.iter_bases()) == as_family(matroid.bases)
+    assert matroid.count_bases() == len(matroid.bases)
+    for B in matroid.bases:
+        assert matroid.rank(B) == len(B) == matroid.rank()
+        assert matroid.closure(B) == matroid.ground_set
+
+
+@pytest.mark.parametrize('matroid, is_ternary', [(PappusMatroid(), False), (TernaryDowling3(), True), (ExtendedTernaryGolayCode(), True), (TerrahawkMatroid(), True)])
+def test_is_ternary(matroid, is_ternary):
+    answer, matrix = matroid.is_ternary(True)
+    assert answer == is_ternary
+    if is_ternary:
+        # The columns of the certificate follow matroid.encoder.elements.
+        assert as_family(LinearMatroid(matrix, 3, matroid.encoder.elements).bases) == as_family(matroid.bases)
+
+
+@pytest.mark.parametrize('matroid', [FanoMatroid(), TerrahawkMatroid()])
+def test_is_binary(matroid):
+    answer, matrix = matroid.is_binary(True)
+    assert answer
+    # The columns of the certificate follow matroid.encoder.elements.
+    assert as_family(BinaryMatroid(matrix, matroid.encoder.elements).bases) == as_family(matroid.bases)
+
+
+def test_extended_binary_golay_code():
+    # The bases are too many to be listed, and so the representation is checked by the circuits and the cocircuits.
+    G24 = ExtendedBinaryGolayCode()
+    E, r = G24.ground_set, G24.rank()
+    assert r == 12
+    for C in G24.circuits:
+        assert G24.rank(C) == len(C) - 1
+        assert all(G24.is_independent(C - {e}) for e in C)
+    for D in G24.cocircuits:
+        assert G24.closure(E - D) == E - D
+        assert G24.rank(E - D) == r - 1
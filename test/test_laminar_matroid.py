@@ -0,0 +1,91 @@
+import pytest
+
+from matroids.LaminarMatroid import LaminarMatroid
+from matroids.Matroid import Matroid
+from matroids.PartitionMatroid import PartitionMatroid
+from matroids.core.set_operator import powset
+from matroids.core.types import MatroidAxiom
+
+
+def explicit(family: list[set], capacities: list[int], E: set) -> Matroid:
+    # The matroid whose independent sets are the subsets X with |X ∩ A_i| ≦ c_i for all i.
+    Is = [ X for X in powset(E) if all(len(X & A) <= c for A, c in zip(family, capacities)) ]
+    return Matroid((E, Is), axiom=MatroidAxiom.INDEPENDENT_SETS)
+
+
+def as_family(family):
+    return sorted(map(sorted, family))
+
+
+def assert_same_matroid(matroid: Matroid, expected: Matroid):
+    assert matroid.ground_set == expected.ground_set
+    for X in powset(matroid.ground_set):
+        assert matroid.rank(X) == expected.rank(X)
+        assert matroid.closure(X) == expected.closure(X)
+    assert as_family(matroid.bases) == as_family(expected.bases)
+    assert matroid.count_bases() == len(expected.bases)
+
+
+@pytest.mark.parametrize('family, capacities, E', [
+    ([{1,2,3,4,5}, {1,2}, {3,4}]     , [3, 1, 1]   , {1,2,3,4,5}),
+    ([{1,2,3,4,5}, {1,2}, {3,4}]     , [2, 1, 2]   , {1,2,3,4,5,6}),
+    ([{1,2,3}, {1,2,3}, {1}]         , [2, 1, 0]   , {1,2,3,4}),
+    ([{1,2}, {3,4,5}, {1,2,3,4,5,6}] , [1, 2, 2]   , {1,2,3,4,5,6}),
+    ([]                              , []          , {1,2}),
+])
+def test_laminar_matroid(family, capacities, E):
+    assert_same_matroid(LaminarMatroid(family, capacities, E), explicit(family, capacities, E))
+
+
+@pytest.mark.parametrize('blocks, capacities, E', [
+    ([{1,2,3}, {4,5}]   , [1, 1]   , {1,2,3,4,5}),
+    ([{1,2,3}, {4,5}]   , [2, 0]   , {1,2,3,4,5,6}),
+    ([{1,2}, {3}, {4,5}], [3, 1, 1], {1,2,3,4,5}),
+])
+def test_partition_matroid(blocks, capacities, E):
+    assert_same_matroid(PartitionMatroid(blocks, capacities, E), explicit(blocks, capacities, E))
+
+
+@pytest.mark.parametrize('args', [
+    ([{1,2}, {2,3}], [1, 1]),
+    ([{1,2}], [1], {1,3}),
+])
+def test_partition_matroid_raises_value_error(args):
+    with pytest.raises(ValueError):
+        PartitionMatroid(*args)
+
+
+@pytest.mark.parametrize('M1, M2, expected_type', [
+    (PartitionMatroid([{1,2,3}], [1], {1,2,3,4}), PartitionMatroid([{5,6}], [1])              , PartitionMatroid),
+    (PartitionMatroid([{1,2,3}], [1], {1,2,3,4}), LaminarMatroid([{5,6,7}, {5,6}], [2, 1])    , LaminarMatroid),
+    (LaminarMatroid([{5,6,7}, {5,6}], [2, 1])   , PartitionMatroid([{1,2,3}], [1], {1,2,3,4}) , LaminarMatroid),
+    (LaminarMatroid([{1,2,3}, {1,2}], [2, 1])   , LaminarMatroid([{4,5}], [1], {4,5,6})       , LaminarMatroid),
+    (LaminarMatroid([{1,2,3}, {1,2}], [2, 1])   , Matroid(({4,5}, [{4}, {5}]))                , Matroid),
+])
+def test_direct_sum(M1, M2, expected_type):
+    direct_sum = M1.direct_sum(M2)
+    assert type(direct_sum) is expected_type
+    assert_same_matroid(direct_sum, Matroid.direct_sum(Matroid((M1.ground_set, M1.bases)), M2))
+
+
+def test_direct_sum_raises_value_error():
+    with pytest.raises(ValueError):
+        PartitionMatroid([{1,2}], [1]).direct_sum(LaminarMatroid([{2,3}], [1]))
+
+
+@pytest.mark.parametrize('M1, M2, expected_type', [
+    # On the same blocks, the capacities are added.
+    (PartitionMatroid([{1,2,3}, {4,5}], [1, 1], {1,2,3,4,5,6}), PartitionMatroid([{4,5}, {1,2,3}], [0, 1], {1,2,3,4,5,6}), PartitionMatroid),
+    # The blocks differ, and so the union falls back to Matroid.union.
+    (PartitionMatroid([{1,2,3}, {4,5}], [1, 1])               , PartitionMatroid([{1,2}, {3,4,5}], [1, 1])               , Matroid),
+    # The ground sets differ.
+    (PartitionMatroid([{1,2,3}], [1])                         , PartitionMatroid([{1,2,3}], [1], {1,2,3,4})              , Matroid),
+    (PartitionMatroid([{1,2,3}], [1])                         , LaminarMatroid([{1,2,3}, {1,2}], [2, 1])                 , Matroid),
+])
+def test_union(M1, M2, expected_type):
+    union = M1.union(M2)
+    assert type(union) is expected_type
+    expected = Matroid.union(Matroid((M1.ground_set, M1.bases)), M2)
+    assert union.ground_set == expected.ground_set
+    for X in powset(union.ground_set):
+        assert union.rank(X) == expected.rank(X)
@@ -0,0 +1,86 @@
+import pytest
+from fractions import Fraction
+
+from matroids.LinearMatroid import LinearMatroid
+from matroids.core.finite_field import FiniteField
+from matroids.core.set_operator import powset
+
+
+def rank_by_elimination(q, vectors: list[list]) -> int:
+    # The Gaussian elimination in GF(q) by its tables, or in the rationals by fractions if q is None.
+    if q is None:
+        sub, mul, inv = (lambda a, b: a - b), (lambda a, b: a * b), (lambda a: 1 / Fraction(a))
+    else:
+        F = FiniteField(q)
+        sub, mul, inv = F.sub, F.mul, F.inv
+    rows, rank = [ [*v] for v in vectors ], 0
+    for j in range(len(rows[0]) if rows else 0):
+        pivot = next((i for i in range(rank, len(rows)) if rows[i][j]), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        for i in range(len(rows)):
+            if i != rank and rows[i][j]:
+                c = mul(rows[i][j], inv(rows[rank][j]))
+                rows[i] = [ sub(x, mul(c, y)) for x, y in zip(rows[i], rows[rank]) ]
+        rank += 1
+    return rank
+
+
+@pytest.mark.parametrize('matrix, q', [
+    ([[1, 0, 0, 1, 1, 0, 2],
+      [0, 1, 0, 1, 2, 0, 2],
+      [0, 0, 1, 1, 0, 0, 0]], 3),
+    ([[1, 0, 0, 1, 1, 0, 2],
+      [0, 1, 0, 2, 3, 0, 1],
+      [0, 0, 1, 3, 0, 0, 0]], 4),
+    ([[1, 0, 0, 1, Fraction(1, 2), 0, 2],
+      [0, 1, 0, 1, 0, 0, 2],
+      [0, 0, 1, 1, "-1/3", 0, 0]], None),
+])
+def test_rank_and_closure(matrix, q):
+    labels = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
+    M = LinearMatroid(matrix, q, labels)
+    matrix = M.matrix
+    rank = lambda X: rank_by_elimination(q, [ [ row[labels.index(e)] for row in matrix ] for e in X ])
+    for X in powset(M.ground_set):
+        assert M.rank(X) == rank(X)
+        assert M.closure(X) == { e for e in M.ground_set if rank(X | {e}) == rank(X) }
+    assert M.loops == {'f'}
+
+
+def test_labels():
+    M = LinearMatroid([[1, 0, 1], [0, 1, 1]], 2)
+    assert M.labels == [1, 2, 3]
+    assert M.ground_set == {1, 2, 3}
+    N = LinearMatroid([[1, 0, 1], [0, 1, 1]], 2, ['z', 'x', 'y'])
+    assert N.labels == ['z', 'x', 'y']
+    assert N.rank({'z', 'x'}) == 2
+    assert N.closure({'z', 'x'}) == {'x', 'y', 'z'}
+    # A matrix without rows has the columns of the labels, all of which are loops.
+    L = LinearMatroid([], 3, ['a', 'b'])
+    assert L.ground_set == {'a', 'b'}
+    assert L.loops == {'a', 'b'}
+    assert L.rank() == 0
+
+
+@pytest.mark.parametrize('args', [
+    ([[1, 0, 1], [0, 1]], 2),
+    ([[1, 0], [0, 1]], 2, ['a', 'a']),
+    ([[1, 0], [0, 1]], 2, ['a']),
+    ([[1, 0], [0, 1]], 6),
+    ([[1, 4], [0, 1]], 4),
+])
+def test_raises_value_error(args):
+    with pytest.raises(ValueError):
+        LinearMatroid(*args)
+
+
+def test_is_binary_over_gf2():
+    M = LinearMatroid([[1, 0, 1], [0, 1, 1]], 2, ['z', 'x', 'y'])
+    is_binary, matrix = M.is_binary(certificate=True)
+    assert is_binary
+    # The columns are reordered as the encoder, i.e. x, y, z.
+    assert [*M.encoder.elements] == ['x', 'y', 'z']
+    assert matrix == [[0, 1, 1], [1, 1, 0]]
+    assert M.is_binary()
@@ -0,0 +1,45 @@
+import pytest
+from itertools import combinations
+
+from matroids.Matroid import Matroid
+from matroids.known_as.UniformMatroid import UniformMatroid
+
+from . import K4, M, U24
+
+
+@pytest.mark.parametrize('matroid', [
+    M, K4, U24, UniformMatroid(0,3), UniformMatroid(2,4), UniformMatroid(3,3), UniformMatroid(2,5),
+])
+def test_count_families(matroid):
+    assert matroid.count_bases() == len(matroid.bases)
+    assert matroid.count_circuits() == len(matroid.circuits)
+    assert matroid.count_flats() == len(matroid.flats)
+
+
+@pytest.mark.parametrize('matroid', [
+    M, K4, U24, UniformMatroid(0,3), UniformMatroid(2,4), UniformMatroid(3,3), UniformMatroid(2,5),
+])
+def test_count_flats_of_rank(matroid):
+    r = matroid.rank_function
+    for rank in range(-1, matroid.rank() + 2):
+        assert matroid.count_flats(rank) == len([F for F in matroid.flats if r(F) == rank])
+
+
+@pytest.mark.parametrize('matroid', [
+    M, K4, U24, UniformMatroid(0,3), UniformMatroid(2,4), UniformMatroid(3,3), UniformMatroid(2,5),
+])
+def test_f_vector(matroid):
+    f = matroid.f_vector()
+    assert len(f) == matroid.rank() + 1
+    assert f == [len([I for I in matroid.independent_sets if len(I) == i]) for i in range(len(f))]
+
+
+@pytest.mark.parametrize('k, n', [(0,3), (1,1), (2,4), (3,3), (2,5)])
+def test_uniform_matroid_closed_forms(k, n):
+    U = UniformMatroid(k, n)
+    U_ = Matroid(( U.ground_set, [ {*B} for B in combinations(U.ground_set, k) ] ))
+    assert U.count_bases() == U_.count_bases()
+    assert U.count_circuits() == U_.count_circuits()
+    assert U.count_flats() == U_.count_flats()
+    assert all(U.count_flats(rank) == U_.count_flats(rank) for rank in range(-1, k + 2))
+    assert U.f_vector() == U_.f_vector()
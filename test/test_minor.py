@@ -0,0 +1,69 @@
+import pytest
+from itertools import combinations
+
+from matroids.Matroid import Matroid
+from matroids.Minor import Minor
+from matroids.core.set_operator import powset
+
+from . import K4, M
+
+
+def materialize(matroid: Matroid, C: set, D: set) -> Matroid:
+    # The bases of M / C \ D are the maximal subsets X of E - C - D with r_M(X ∪ C) = |X| + r_M(C).
+    E = matroid.ground_set - C - D
+    r = matroid.rank_function
+    size = r(E | C) - r(C)
+    return Matroid(( E, [ {*X} for X in combinations(E, size) if r({*X} | C) == size + r(C) ] ))
+
+
+def test_minor_of_minor_is_collapsed():
+    minor = (K4 / 1 / 2) - 3
+    assert isinstance(minor, Minor)
+    assert minor.parent is K4
+    assert minor.contracted == {1,2}
+    assert minor.deleted == {3}
+    assert minor.ground_set == {4,5,6}
+
+
+@pytest.mark.parametrize('matroid, C, D', [
+    (K4, {1}   , {1}  ),
+    (K4, {1,2} , {2,3}),
+    (K4, {7}   , set()),
+    (K4, set() , {0}  ),
+])
+def test_minor_raises_value_error(matroid, C, D):
+    with pytest.raises(ValueError):
+        Minor(matroid, C, D)
+
+
+def test_minor_of_minor_raises_value_error_on_removed_elements():
+    with pytest.raises(ValueError):
+        (K4 / 1).delete({1})
+
+
+@pytest.mark.parametrize('matroid, C, D', [
+    (K4, set()  , set()  ),
+    (K4, {1}    , set()  ),
+    (K4, set()  , {1}    ),
+    (K4, {1,2}  , {6}    ),
+    (K4, {1,2,3}, set()  ),
+    (M , {2}    , {4}    ),
+    (M , {4}    , {1}    ),
+    (M , {1,2}  , set()  ),
+])
+def test_minor_agrees_with_materialized_minor(matroid, C, D):
+    minor, expected = Minor(matroid, C, D), materialize(matroid, C, D)
+    assert minor.ground_set == expected.ground_set
+    for X in powset(minor.ground_set):
+        assert minor.rank(X) == expected.rank(X)
+        assert minor.closure(X) == expected.closure(X)
+    assert sorted(map(sorted, minor.bases)) == sorted(map(sorted, expected.bases))
+    assert sorted(map(sorted, minor.circuits)) == sorted(map(sorted, expected.circuits))
+
+
+def test_restriction_and_deletion_are_minors():
+    assert K4.restrict_to({1,2,3}).deleted == {4,5,6}
+    assert K4.delete(1).deleted == {1}
+    assert K4.contract({1,2}).contracted == {1,2}
+    with pytest.raises(ValueError):
+        K4.restrict_to({1,7})
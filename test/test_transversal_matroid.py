@@ -0,0 +1,53 @@
+import pytest
+from itertools import permutations
+
+from matroids.Matroid import Matroid
+from matroids.TransversalMatroid import TransversalMatroid
+from matroids.core.set_operator import powset
+from matroids.core.types import MatroidAxiom
+
+# The set system of test/core/test_matching.py: the sets {a, b}, {b, c, e}, {a}, with the loop d.
+FAMILY = [{"a", "b"}, {"b", "c", "e"}, {"a"}]
+E = {"a", "b", "c", "d", "e"}
+T = TransversalMatroid(FAMILY, E)
+
+
+def is_partial_transversal(X: set) -> bool:
+    # X is a partial transversal if its elements can be assigned to distinct sets containing them.
+    return any(
+        all(x in FAMILY[i] for x, i in zip(sorted(X), indices))
+        for indices in permutations(range(len(FAMILY)), len(X))
+    )
+
+
+# The same matroid given by its partial transversals.
+EXPLICIT = Matroid((E, [ X for X in powset(E) if is_partial_transversal(X) ]), axiom=MatroidAxiom.INDEPENDENT_SETS)
+
+
+def as_family(family):
+    return sorted(map(sorted, family))
+
+
+def test_ground_set_and_family():
+    assert T.ground_set == E
+    assert T.family == FAMILY
+    assert TransversalMatroid(FAMILY).ground_set == E - {"d"}
+    assert T.loops == {"d"}
+
+
+def test_rank_and_closure():
+    for X in powset(E):
+        assert T.rank(X) == EXPLICIT.rank(X)
+        assert T.closure(X) == EXPLICIT.closure(X)
+        assert T.is_independent(X) == is_partial_transversal(X)
+
+
+def test_families():
+    assert as_family(T.bases) == as_family(EXPLICIT.bases)
+    assert as_family(T.circuits) == as_family(EXPLICIT.circuits)
+    assert T.count_bases() == len(EXPLICIT.bases)
+
+
+def test_family_out_of_ground_set_raises_value_error():
+    with pytest.raises(ValueError):
+        TransversalMatroid(FAMILY, {"a", "b", "c"})